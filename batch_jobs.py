@@ -0,0 +1,258 @@
+# Standard library imports
+import os
+import json
+import logging
+import argparse
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field, fields, replace
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Third-party imports
+import pandas as pd
+
+# Local imports
+import main as bt
+import sweep as sw
+import data_source as ds
+import results_sink as rs
+
+# === Constants ===
+# Batch Job Configuration
+BATCH_CONFIG = {
+    'RESULTS_FORMAT': 'jsonl',  # 'jsonl' 또는 'parquet'
+    'FLUSH_JOBS': 1,  # 이 수만큼 작업이 끝날 때마다 결과 파일에 기록
+    'WRITE_TRADES': True  # 작업별 거래 내역도 기록
+}
+
+JOB_FILE_FORMATS = ['.json', '.jsonl', '.yaml', '.yml']
+
+DatasetKey = Tuple[str, str]  # (종목, 주기)
+
+
+@dataclass
+class BatchJob:
+    """배치 작업 하나 (종목, 주기, 구간, 설정)"""
+    name: str
+    ticker: str
+    interval: str
+    start: pd.Timestamp
+    end: pd.Timestamp
+    config: bt.TradingConfig = field(default_factory=bt.TradingConfig)
+
+    @property
+    def dataset_key(self) -> DatasetKey:
+        return self.ticker, self.interval
+
+
+def parse_config(overrides: Optional[Dict], base: Optional[bt.TradingConfig] = None) -> bt.TradingConfig:
+    """TradingConfig 필드 이름/값 딕셔너리로 설정 생성 (Decimal 필드는 문자열로 변환해 정밀도 유지)"""
+    base = base or bt.TradingConfig()
+    if not overrides:
+        return base
+    types = {config_field.name: config_field.type for config_field in fields(bt.TradingConfig)}
+    unknown = sorted(set(overrides) - set(types))
+    if unknown:
+        raise ValueError(f"알 수 없는 설정 항목입니다: {', '.join(unknown)}")
+    values = {name: Decimal(str(value)) if types[name] is Decimal else value
+              for name, value in overrides.items()}
+    return replace(base, **values)
+
+
+def parse_job(spec: Dict, defaults: Optional[Dict] = None, number: int = 0) -> BatchJob:
+    """작업 정의 딕셔너리로 BatchJob 생성
+
+    예: {"ticker": "KRW-ETH", "interval": "60", "start": "2023-01-01", "end": "2023-12-31",
+         "config": {"RSI_OVERSOLD": 25, "SMA_WINDOW": 20}}
+    defaults 의 값은 작업에 없는 항목에 사용하며, config 는 항목별로 합친다.
+    """
+    defaults = defaults or {}
+    merged = {**defaults, **spec, 'config': {**defaults.get('config', {}), **spec.get('config', {})}}
+    missing = [name for name in ('ticker', 'interval', 'start', 'end') if name not in merged]
+    if missing:
+        raise ValueError(f"{number}번째 작업에 필수 항목이 없습니다: {', '.join(missing)}")
+
+    interval = str(merged['interval'])
+    start = pd.Timestamp(merged['start'])
+    end = pd.Timestamp(merged['end'])
+    if end < start:
+        raise ValueError(f"{number}번째 작업의 종료 시각이 시작 시각보다 앞섭니다: {start} ~ {end}")
+    name = merged.get('name') or f"{merged['ticker']}_{interval}_{start:%Y%m%d}_{end:%Y%m%d}_{number}"
+    return BatchJob(name, merged['ticker'], interval, start, end, parse_config(merged['config']))
+
+
+def _read_job_file(path: str):
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in JOB_FILE_FORMATS:
+        raise ValueError(f"알 수 없는 작업 파일 형식입니다: {path} ({', '.join(JOB_FILE_FORMATS)})")
+    with open(path, encoding='utf-8') as f:
+        if extension == '.jsonl':
+            return [json.loads(line) for line in f if line.strip()]
+        if extension == '.json':
+            return json.load(f)
+        import yaml  # YAML 작업 파일을 쓸 때만 필요 (PyYAML)
+        return yaml.safe_load(f)
+
+
+def load_jobs(path: str) -> List[BatchJob]:
+    """작업 파일 읽기 (.json/.yaml: 작업 목록 또는 {"defaults": {...}, "jobs": [...]}, .jsonl: 한 줄에 작업 하나)"""
+    content = _read_job_file(path)
+    defaults = {}
+    if isinstance(content, dict):
+        defaults = content.get('defaults') or {}
+        content = content.get('jobs') or []
+    return [parse_job(spec, defaults, number) for number, spec in enumerate(content, 1)]
+
+
+def group_jobs(jobs: List[BatchJob]) -> 'OrderedDict[DatasetKey, List[BatchJob]]':
+    """같은 데이터셋(종목, 주기)을 쓰는 작업끼리 묶기 (처음 나온 순서 유지)"""
+    groups: 'OrderedDict[DatasetKey, List[BatchJob]]' = OrderedDict()
+    for job in jobs:
+        groups.setdefault(job.dataset_key, []).append(job)
+    return groups
+
+
+def load_group_dataset(source: ds.DataSource, jobs: List[BatchJob]) -> sw.SweepDataset:
+    """이어진 작업 구간들을 덮는 데이터를 한 번만 조회 (첫 작업 앞 WARMUP_BARS 개 봉 포함)"""
+    ticker, interval = jobs[0].dataset_key
+    start = min(job.start for job in jobs)
+    end = max(job.end for job in jobs)
+    warmup_start = start - ds.interval_to_timedelta(interval) * bt.WARMUP_BARS
+    return sw.SweepDataset.load(source, ticker, interval, warmup_start, end)
+
+
+def run_job(dataset: sw.SweepDataset, job: BatchJob) -> Tuple[Dict, pd.DataFrame]:
+    """데이터셋에서 작업 구간만 잘라 실행 후 (결과 행, 거래 내역) 반환"""
+    row = {'job': job.name, 'ticker': job.ticker, 'interval': job.interval,
+           'period_start': job.start, 'period_end': job.end, **asdict(job.config)}
+    try:
+        back_tester = dataset.back_tester(job.config)
+        frame = ds.slice_range(dataset.frame(job.config.SMA_WINDOW), job.start, job.end)
+        result = back_tester.run_prepared(frame, job.ticker, job.interval, job.start, job.end)
+    except Exception as e:
+        logging.error(f"오류 발생: {job.name} - {str(e)}")
+        row['error'] = str(e)
+        return row, pd.DataFrame()
+
+    row.update({
+        'trading_profit': result.trading_profit,
+        'coin_change_rate': result.coin_change_rate,
+        'trade_count': back_tester.state.trade_count,
+        'total_fee': back_tester.ledger.to_float(back_tester.state.total_fee),
+        **(result.metrics.to_dict() if result.equity is not None else {}),
+        'error': result.error
+    })
+    return row, back_tester.result.trades_frame()
+
+
+def run_group(source: ds.DataSource, jobs: List[BatchJob]) -> Iterator[Tuple[Dict, pd.DataFrame]]:
+    """한 데이터셋을 쓰는 작업을 한 프로세스에서 차례로 실행 (작업이 끝날 때마다 결과를 내보냄)
+
+    떨어진 구간의 작업은 사이의 봉까지 조회하지 않도록 이어진 구간(bt.group_contiguous_periods)별로 조회한다.
+    """
+    ticker, interval = jobs[0].dataset_key
+    for span in bt.group_contiguous_periods(jobs, interval):
+        span_jobs = [jobs[number] for number in span]
+        try:
+            dataset = load_group_dataset(source, span_jobs)
+        except Exception as e:
+            logging.error(f"데이터를 불러오지 못했습니다: {ticker} {interval}분 - {str(e)}")
+            for job in span_jobs:
+                yield {'job': job.name, 'ticker': job.ticker, 'interval': job.interval,
+                       'period_start': job.start, 'period_end': job.end, 'error': str(e)}, pd.DataFrame()
+            continue
+        for job in span_jobs:
+            yield run_job(dataset, job)
+
+
+def _run_group_job(source: ds.DataSource, jobs: List[BatchJob]) -> List[Tuple[Dict, pd.DataFrame]]:
+    return list(run_group(source, jobs))
+
+
+class _BatchWriter:
+    """결과 행과 거래 내역을 결과 저장소에 FLUSH_JOBS 작업마다 기록"""
+
+    def __init__(self, sink, flush_jobs: int, write_trades: bool):
+        self.sink = sink
+        self.flush_jobs = max(1, flush_jobs)
+        self.write_trades = write_trades
+        self.rows: List[Dict] = []
+
+    def write(self, row: Dict, trades: pd.DataFrame) -> None:
+        self.rows.append(row)
+        self.sink.write_period(**row)
+        if self.write_trades:
+            self.sink.write_trades(trades, job=row['job'], ticker=row['ticker'], interval=row['interval'])
+        if len(self.rows) % self.flush_jobs == 0:
+            self.sink.flush()
+
+        status = f"오류: {row['error']}" if row.get('error') else (
+            f"수익률 {row['trading_profit']:+.2f}%, 코인 변동률 {row['coin_change_rate']:+.2f}%")
+        logging.info(f"[{len(self.rows)}] {row['job']} - {status}")
+
+
+def run_batch(jobs: List[BatchJob], data_source: Optional[ds.DataSource] = None,
+              output: Optional[str] = None, results_format: str = BATCH_CONFIG['RESULTS_FORMAT'],
+              max_workers: Optional[int] = 1, flush_jobs: int = BATCH_CONFIG['FLUSH_JOBS'],
+              write_trades: bool = BATCH_CONFIG['WRITE_TRADES']) -> pd.DataFrame:
+    """작업 목록을 데이터셋(종목, 주기)별로 묶어 실행하고 결과 표 반환
+
+    데이터 조회와 설정과 무관한 지표 계산은 데이터셋의 이어진 구간마다 한 번만 하며,
+    같은 데이터셋의 작업은 한 프로세스에서 이어서 실행한다.
+    output 을 지정하면 작업이 끝나는 대로 '{output}.periods.*' (작업별 결과),
+    '{output}.trades.*' (거래 내역) 파일에 기록한다 (results_sink.load_records 로 다시 읽기).
+    max_workers 가 1 이 아니면 데이터셋 묶음을 프로세스 풀에서 나누어 실행하며 기록은 부모 프로세스에서만 한다.
+    """
+    data_source = data_source or ds.UpbitDataSource()
+    groups = group_jobs(jobs)
+    start_time = datetime.now()
+    sink = rs.create_sink(results_format, output)
+    writer = _BatchWriter(sink, flush_jobs, write_trades)
+    logging.info(f"배치 실행: {len(jobs)}개 작업, {len(groups)}개 데이터셋")
+
+    try:
+        if max_workers == 1 or len(groups) <= 1:
+            for group in groups.values():
+                for row, trades in run_group(data_source, group):
+                    writer.write(row, trades)
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(_run_group_job, data_source, group) for group in groups.values()]
+                for future in as_completed(futures):
+                    for row, trades in future.result():
+                        writer.write(row, trades)
+    finally:
+        sink.close()
+
+    logging.info(f"배치 완료: {len(writer.rows)}개 작업 (소요시간: {datetime.now() - start_time})")
+    return pd.DataFrame(writer.rows)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """작업 파일의 백테스트를 한 번에 실행
+
+    예: python batch_jobs.py jobs.jsonl --output results/overnight --workers 4
+    """
+    parser = argparse.ArgumentParser(description='백테스트 배치 실행')
+    parser.add_argument('jobs', help=f"작업 파일 ({', '.join(JOB_FILE_FORMATS)})")
+    parser.add_argument('--output', default=None, help="결과 파일 경로 앞부분 (예: results/overnight)")
+    parser.add_argument('--format', default=BATCH_CONFIG['RESULTS_FORMAT'], choices=sorted(rs.SINKS))
+    parser.add_argument('--workers', type=int, default=1, help="데이터셋 묶음을 나누어 실행할 프로세스 수")
+    parser.add_argument('--no-trades', action='store_true', help="거래 내역은 기록하지 않음")
+    args = parser.parse_args(argv)
+
+    bt.setup_logging()
+    bt.LOG_CONFIG['PERIOD_SUMMARY'] = False
+    jobs = load_jobs(args.jobs)
+    table = run_batch(jobs, output=args.output, results_format=args.format,
+                      max_workers=args.workers, write_trades=not args.no_trades)
+    failed = int(table['error'].notna().sum()) if 'error' in table else 0
+    if failed:
+        logging.warning(f"실패한 작업: {failed}개")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
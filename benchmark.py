@@ -0,0 +1,272 @@
+# Standard library imports
+import os
+import sys
+import json
+import subprocess
+import logging
+import argparse
+import platform
+import tracemalloc
+from datetime import datetime
+from time import perf_counter
+from typing import Callable, Dict, List, Optional
+
+# Third-party imports
+import pandas as pd
+import numpy as np
+
+# Local imports
+import main as bt
+import tick_db as db
+import data_source as ds
+import indicator_cache as ic
+
+# === Constants ===
+# Benchmark Configuration
+BENCHMARK_CONFIG = {
+    'SIZES': [10_000, 100_000, 1_000_000],  # 봉 수
+    'TICKER': 'KRW-BTC',
+    'INTERVAL': '1',
+    'START': '2020-01-01 00:00:00',
+    'SEED': 0,
+    'REPEAT': 1,  # 시간 측정 반복 횟수 (최솟값 사용)
+    'THRESHOLD': 0.10,  # 기준 대비 bars/sec 가 10% 넘게 떨어지면 회귀
+    'OUTPUT': 'benchmark_results.json'
+}
+
+# 시작 시간 예산 (캐시 사용, 차트 없는 백테스트의 'import main' 기준)
+IMPORT_BUDGET = {
+    'MODULE': 'main',
+    'SECONDS': float(os.environ.get('IMPORT_BUDGET_SECONDS', 1.0)),  # 인터프리터 시작 포함 전체 시간
+    'REPEAT': 5,
+    # 실제로 쓸 때만 불러와야 하는 무거운 선택 의존성 (차트, 실시간 조회, 지표 계산)
+    'LAZY_MODULES': ['plotly', 'talib', 'pyupbit']
+}
+
+STAGES = ['data_preparation', 'indicators', 'elliott_analysis', 'signal_loop', 'summary']
+BYTES_PER_MB = 1024 * 1024
+
+
+def run_pipeline(config: bt.TradingConfig, source: ds.SyntheticDataSource, bars: int,
+                 timer: Callable[[], float] = perf_counter) -> Dict[str, float]:
+    """가상 데이터로 BackTest 전체 단계를 실행하고 단계별 소요시간(초) 반환"""
+    timings: Dict[str, float] = {}
+    back_tester = bt.BackTest(config, source)
+
+    started = timer()
+    data = source.generate(BENCHMARK_CONFIG['TICKER'], BENCHMARK_CONFIG['INTERVAL'],
+                           BENCHMARK_CONFIG['START'], bars)
+    timings['data_preparation'] = timer() - started
+
+    started = timer()
+    # 계산 시간을 재기 위해 지표 캐시는 사용하지 않음
+    db.add_indicators(data, config.SMA_WINDOW, cache=ic.NULL_CACHE)
+    timings['indicators'] = timer() - started
+
+    started = timer()
+    elliott = bt.precompute_elliott_analysis(data, cache=ic.NULL_CACHE)
+    for column in bt.ELLIOTT_SIGNAL_COLUMNS:
+        data[column] = elliott[column]
+    timings['elliott_analysis'] = timer() - started
+
+    started = timer()
+    back_tester._reset_state()
+    back_tester.result.reserve(len(data) + 1)
+    back_tester._process_trading_data(data)
+    timings['signal_loop'] = timer() - started
+
+    started = timer()
+    back_tester._liquidate_position(data)
+    back_tester.display_account_summary(BENCHMARK_CONFIG['TICKER'], BENCHMARK_CONFIG['INTERVAL'],
+                                        data.index[0], data.index[-1])
+    timings['summary'] = timer() - started
+
+    return timings
+
+
+def measure_peak_memory(config: bt.TradingConfig, source: ds.SyntheticDataSource, bars: int) -> float:
+    """tracemalloc 으로 전체 단계의 최대 메모리 사용량(MB) 측정 (시간 측정과 별도 실행)"""
+    tracemalloc.start()
+    try:
+        run_pipeline(config, source, bars)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / BYTES_PER_MB
+
+
+def benchmark_size(config: bt.TradingConfig, bars: int, repeat: int = 1,
+                   seed: int = BENCHMARK_CONFIG['SEED'], measure_memory: bool = True) -> Dict:
+    """봉 수 하나에 대한 벤치마크 결과"""
+    source = ds.SyntheticDataSource(seed=seed)
+    runs = [run_pipeline(config, source, bars) for _ in range(max(1, repeat))]
+    # 반복 실행 중 가장 빠른 값을 사용
+    stages = {stage: min(run[stage] for run in runs) for stage in STAGES}
+    total = sum(stages.values())
+    return {
+        'bars': bars,
+        'stages': stages,
+        'total_seconds': total,
+        'bars_per_second': bars / total if total > 0 else 0.0,
+        'peak_memory_mb': measure_peak_memory(config, source, bars) if measure_memory else None
+    }
+
+
+def run_benchmarks(sizes: List[int], config: Optional[bt.TradingConfig] = None,
+                   repeat: int = BENCHMARK_CONFIG['REPEAT'], measure_memory: bool = True) -> Dict:
+    """여러 봉 수에 대해 벤치마크 실행"""
+    config = config or bt.TradingConfig()
+    results = []
+    for bars in sizes:
+        results.append(benchmark_size(config, bars, repeat, measure_memory=measure_memory))
+    return {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__
+        },
+        'accounting_backend': config.ACCOUNTING_BACKEND,
+        'results': results
+    }
+
+
+_IMPORT_PROBE = """
+import sys, json
+from time import perf_counter
+started = perf_counter()
+import {module}
+print(json.dumps({{'import_seconds': perf_counter() - started,
+                  'loaded': sorted(name for name in {lazy} if name in sys.modules)}}))
+"""
+
+
+def measure_import_time(module: str = IMPORT_BUDGET['MODULE'], repeat: int = IMPORT_BUDGET['REPEAT'],
+                        lazy_modules: List[str] = IMPORT_BUDGET['LAZY_MODULES']) -> Dict:
+    """새 인터프리터에서 module 을 import 하는 시간(초) 측정 (반복 중 최솟값)
+
+    process_seconds 는 인터프리터 시작을 포함한 전체 시간, import_seconds 는 import 문 시간이며,
+    loaded 는 import 만으로 불러와진 LAZY_MODULES 목록이다.
+    """
+    directory = os.path.dirname(os.path.abspath(__file__))
+    probe = _IMPORT_PROBE.format(module=module, lazy=repr(list(lazy_modules)))
+    runs = []
+    for _ in range(max(1, repeat)):
+        started = perf_counter()
+        output = subprocess.run([sys.executable, '-c', probe], cwd=directory, check=True,
+                                capture_output=True, text=True).stdout
+        run = json.loads(output.strip().splitlines()[-1])
+        run['process_seconds'] = perf_counter() - started
+        runs.append(run)
+    return {
+        'module': module,
+        'process_seconds': min(run['process_seconds'] for run in runs),
+        'import_seconds': min(run['import_seconds'] for run in runs),
+        'loaded': sorted(set().union(*(run['loaded'] for run in runs)))
+    }
+
+
+def check_import_budget(result: Dict, budget: float = IMPORT_BUDGET['SECONDS']) -> List[str]:
+    """시작 시간 예산 초과와 미리 불러온 선택 의존성 목록 반환 (문제 없으면 빈 목록)"""
+    problems = []
+    if result['process_seconds'] > budget:
+        problems.append(f"'import {result['module']}' 시작 시간 {result['process_seconds']:.3f}초 > "
+                        f"예산 {budget:.3f}초")
+    for name in result['loaded']:
+        problems.append(f"'import {result['module']}' 만으로 {name} 을(를) 불러왔습니다")
+    return problems
+
+
+def compare_with_baseline(report: Dict, baseline: Dict,
+                          threshold: float = BENCHMARK_CONFIG['THRESHOLD']) -> List[str]:
+    """기준 결과와 비교해 bars/sec 가 threshold 보다 많이 떨어진 항목 목록 반환"""
+    baseline_results = {result['bars']: result for result in baseline.get('results', [])}
+    regressions = []
+    for result in report['results']:
+        reference = baseline_results.get(result['bars'])
+        if reference is None or not reference['bars_per_second']:
+            continue
+
+        ratio = result['bars_per_second'] / reference['bars_per_second']
+        logging.info(f"{result['bars']:>10,}봉: 기준 대비 {ratio:.2f}배")
+        for stage in STAGES:
+            previous = reference['stages'].get(stage)
+            if previous:
+                logging.info(f"    {stage:<18} {previous:.4f}초 -> {result['stages'][stage]:.4f}초")
+
+        if ratio < 1 - threshold:
+            regressions.append(f"{result['bars']:,}봉: {reference['bars_per_second']:,.0f} -> "
+                               f"{result['bars_per_second']:,.0f} bars/sec ({ratio - 1:+.1%})")
+    return regressions
+
+
+def print_report(report: Dict) -> None:
+    """벤치마크 결과 표 출력"""
+    logging.info("\n" + "=" * 100)
+    header = f"{'봉 수':>10} {'bars/sec':>12} {'메모리(MB)':>11} " + \
+             " ".join(f"{stage:>16}" for stage in STAGES)
+    logging.info(header)
+    logging.info("-" * 100)
+    for result in report['results']:
+        memory = result['peak_memory_mb']
+        memory_text = f"{memory:>11.1f}" if memory is not None else f"{'-':>11}"
+        logging.info(f"{result['bars']:>10,} {result['bars_per_second']:>12,.0f} {memory_text} " +
+                     " ".join(f"{result['stages'][stage]:>15.4f}s" for stage in STAGES))
+    logging.info("=" * 100 + "\n")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='BackTest 엔진 벤치마크 (가상 OHLCV, 네트워크 미사용)')
+    parser.add_argument('--sizes', type=int, nargs='+', default=BENCHMARK_CONFIG['SIZES'])
+    parser.add_argument('--repeat', type=int, default=BENCHMARK_CONFIG['REPEAT'])
+    parser.add_argument('--backend', default='decimal', help="거래 계산 방식 ('decimal', 'fixed')")
+    parser.add_argument('--output', default=BENCHMARK_CONFIG['OUTPUT'], help='결과 JSON 경로')
+    parser.add_argument('--baseline', help='비교할 기준 결과 JSON 경로')
+    parser.add_argument('--threshold', type=float, default=BENCHMARK_CONFIG['THRESHOLD'])
+    parser.add_argument('--no-memory', action='store_true', help='메모리 측정 생략')
+    parser.add_argument('--import-budget', type=float, nargs='?', const=IMPORT_BUDGET['SECONDS'],
+                        default=None, help="시작 시간만 측정해 예산(초) 확인 (기본 IMPORT_BUDGET['SECONDS'])")
+    args = parser.parse_args(argv)
+
+    bt.setup_logging()
+
+    if args.import_budget is not None:
+        result = measure_import_time()
+        logging.info(f"'import {result['module']}': 전체 {result['process_seconds']:.3f}초 "
+                     f"(import 문 {result['import_seconds']:.3f}초)")
+        problems = check_import_budget(result, args.import_budget)
+        for problem in problems:
+            logging.error(problem)
+        if not problems:
+            logging.info(f"시작 시간 예산 이내 ({args.import_budget:.3f}초)")
+        return 1 if problems else 0
+
+    config = bt.TradingConfig(ACCOUNTING_BACKEND=args.backend)
+    # BackTest 계좌 요약 로그는 벤치마크 출력에서 제외
+    logging.disable(logging.INFO)
+    try:
+        report = run_benchmarks(args.sizes, config, args.repeat, not args.no_memory)
+    finally:
+        logging.disable(logging.NOTSET)
+    print_report(report)
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    logging.info(f"결과 저장: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare_with_baseline(report, baseline, args.threshold)
+        if regressions:
+            logging.error("성능 회귀 발견 (기준 대비 {:.0%} 초과 하락):".format(args.threshold))
+            for regression in regressions:
+                logging.error(f"  {regression}")
+            return 1
+        logging.info("성능 회귀 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,239 @@
+# Standard library imports
+import json
+import logging
+import argparse
+import tempfile
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+# Third-party imports
+import pandas as pd
+import numpy as np
+
+# Local imports
+import main as bt
+import ohlcv_cache
+import data_source as ds
+import downloader as dl
+
+# === Constants ===
+# Stub Server Configuration
+STUB_CONFIG = {
+    'HOST': '127.0.0.1',
+    'PORT': 0,  # 0 이면 빈 포트를 자동으로 사용
+    'LISTED': '2024-01-01 09:00:00',  # 이 시각 이전 봉은 없음 (상장 시각)
+    'RATE_LIMIT_EVERY': 5,  # 이 수의 요청마다 한 번씩 429 응답 (0: 사용 안 함)
+    'MAX_COUNT': 200  # 업비트 캔들 조회 최대 개수
+}
+
+KST = pd.Timedelta(hours=9)
+
+
+def stub_candles(ticker: str, interval: str, to: pd.Timestamp, count: int,
+                 listed: pd.Timestamp) -> List[dict]:
+    """to 이전 count 개 봉을 업비트 캔들 응답 형식으로 생성 (최신순, 시각만으로 값이 정해짐)"""
+    interval = ds.to_upbit_interval(interval)
+    step = ds.interval_to_timedelta(interval)
+    last = ohlcv_cache.open_bar_start(interval, to - pd.Timedelta(ohlcv_cache.RANGE_RESOLUTION_NS))
+    starts = [last - step * offset for offset in range(count)]
+    rows = []
+    for start in starts:
+        if start < listed:
+            break
+        minute = start.value // 60_000_000_000
+        price = 1_000_000.0 + (minute % 1000) * 100
+        volume = 1.0 + minute % 7
+        rows.append({
+            'market': ticker,
+            'candle_date_time_utc': f"{start - KST:%Y-%m-%dT%H:%M:%S}",
+            'candle_date_time_kst': f"{start:%Y-%m-%dT%H:%M:%S}",
+            'opening_price': price,
+            'high_price': price + 50,
+            'low_price': price - 50,
+            'trade_price': price + 10,
+            'candle_acc_trade_price': price * volume,
+            'candle_acc_trade_volume': volume
+        })
+    return rows
+
+
+def expected_frame(ticker: str, interval: str, start: ds.TimeLike, end: ds.TimeLike,
+                   listed: ds.TimeLike = STUB_CONFIG['LISTED']) -> pd.DataFrame:
+    """stub_candles 가 [start, end] 구간에 내보내는 전체 봉 (검증용)"""
+    step = ds.interval_to_timedelta(interval)
+    first = max(ds.bar_start(start, interval), pd.Timestamp(listed))
+    if first < pd.Timestamp(start):
+        first += step
+    count = int((pd.Timestamp(end) - first) // step) + 1
+    if count <= 0:
+        return dl.candles_to_frame([])
+    return dl.candles_to_frame(stub_candles(ticker, interval, first + step * count, count, pd.Timestamp(listed)))
+
+
+class CandleStubServer:
+    """업비트 캔들 조회를 흉내 내는 로컬 HTTP 서버 (다운로더 시험용)
+
+    /v1/candles/minutes/{unit}, /v1/candles/days 에 market/to/count 로 응답하고,
+    rate_limit_every 요청마다 429 를, outage 가 켜져 있으면 모든 요청에 503 을 돌려준다.
+    """
+
+    def __init__(self, host: str = STUB_CONFIG['HOST'], port: int = STUB_CONFIG['PORT'],
+                 listed: ds.TimeLike = STUB_CONFIG['LISTED'],
+                 rate_limit_every: int = STUB_CONFIG['RATE_LIMIT_EVERY'],
+                 outage_after: Optional[int] = None):
+        self.listed = pd.Timestamp(listed)
+        self.rate_limit_every = rate_limit_every
+        # 이 수만큼 캔들을 응답한 뒤로는 장애(503) 상태 (None: 장애 없음)
+        self.outage_after = outage_after
+        self.stats: Dict[str, int] = {'requests': 0, 'served': 0, 'rate_limited': 0, 'unavailable': 0}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                status, body = stub.respond(self.path)
+                payload = json.dumps(body).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                logging.debug(f"stub: {format % args}")
+
+        return Handler
+
+    def respond(self, path: str) -> Tuple[int, object]:
+        """요청 경로에 대한 (상태 코드, 응답 본문)"""
+        url = urllib.parse.urlparse(path)
+        query = dict(urllib.parse.parse_qsl(url.query))
+        if url.path.startswith('/v1/candles/minutes/'):
+            interval = 'minute' + url.path.rsplit('/', 1)[-1]
+        elif url.path == '/v1/candles/days':
+            interval = 'day'
+        else:
+            return 404, {'error': {'name': 'not_found', 'message': url.path}}
+
+        with self._lock:
+            self.stats['requests'] += 1
+            if self.outage_after is not None and self.stats['served'] >= self.outage_after:
+                self.stats['unavailable'] += 1
+                return 503, {'error': {'name': 'unavailable', 'message': 'stub outage'}}
+            if self.rate_limit_every and self.stats['requests'] % self.rate_limit_every == 0:
+                self.stats['rate_limited'] += 1
+                return 429, {'error': {'name': 'too_many_requests', 'message': 'stub rate limit'}}
+            self.stats['served'] += 1
+
+        # 'to' 는 시간대가 붙은 시각 (한국 시간으로 변환)
+        to = pd.Timestamp(query['to'])
+        if to.tzinfo is not None:
+            to = to.tz_convert('Asia/Seoul').tz_localize(None)
+        count = min(int(query.get('count', STUB_CONFIG['MAX_COUNT'])), STUB_CONFIG['MAX_COUNT'])
+        return 200, stub_candles(query['market'], interval, to, count, self.listed)
+
+    def serve_forever(self) -> None:
+        """현재 스레드에서 요청 처리 (중단될 때까지)"""
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+
+    def start(self) -> 'CandleStubServer':
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> 'CandleStubServer':
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def run_self_check(tickers: List[str], interval: str, start: ds.TimeLike, end: ds.TimeLike,
+                   cache_dir: Optional[str] = None) -> bool:
+    """대체 서버로 다운로더를 두 번 실행해 429 재시도와 중단 후 이어받기를 확인
+
+    첫 실행은 절반쯤 받은 뒤 서버를 장애 상태로 두어 남은 조각을 실패시키고,
+    두 번째 실행은 장애를 풀고 남은 조각만 받는지, 최종 캐시가 서버 데이터와 같은지 확인한다.
+    """
+    cache = ohlcv_cache.OHLCVCache(cache_dir or tempfile.mkdtemp(prefix='candle_stub_'), offline=True)
+    options = {'requests_per_second': 1000, 'concurrency': 4, 'max_retries': 4,
+               'backoff_seconds': 0.01, 'flush_chunks': 3}
+
+    with CandleStubServer() as server:
+        downloader = dl.BulkDownloader(cache, dl.CandleClient(server.base_url), **options)
+        planned = len(downloader.plan(tickers, [interval], start, end))
+        server.outage_after = planned // 2
+        first = downloader.run(tickers, [interval], start, end)
+
+        remaining = len(downloader.plan(tickers, [interval], start, end))
+        server.outage_after = None
+        second = downloader.run(tickers, [interval], start, end)
+        left = len(downloader.plan(tickers, [interval], start, end))
+        stats = dict(server.stats)
+
+    checks = {
+        '429 재시도': stats['rate_limited'] > 0 and first.retries + second.retries >= stats['rate_limited'],
+        '장애로 일부 실패': len(first.failed) > 0 and remaining == len(first.failed),
+        '남은 조각만 이어받기': second.chunks == remaining and not second.failed and left == 0,
+    }
+    for ticker in tickers:
+        stored = cache.get(ticker, interval, start, end)
+        expected = expected_frame(ticker, interval, start, end)
+        checks[f"{ticker} 데이터 일치"] = (stored.index.equals(expected.index)
+                                          and np.allclose(stored.to_numpy(), expected.to_numpy()))
+
+    logging.info(f"계획 {planned}개 조각 -> 첫 실행 {first.chunks}개 (실패 {len(first.failed)}개), "
+                 f"이어받기 {second.chunks}개, 서버 {stats}")
+    for name, passed in checks.items():
+        logging.info(f"{'통과' if passed else '실패'}: {name}")
+    return all(checks.values())
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """대체 서버 실행 또는 다운로더 자체 점검
+
+    예: python candle_stub_server.py --check
+        python candle_stub_server.py --port 8000  (UPBIT_API_URL=http://127.0.0.1:8000 으로 downloader.py 실행)
+    """
+    parser = argparse.ArgumentParser(description='업비트 캔들 조회 대체 서버')
+    parser.add_argument('--check', action='store_true', help="다운로더 재시도/이어받기 자체 점검 후 종료")
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--tickers', nargs='+', default=['KRW-BTC', 'KRW-ETH'])
+    parser.add_argument('--interval', default='minute1')
+    parser.add_argument('--start', default='2023-12-31 12:00:00')
+    parser.add_argument('--end', default='2024-01-02 12:00:00')
+    args = parser.parse_args(argv)
+
+    bt.setup_logging()
+    if args.check:
+        return 0 if run_self_check(args.tickers, args.interval, args.start, args.end) else 1
+
+    server = CandleStubServer(port=args.port)
+    logging.info(f"대체 서버 실행: {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,273 @@
+# Standard library imports
+import os
+import zlib
+from datetime import datetime
+from typing import Dict, Optional, Tuple, Union
+
+# Third-party imports
+import pandas as pd
+import numpy as np
+
+# Local imports
+import ohlcv_cache
+
+TimeLike = Union[datetime, str, pd.Timestamp]
+
+# === Constants ===
+MINUTES_PER_YEAR = 365 * 24 * 60
+UPBIT_BAR_ORIGIN = ohlcv_cache.UPBIT_BAR_ORIGIN
+
+# Upbit Data Configuration
+UPBIT_CONFIG = {
+    # 이 주기만 조회/저장하고 다른 주기는 리샘플링으로 만듦 (빈 값이면 주기마다 따로 조회)
+    'BASE_INTERVAL': os.environ.get('OHLCV_BASE_INTERVAL', 'minute1')
+}
+
+# Synthetic Data Configuration
+SYNTHETIC_CONFIG = {
+    'INITIAL_PRICE': 3_000_000.0,
+    'ANNUAL_DRIFT': 0.0,
+    'ANNUAL_VOLATILITY': 0.8,  # 암호화폐 수준의 연간 변동성
+    'INTRABAR_VOLATILITY': 0.002,  # 고가/저가 폭
+    'MEAN_VOLUME': 100.0
+}
+
+
+def to_upbit_interval(interval: Union[str, int]) -> str:
+    """BackTest 주기('60')를 pyupbit 주기('minute60')로 변환"""
+    interval = str(interval)
+    return 'minute' + interval if interval.isdigit() else interval
+
+
+def interval_to_timedelta(interval: Union[str, int]) -> pd.Timedelta:
+    """주기를 봉 간격으로 변환"""
+    interval = str(interval)
+    if interval.isdigit():
+        return pd.Timedelta(minutes=int(interval))
+    if interval.startswith('minute'):
+        return pd.Timedelta(minutes=int(interval[len('minute'):]))
+    if interval == 'day':
+        return pd.Timedelta(days=1)
+    raise ValueError(f"지원하지 않는 주기입니다: {interval}")
+
+
+def slice_range(data: pd.DataFrame, start: TimeLike, end: TimeLike) -> pd.DataFrame:
+    """[start, end] 구간 행 선택"""
+    lo = data.index.searchsorted(pd.Timestamp(start), side='left')
+    hi = data.index.searchsorted(pd.Timestamp(end), side='right')
+    return data.iloc[lo:hi].copy()
+
+
+def bar_starts(index: pd.DatetimeIndex, interval: Union[str, int]) -> np.ndarray:
+    """각 시각이 속한 업비트 봉의 시작 시각 (ns 정수 배열)"""
+    step = interval_to_timedelta(interval).value
+    origin = UPBIT_BAR_ORIGIN.value
+    times = index.values.astype('datetime64[ns]').astype(np.int64)
+    return (times - origin) // step * step + origin
+
+
+def bar_start(time: TimeLike, interval: Union[str, int]) -> pd.Timestamp:
+    """time 이 속한 업비트 봉의 시작 시각"""
+    return pd.Timestamp(int(bar_starts(pd.DatetimeIndex([pd.Timestamp(time)]), interval)[0]))
+
+
+def resample_ohlcv(data: pd.DataFrame, interval: Union[str, int]) -> pd.DataFrame:
+    """짧은 주기 OHLCV 를 업비트 봉 경계에 맞춰 긴 주기로 합침
+
+    인덱스가 정렬되어 있다고 가정하며, 거래가 없어 원본 봉이 하나도 없는 구간은 만들지 않는다.
+    """
+    if data.empty:
+        return data.copy()
+    starts = bar_starts(data.index, interval)
+    first = np.flatnonzero(np.concatenate(([True], starts[1:] != starts[:-1])))
+    last = np.concatenate((first[1:] - 1, [len(data) - 1]))
+
+    columns = {
+        'open': data['open'].to_numpy(dtype=np.float64)[first],
+        'high': np.maximum.reduceat(data['high'].to_numpy(dtype=np.float64), first),
+        'low': np.minimum.reduceat(data['low'].to_numpy(dtype=np.float64), first),
+        'close': data['close'].to_numpy(dtype=np.float64)[last],
+        'volume': np.add.reduceat(data['volume'].to_numpy(dtype=np.float64), first),
+        'value': np.add.reduceat(data['value'].to_numpy(dtype=np.float64), first)
+    }
+    return pd.DataFrame(columns, index=pd.DatetimeIndex(starts[first].astype('datetime64[ns]')))
+
+
+# === Data Sources ===
+class DataSource:
+    """OHLCV 데이터 제공자 인터페이스
+
+    get_ohlcv 는 open/high/low/close/volume/value 컬럼과 시간 인덱스를 가진
+    DataFrame 을 반환한다. 지표 계산은 tick_db.add_indicators 가 담당한다.
+    """
+
+    def get_ohlcv(self, ticker: str, interval: str,
+                  start: TimeLike, end: TimeLike) -> pd.DataFrame:
+        raise NotImplementedError
+
+
+class UpbitDataSource(DataSource):
+    """pyupbit 조회 데이터 제공자 (로컬 OHLCV 캐시 경유)
+
+    base_interval 을 지정하면 그 주기만 조회/저장하고, 다른 주기는 저장된 전체 데이터를
+    처음 요청될 때 한 번 리샘플링해 메모리에 두고 재사용한다 (기본 데이터가 늘어나면 다시 계산).
+    기본 주기로 만들 수 없는 주기(week, month, 기본 주기의 배수가 아닌 분봉)는 주기별로 따로 조회한다.
+    """
+
+    def __init__(self, cache: Optional[ohlcv_cache.OHLCVCache] = None,
+                 base_interval: Optional[str] = UPBIT_CONFIG['BASE_INTERVAL']):
+        self.cache = cache or ohlcv_cache.get_default_cache()
+        self.base_interval = to_upbit_interval(base_interval) if base_interval else None
+        self._resampled: Dict[Tuple[str, str], Tuple[pd.DataFrame, pd.DataFrame]] = {}
+
+    def get_ohlcv(self, ticker: str, interval: str,
+                  start: TimeLike, end: TimeLike) -> pd.DataFrame:
+        interval = to_upbit_interval(interval)
+        if not self.can_resample(interval):
+            return self.cache.get(ticker, interval, start, end)
+
+        # 요청 구간의 첫 봉과 마지막 봉을 모두 채우는 기본 주기 데이터 확보
+        step = interval_to_timedelta(interval)
+        base_step = interval_to_timedelta(self.base_interval)
+        self.cache.ensure(ticker, self.base_interval, bar_start(start, interval),
+                          bar_start(end, interval) + step - base_step)
+        return slice_range(self._resample(ticker, interval), start, end)
+
+    def can_resample(self, interval: str) -> bool:
+        """interval 을 기본 주기 데이터를 리샘플링해 만들 수 있는지 여부"""
+        if not self.base_interval or interval == self.base_interval:
+            return False
+        try:
+            step = interval_to_timedelta(interval)
+        except ValueError:
+            return False
+        base_step = interval_to_timedelta(self.base_interval)
+        return step > base_step and step % base_step == pd.Timedelta(0)
+
+    def _resample(self, ticker: str, interval: str) -> pd.DataFrame:
+        """저장된 기본 주기 전체를 interval 로 리샘플링 (기본 데이터가 그대로면 재사용)"""
+        base = self.cache.frame(ticker, self.base_interval)
+        cached = self._resampled.get((ticker, interval))
+        if cached is None or cached[0] is not base:
+            cached = self._resampled[(ticker, interval)] = (base, resample_ohlcv(base, interval))
+        return cached[1]
+
+
+class FixtureDataSource(DataSource):
+    """CSV/Parquet 파일 데이터 제공자
+
+    path 가 디렉터리이면 '{ticker}_{minute60}.parquet' 또는 '.csv' 파일을 찾고,
+    파일이면 종목/주기와 관계없이 해당 파일을 사용한다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._frames: Dict[str, pd.DataFrame] = {}
+
+    def _resolve_path(self, ticker: str, interval: str) -> str:
+        """종목/주기에 해당하는 파일 경로"""
+        if not os.path.isdir(self.path):
+            return self.path
+        name = f"{ticker}_{to_upbit_interval(interval)}"
+        for extension in ('.parquet', '.csv'):
+            candidate = os.path.join(self.path, name + extension)
+            if os.path.exists(candidate):
+                return candidate
+        raise FileNotFoundError(f"데이터 파일이 없습니다: {os.path.join(self.path, name)}.(parquet|csv)")
+
+    def _read(self, path: str) -> pd.DataFrame:
+        """파일 읽기 (한 번 읽은 파일은 재사용)"""
+        if path not in self._frames:
+            if path.endswith('.parquet'):
+                data = pd.read_parquet(path)
+            else:
+                data = pd.read_csv(path, index_col=0, parse_dates=True, float_precision='round_trip')
+            data.index = pd.DatetimeIndex(data.index)
+            self._frames[path] = data[ohlcv_cache.OHLCV_COLUMNS].sort_index()
+        return self._frames[path]
+
+    def get_ohlcv(self, ticker: str, interval: str,
+                  start: TimeLike, end: TimeLike) -> pd.DataFrame:
+        return slice_range(self._read(self._resolve_path(ticker, interval)), start, end)
+
+
+class SyntheticDataSource(DataSource):
+    """기하 브라운 운동(GBM) 기반 가상 OHLCV 생성기
+
+    같은 (seed, 종목, 주기, 시작 시각) 요청은 항상 같은 데이터를 만든다.
+    네트워크 없이 수백만 개의 봉을 만들어 엔진 부하 테스트에 사용한다.
+    """
+
+    def __init__(self, seed: int = 0,
+                 initial_price: float = SYNTHETIC_CONFIG['INITIAL_PRICE'],
+                 annual_drift: float = SYNTHETIC_CONFIG['ANNUAL_DRIFT'],
+                 annual_volatility: float = SYNTHETIC_CONFIG['ANNUAL_VOLATILITY'],
+                 intrabar_volatility: float = SYNTHETIC_CONFIG['INTRABAR_VOLATILITY'],
+                 mean_volume: float = SYNTHETIC_CONFIG['MEAN_VOLUME']):
+        self.seed = seed
+        self.initial_price = initial_price
+        self.annual_drift = annual_drift
+        self.annual_volatility = annual_volatility
+        self.intrabar_volatility = intrabar_volatility
+        self.mean_volume = mean_volume
+
+    def _rng(self, ticker: str, interval: str, start: pd.Timestamp) -> np.random.Generator:
+        """요청별 난수 생성기 (hash() 와 달리 실행마다 같은 시드)"""
+        return np.random.default_rng([
+            self.seed,
+            zlib.crc32(ticker.encode()),
+            zlib.crc32(str(interval).encode()),
+            start.value % (2 ** 63)
+        ])
+
+    def generate(self, ticker: str, interval: str, start: TimeLike, bars: int) -> pd.DataFrame:
+        """start 부터 bars 개의 봉 생성"""
+        step = interval_to_timedelta(interval)
+        start = pd.Timestamp(start).ceil(step) if step < pd.Timedelta(days=1) else pd.Timestamp(start)
+        index = pd.date_range(start, periods=bars, freq=step)
+        rng = self._rng(ticker, interval, start)
+
+        # 로그 수익률: (mu - sigma^2 / 2) dt + sigma sqrt(dt) Z
+        dt = step / pd.Timedelta(minutes=1) / MINUTES_PER_YEAR
+        sigma = self.annual_volatility
+        log_returns = ((self.annual_drift - 0.5 * sigma ** 2) * dt +
+                       sigma * np.sqrt(dt) * rng.standard_normal(bars))
+        close = self.initial_price * np.exp(np.cumsum(log_returns))
+        open_ = np.empty(bars)
+        open_[:1] = self.initial_price
+        open_[1:] = close[:-1]
+
+        high = np.maximum(open_, close) * (1 + np.abs(rng.standard_normal(bars)) * self.intrabar_volatility)
+        low = np.minimum(open_, close) * (1 - np.abs(rng.standard_normal(bars)) * self.intrabar_volatility)
+        volume = rng.lognormal(np.log(self.mean_volume), 1.0, bars)
+
+        return pd.DataFrame({
+            'open': open_,
+            'high': high,
+            'low': low,
+            'close': close,
+            'volume': volume,
+            'value': volume * close
+        }, index=index)
+
+    def get_ohlcv(self, ticker: str, interval: str,
+                  start: TimeLike, end: TimeLike) -> pd.DataFrame:
+        step = interval_to_timedelta(interval)
+        start, end = pd.Timestamp(start), pd.Timestamp(end)
+        first = start.ceil(step) if step < pd.Timedelta(days=1) else start
+        bars = int((end - first) // step) + 1 if end >= first else 0
+        return self.generate(ticker, interval, start, bars)
+
+
+DATA_SOURCES = {
+    'upbit': UpbitDataSource,
+    'fixture': FixtureDataSource,
+    'synthetic': SyntheticDataSource
+}
+
+
+def create_data_source(name: str, **options) -> DataSource:
+    """이름으로 데이터 제공자 생성 ('upbit', 'fixture', 'synthetic')"""
+    if name not in DATA_SOURCES:
+        raise ValueError(f"알 수 없는 데이터 제공자입니다: {name}")
+    return DATA_SOURCES[name](**options)
@@ -0,0 +1,315 @@
+# Standard library imports
+import os
+import json
+import time
+import random
+import asyncio
+import logging
+import argparse
+import urllib.error
+import urllib.parse
+import urllib.request
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Third-party imports
+import pandas as pd
+
+# Local imports
+import main as bt
+import ohlcv_cache
+import data_source as ds
+
+# === Constants ===
+# Download Configuration
+DOWNLOAD_CONFIG = {
+    # 로컬 대체 서버(candle_stub_server.py)로 시험할 때는 UPBIT_API_URL 을 'http://127.0.0.1:8000' 등으로 지정
+    'BASE_URL': os.environ.get('UPBIT_API_URL', 'https://api.upbit.com'),
+    'REQUESTS_PER_SECOND': 8,  # 업비트 시세 조회 제한(초당 10회)보다 여유 있게
+    'BURST': 1,  # 한 번에 연속으로 보낼 수 있는 요청 수
+    'CONCURRENCY': 4,  # 동시에 진행하는 요청 수
+    'CANDLES_PER_REQUEST': 200,  # 업비트 캔들 조회 최대 개수
+    'MAX_RETRIES': 5,
+    'BACKOFF_SECONDS': 0.5,  # 재시도 대기 시간 (시도마다 두 배)
+    'TIMEOUT_SECONDS': 10,
+    'FLUSH_CHUNKS': 50  # 이 수만큼 조각을 받을 때마다 캐시 파일에 기록
+}
+
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+CANDLE_COLUMNS = {
+    'opening_price': 'open',
+    'high_price': 'high',
+    'low_price': 'low',
+    'trade_price': 'close',
+    'candle_acc_trade_volume': 'volume',
+    'candle_acc_trade_price': 'value'
+}
+
+
+class TokenBucket:
+    """초당 rate 개의 토큰을 채우는 요청 속도 제한기 (최대 burst 개까지 모아 둠)"""
+
+    def __init__(self, rate: float, burst: int = 1, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+
+    async def acquire(self) -> None:
+        """토큰 하나를 얻을 때까지 대기"""
+        while True:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+@dataclass
+class DownloadChunk:
+    """요청 한 번으로 받는 (종목, 주기, [start, end]) 구간"""
+    ticker: str
+    interval: str
+    start: pd.Timestamp
+    end: pd.Timestamp
+
+
+@dataclass
+class DownloadReport:
+    """다운로드 결과 요약"""
+    chunks: int = 0
+    bars: int = 0
+    requests: int = 0
+    retries: int = 0
+    failed: List[DownloadChunk] = field(default_factory=list)
+
+
+def candles_path(interval: str) -> str:
+    """주기별 업비트 캔들 조회 경로"""
+    interval = ds.to_upbit_interval(interval)
+    if interval.startswith('minute'):
+        return f"/v1/candles/minutes/{interval[len('minute'):]}"
+    if interval == 'day':
+        return '/v1/candles/days'
+    raise ValueError(f"지원하지 않는 주기입니다: {interval}")
+
+
+def candles_to_frame(rows: List[dict]) -> pd.DataFrame:
+    """캔들 조회 응답을 OHLCV DataFrame 으로 변환 (시간 오름차순, 한국 시간 인덱스)"""
+    if not rows:
+        return pd.DataFrame({column: pd.Series(dtype='float64') for column in ohlcv_cache.OHLCV_COLUMNS},
+                            index=pd.DatetimeIndex([], dtype='datetime64[ns]'))
+    frame = pd.DataFrame(rows)
+    index = pd.DatetimeIndex(pd.to_datetime(frame['candle_date_time_kst']))
+    frame = frame[list(CANDLE_COLUMNS)].rename(columns=CANDLE_COLUMNS).astype('float64')
+    frame.index = index
+    return frame[ohlcv_cache.OHLCV_COLUMNS].sort_index()
+
+
+def plan_chunks(cache: ohlcv_cache.OHLCVCache, ticker: str, interval: str,
+                start: ds.TimeLike, end: ds.TimeLike,
+                candles_per_request: int = DOWNLOAD_CONFIG['CANDLES_PER_REQUEST']) -> List[DownloadChunk]:
+    """캐시에 없는 구간만 요청 단위 조각으로 나눔 (중단 후 다시 실행하면 남은 조각부터 받음)"""
+    interval = ds.to_upbit_interval(interval)
+    span = ds.interval_to_timedelta(interval) * candles_per_request
+    resolution = pd.Timedelta(ohlcv_cache.RANGE_RESOLUTION_NS)
+    closed_end = pd.Timestamp(ohlcv_cache.closed_bars_end(interval))
+    chunks = []
+    for gap_start, gap_end in cache.missing_ranges(ticker, interval, start, end):
+        # 진행 중인 봉은 아직 바뀌므로 마감된 봉까지만 받음
+        chunk_start, gap_end = pd.Timestamp(gap_start), min(pd.Timestamp(gap_end), closed_end)
+        while chunk_start <= gap_end:
+            chunk_end = min(chunk_start + span - resolution, gap_end)
+            chunks.append(DownloadChunk(ticker, interval, chunk_start, chunk_end))
+            chunk_start = chunk_end + resolution
+    return chunks
+
+
+class CandleClient:
+    """업비트 캔들 조회 클라이언트 (urllib 요청을 스레드에서 실행)"""
+
+    def __init__(self, base_url: str = DOWNLOAD_CONFIG['BASE_URL'],
+                 timeout: float = DOWNLOAD_CONFIG['TIMEOUT_SECONDS']):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+
+    def url(self, chunk: DownloadChunk, count: int) -> str:
+        """chunk 끝 직후를 'to' 로 지정 (업비트는 'to' 이전 봉을 최신순으로 반환)"""
+        to = chunk.end + pd.Timedelta(ohlcv_cache.RANGE_RESOLUTION_NS)
+        query = urllib.parse.urlencode({
+            'market': chunk.ticker,
+            'to': f"{to:%Y-%m-%dT%H:%M:%S}+09:00",
+            'count': count
+        })
+        return f"{self.base_url}{candles_path(chunk.interval)}?{query}"
+
+    def _get(self, url: str) -> List[dict]:
+        request = urllib.request.Request(url, headers={'Accept': 'application/json'})
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            return json.loads(response.read().decode('utf-8'))
+
+    async def candles(self, chunk: DownloadChunk, count: int) -> pd.DataFrame:
+        """chunk 구간 캔들 조회"""
+        rows = await asyncio.to_thread(self._get, self.url(chunk, count))
+        frame = candles_to_frame(rows)
+        return frame[(frame.index >= chunk.start) & (frame.index <= chunk.end)]
+
+
+def _is_retryable(error: Exception) -> bool:
+    if isinstance(error, urllib.error.HTTPError):
+        return error.code in RETRY_STATUS_CODES
+    return isinstance(error, (urllib.error.URLError, TimeoutError, ConnectionError))
+
+
+class BulkDownloader:
+    """여러 (종목, 주기, 구간) 조각을 동시에 받아 로컬 OHLCV 캐시에 채우는 다운로더
+
+    모든 요청은 TokenBucket 을 거쳐 초당 요청 수를 제한하고, 429/5xx/연결 오류는 지수 백오프로 재시도한다.
+    받은 조각은 FLUSH_CHUNKS 개마다, 그리고 중단될 때도 캐시에 기록하므로 다시 실행하면 남은 구간만 받는다.
+    """
+
+    def __init__(self, cache: Optional[ohlcv_cache.OHLCVCache] = None,
+                 client: Optional[CandleClient] = None,
+                 requests_per_second: float = DOWNLOAD_CONFIG['REQUESTS_PER_SECOND'],
+                 burst: int = DOWNLOAD_CONFIG['BURST'],
+                 concurrency: int = DOWNLOAD_CONFIG['CONCURRENCY'],
+                 candles_per_request: int = DOWNLOAD_CONFIG['CANDLES_PER_REQUEST'],
+                 max_retries: int = DOWNLOAD_CONFIG['MAX_RETRIES'],
+                 backoff_seconds: float = DOWNLOAD_CONFIG['BACKOFF_SECONDS'],
+                 flush_chunks: int = DOWNLOAD_CONFIG['FLUSH_CHUNKS']):
+        self.cache = cache or ohlcv_cache.get_default_cache()
+        self.client = client or CandleClient()
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.concurrency = concurrency
+        self.candles_per_request = candles_per_request
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.flush_chunks = flush_chunks
+
+    def plan(self, tickers: List[str], intervals: List[str],
+             start: ds.TimeLike, end: ds.TimeLike) -> List[DownloadChunk]:
+        """종목/주기별 받아야 할 조각 목록"""
+        return [chunk
+                for ticker in tickers
+                for interval in intervals
+                for chunk in plan_chunks(self.cache, ticker, interval, start, end,
+                                         self.candles_per_request)]
+
+    async def _fetch(self, chunk: DownloadChunk, bucket: TokenBucket,
+                     report: DownloadReport) -> pd.DataFrame:
+        """재시도를 포함한 조각 하나 조회"""
+        for attempt in range(self.max_retries + 1):
+            await bucket.acquire()
+            report.requests += 1
+            try:
+                return await self.client.candles(chunk, self.candles_per_request)
+            except Exception as e:
+                if attempt == self.max_retries or not _is_retryable(e):
+                    raise
+                report.retries += 1
+                delay = self.backoff_seconds * (2 ** attempt) * (0.5 + random.random())
+                logging.debug(f"재시도 {attempt + 1}/{self.max_retries}: {chunk.ticker} {chunk.interval} "
+                              f"{chunk.start} ({str(e)}), {delay:.2f}초 후")
+                await asyncio.sleep(delay)
+
+    def _store(self, pending: Dict[Tuple[str, str], list]) -> None:
+        """받은 조각을 종목/주기별로 한 번에 캐시에 기록"""
+        for (ticker, interval), chunks in pending.items():
+            self.cache.store_chunks(ticker, interval, chunks)
+
+    async def _flush(self, buffers: Dict[Tuple[str, str], list], lock: asyncio.Lock) -> None:
+        """버퍼를 비우고 파일 기록은 스레드에서 실행 (기록 중에도 다른 요청은 계속 진행)"""
+        async with lock:
+            pending = {key: chunks for key, chunks in buffers.items() if chunks}
+            buffers.clear()
+            if pending:
+                await asyncio.to_thread(self._store, pending)
+
+    async def download(self, chunks: List[DownloadChunk]) -> DownloadReport:
+        """조각 목록을 동시에 받아 캐시에 저장"""
+        report = DownloadReport()
+        queue: asyncio.Queue = asyncio.Queue()
+        for chunk in chunks:
+            queue.put_nowait(chunk)
+        bucket = TokenBucket(self.requests_per_second, self.burst)
+        buffers: Dict[Tuple[str, str], list] = {}
+        buffered = 0
+        # 캐시 기록은 한 번에 하나씩 (OHLCVCache 는 스레드 간 공유를 가정하지 않음)
+        flush_lock = asyncio.Lock()
+
+        async def worker() -> None:
+            nonlocal buffered
+            while not queue.empty():
+                chunk = queue.get_nowait()
+                try:
+                    data = await self._fetch(chunk, bucket, report)
+                except Exception as e:
+                    logging.warning(f"데이터 조회 실패: {chunk.ticker} {chunk.interval} "
+                                    f"{chunk.start} ~ {chunk.end} - {str(e)}")
+                    report.failed.append(chunk)
+                    continue
+                buffers.setdefault((chunk.ticker, chunk.interval), []).append((data, chunk.start, chunk.end))
+                report.chunks += 1
+                report.bars += len(data)
+                buffered += 1
+                if buffered >= self.flush_chunks:
+                    buffered = 0
+                    await self._flush(buffers, flush_lock)
+
+        try:
+            await asyncio.gather(*(worker() for _ in range(max(1, self.concurrency))))
+        finally:
+            # 중단되어도 받은 조각은 기록
+            await self._flush(buffers, flush_lock)
+        return report
+
+    def run(self, tickers: List[str], intervals: List[str],
+            start: ds.TimeLike, end: ds.TimeLike) -> DownloadReport:
+        """구간 계획부터 다운로드까지 실행"""
+        start_time = datetime.now()
+        chunks = self.plan(tickers, intervals, start, end)
+        report = asyncio.run(self.download(chunks))
+        logging.info(f"캐시 채우기 완료: {report.chunks}/{len(chunks)}개 조각, {report.bars}개 봉, "
+                     f"요청 {report.requests}회 (재시도 {report.retries}회, 실패 {len(report.failed)}개) "
+                     f"(소요시간: {datetime.now() - start_time})")
+        return report
+
+
+def warm_cache(tickers: List[str], start: ds.TimeLike, end: ds.TimeLike,
+               intervals: Optional[List[str]] = None,
+               cache: Optional[ohlcv_cache.OHLCVCache] = None,
+               base_url: str = DOWNLOAD_CONFIG['BASE_URL'], **options) -> DownloadReport:
+    """종목별 OHLCV 를 미리 받아 캐시 채우기 (주기 기본값은 리샘플링 기본 주기)"""
+    intervals = intervals or [ds.UPBIT_CONFIG['BASE_INTERVAL'] or 'minute1']
+    downloader = BulkDownloader(cache, CandleClient(base_url), **options)
+    return downloader.run(tickers, intervals, start, end)
+
+
+def main(argv: Optional[List[str]] = None):
+    """명령행 실행 (기본값은 TRADING_CONFIG 종목과 기간)"""
+    parser = argparse.ArgumentParser(description='업비트 OHLCV 캐시 채우기')
+    parser.add_argument('--tickers', nargs='+', default=bt.TRADING_CONFIG['tickers'])
+    parser.add_argument('--intervals', nargs='+', default=None)
+    parser.add_argument('--start', default=None)
+    parser.add_argument('--end', default=None)
+    parser.add_argument('--base-url', default=DOWNLOAD_CONFIG['BASE_URL'])
+    parser.add_argument('--concurrency', type=int, default=DOWNLOAD_CONFIG['CONCURRENCY'])
+    parser.add_argument('--rate', type=float, default=DOWNLOAD_CONFIG['REQUESTS_PER_SECOND'])
+    args = parser.parse_args(argv)
+
+    bt.setup_logging()
+    periods = bt.get_selected_periods(bt.TRADING_CONFIG)
+    start = args.start or min(period.start for period in periods)
+    end = args.end or max(period.end for period in periods)
+    report = warm_cache(args.tickers, start, end, args.intervals, base_url=args.base_url,
+                        concurrency=args.concurrency, requests_per_second=args.rate)
+    return 1 if report.failed else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,142 @@
+# Standard library imports
+from typing import Optional, Tuple, Union
+
+# Third-party imports
+import pandas as pd
+import numpy as np
+
+# Local imports
+import data_source as ds
+
+# === Constants ===
+# Fill Model Configuration
+FILL_CONFIG = {
+    'SUB_BAR_INTERVAL': '1',  # 체결 시뮬레이션에 쓰는 하위 봉 주기 (분)
+    # 하위 봉 처음/끝이 체결 구간에서 이보다 멀면 조회 실패로 보고 오류 (거래 없는 분봉은 비어 있을 수 있음)
+    'MAX_EDGE_GAP_MINUTES': 60
+}
+
+# 'close': 신호 봉 종가 (기존 방식), 'next_open': 다음 봉 첫 하위 봉 시가,
+# 'vwap': 다음 봉 하위 봉 거래량 가중 평균가, 'limit': 신호 봉 종가 지정가 (다음 봉에서 닿으면 체결)
+FILL_MODELS = ['close', 'next_open', 'vwap', 'limit']
+
+FillPrices = Tuple[np.ndarray, np.ndarray]  # 봉별 (매수, 매도) 체결가, 체결되지 않으면 NaN
+
+
+class SubBarIndex:
+    """하위 봉(기본 1분) 배열과 누적합 (데이터셋마다 한 번 생성)
+
+    봉 시작 시각 -> 하위 봉 위치는 정렬된 시각 배열의 searchsorted 로 한 번에 구하고,
+    구간 거래량 가중 평균가는 누적합 차이로 구하므로 체결마다 하위 봉을 다시 훑지 않는다.
+    """
+
+    def __init__(self, data: pd.DataFrame, ticker: str = '',
+                 start: Optional[ds.TimeLike] = None, end: Optional[ds.TimeLike] = None):
+        self.ticker = ticker
+        # 조회한 구간 (지정하지 않으면 데이터 구간)
+        self.start = pd.Timestamp(start) if start is not None else (data.index[0] if len(data) else None)
+        self.end = pd.Timestamp(end) if end is not None else (data.index[-1] if len(data) else None)
+        self.times = np.asarray(data.index.values, dtype='datetime64[ns]').astype(np.int64)
+        # 구간이 데이터 끝까지일 때 reduceat 위치가 넘치지 않도록 끝에 빈 값 하나를 붙임
+        self.open = np.append(data['open'].to_numpy(dtype=np.float64), np.nan)
+        self.high = np.append(data['high'].to_numpy(dtype=np.float64), -np.inf)
+        self.low = np.append(data['low'].to_numpy(dtype=np.float64), np.inf)
+        volume = data['volume'].to_numpy(dtype=np.float64)
+        typical = (self.high[:-1] + self.low[:-1] + data['close'].to_numpy(dtype=np.float64)) / 3
+        self._cum_value = np.concatenate(([0.0], np.cumsum(typical * volume)))
+        self._cum_volume = np.concatenate(([0.0], np.cumsum(volume)))
+
+    @classmethod
+    def load(cls, source: ds.DataSource, ticker: str, start: ds.TimeLike, end: ds.TimeLike,
+             interval: str = FILL_CONFIG['SUB_BAR_INTERVAL']) -> 'SubBarIndex':
+        """데이터 제공자에서 하위 봉을 한 번 조회해 생성"""
+        return cls(source.get_ohlcv(ticker, interval, start, end), ticker, start, end)
+
+    def covers(self, ticker: str, start: ds.TimeLike, end: ds.TimeLike) -> bool:
+        """ticker 의 [start, end] 구간을 조회한 인덱스인지 여부"""
+        return (self.ticker == ticker and self.start is not None
+                and self.start <= pd.Timestamp(start) and pd.Timestamp(end) <= self.end)
+
+    @property
+    def bars(self) -> int:
+        return len(self.times)
+
+    def check_coverage(self, index: pd.DatetimeIndex, interval: Union[str, int]) -> None:
+        """하위 봉이 index 봉들의 체결 구간을 덮지 않으면 ValueError
+
+        조회에 실패하면 모든 체결가가 NaN 이 되어 '체결 없음' 결과가 조용히 나오므로 미리 확인한다.
+        마지막 체결 구간은 아직 만들어지지 않았을 수 있어 마지막 신호 봉까지만 확인한다.
+        """
+        if not len(index):
+            return
+        step = ds.interval_to_timedelta(interval)
+        first_window = index[0] + step
+        tolerance = pd.Timedelta(minutes=FILL_CONFIG['MAX_EDGE_GAP_MINUTES'])
+        if not self.bars:
+            raise ValueError(f"하위 봉 데이터가 없습니다: {self.ticker} {first_window} ~ {index[-1] + 2 * step}")
+        first, last = pd.Timestamp(self.times[0]), pd.Timestamp(self.times[-1])
+        if first > first_window + max(step, tolerance) or last < index[-1] - tolerance:
+            raise ValueError(f"하위 봉이 체결 구간을 덮지 않습니다: {self.ticker} 하위 봉 {first} ~ {last}, "
+                             f"체결 구간 {first_window} ~ {index[-1] + 2 * step}")
+
+    def windows(self, index: pd.DatetimeIndex, interval: Union[str, int]) -> Tuple[np.ndarray, np.ndarray]:
+        """각 봉 다음 봉 구간 [시작 + 주기, 시작 + 2 x 주기) 의 하위 봉 위치 (lo, hi)
+
+        신호는 봉 종가로 정해지므로 체결은 그 다음 봉 동안의 하위 봉으로 시뮬레이션한다.
+        """
+        step = ds.interval_to_timedelta(interval).value
+        starts = np.asarray(index.values, dtype='datetime64[ns]').astype(np.int64) + step
+        return (self.times.searchsorted(starts, side='left'),
+                self.times.searchsorted(starts + step, side='left'))
+
+    def _reduce(self, ufunc: np.ufunc, values: np.ndarray, lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+        """구간별 ufunc 집계 (빈 구간 값은 쓰지 않음)"""
+        if not len(lo):
+            return np.zeros(0)
+        positions = np.column_stack((lo, hi)).ravel()
+        return ufunc.reduceat(values, positions)[::2]
+
+    def fill_prices(self, model: str, index: pd.DatetimeIndex, interval: Union[str, int],
+                    close: np.ndarray) -> FillPrices:
+        """봉별 (매수, 매도) 체결가를 한 번에 계산 (체결되지 않으면 NaN)"""
+        if model not in FILL_MODELS or model == 'close':
+            raise ValueError(f"하위 봉 체결 방식이 아닙니다: {model}")
+        self.check_coverage(index, interval)
+        lo, hi = self.windows(index, interval)
+        has_bars = hi > lo
+        next_open = np.where(has_bars, self.open[lo], np.nan)
+
+        if model == 'next_open':
+            return next_open, next_open
+
+        if model == 'vwap':
+            volume = self._cum_volume[hi] - self._cum_volume[lo]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                vwap = (self._cum_value[hi] - self._cum_value[lo]) / volume
+            # 거래량이 없는 구간은 첫 하위 봉 시가
+            prices = np.where(volume > 0, vwap, next_open)
+            return prices, prices
+
+        # limit: 매수는 구간 저가가, 매도는 구간 고가가 지정가에 닿으면 체결
+        # (첫 하위 봉 시가가 이미 지정가를 넘어서 열리면 그 시가에 체결)
+        low = self._reduce(np.minimum, self.low, lo, hi)
+        high = self._reduce(np.maximum, self.high, lo, hi)
+        buy = np.where(has_bars & (low <= close), np.fmin(next_open, close), np.nan)
+        sell = np.where(has_bars & (high >= close), np.fmax(next_open, close), np.nan)
+        return buy, sell
+
+
+def load_sub_bars(source: ds.DataSource, ticker: str, index: pd.DatetimeIndex, interval: Union[str, int],
+                  cached: Optional[SubBarIndex] = None) -> SubBarIndex:
+    """index 봉들의 체결 구간을 덮는 하위 봉 인덱스 (cached 가 구간을 덮으면 그대로 사용)
+
+    조회한 하위 봉이 체결 구간을 덮지 않으면 ValueError (SubBarIndex.check_coverage).
+    """
+    step = ds.interval_to_timedelta(interval)
+    start = index[0] + step
+    end = index[-1] + 2 * step - pd.Timedelta(seconds=1)  # 마지막 체결 구간 끝 (포함)
+    if cached is not None and cached.covers(ticker, start, end):
+        return cached
+    sub_bars = SubBarIndex.load(source, ticker, start, end)
+    sub_bars.check_coverage(index, interval)
+    return sub_bars
@@ -0,0 +1,213 @@
+# Standard library imports
+import os
+import hashlib
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+
+# Third-party imports
+import pandas as pd
+import numpy as np
+
+# === Constants ===
+# Indicator Cache Configuration
+INDICATOR_CACHE_CONFIG = {
+    'MAX_BYTES': int(os.environ.get('INDICATOR_CACHE_MAX_BYTES', 256 * 1024 * 1024)),
+    # 디스크 저장 위치 (지정하지 않으면 메모리에만 저장)
+    'DIRECTORY': os.environ.get('INDICATOR_CACHE_DIR') or None
+}
+
+Arrays = Dict[str, np.ndarray]
+Compute = Callable[[], Mapping[str, np.ndarray]]
+
+
+def fingerprint(data: pd.DataFrame, columns: List[str]) -> str:
+    """인덱스와 입력 컬럼 값의 해시 (같은 구간의 같은 데이터면 같은 값)"""
+    hasher = hashlib.blake2b(digest_size=16)
+    index = data.index
+    hasher.update(str(index.dtype).encode())
+    hasher.update(np.ascontiguousarray(index.asi8 if hasattr(index, 'asi8') else index.to_numpy()))
+    for column in columns:
+        hasher.update(column.encode())
+        hasher.update(np.ascontiguousarray(data[column].to_numpy(dtype=np.float64)))
+    return hasher.hexdigest()
+
+
+@dataclass(frozen=True)
+class IndicatorKey:
+    """(종목, 주기, 데이터 해시, 지표 이름, 파라미터) 캐시 키"""
+    ticker: str
+    interval: str
+    data_hash: str
+    name: str
+    params: Tuple[Tuple[str, object], ...]
+
+    def digest(self) -> str:
+        """디스크 파일 이름용 키 해시"""
+        return hashlib.blake2b(repr(self).encode(), digest_size=16).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """캐시 조회 통계"""
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def requests(self) -> int:
+        return self.hits + self.disk_hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return (self.hits + self.disk_hits) / self.requests if self.requests else 0.0
+
+
+def _to_arrays(values: Mapping[str, np.ndarray]) -> Arrays:
+    return {name: np.asarray(value) for name, value in values.items()}
+
+
+def _copy_arrays(values: Arrays) -> Arrays:
+    # 호출한 쪽에서 결과를 수정해도 캐시 값이 바뀌지 않도록 복사본 반환
+    return {name: value.copy() for name, value in values.items()}
+
+
+class IndicatorCache:
+    """지표 계산 결과를 데이터 해시와 파라미터로 재사용하는 캐시
+
+    메모리는 최근 사용 순서(LRU)로 max_bytes 이내로 유지하고,
+    directory 를 지정하면 '{지표 이름}_{키 해시}.npz' 파일로 디스크에도 저장해 프로세스 간에 공유한다.
+    """
+    enabled = True
+
+    def __init__(self, max_bytes: int = INDICATOR_CACHE_CONFIG['MAX_BYTES'],
+                 directory: Optional[str] = INDICATOR_CACHE_CONFIG['DIRECTORY']):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.stats = CacheStats()
+        self._entries: 'OrderedDict[IndicatorKey, Arrays]' = OrderedDict()
+        self._sizes: Dict[IndicatorKey, int] = {}
+        self.memory_bytes = 0
+
+    @property
+    def entries(self) -> int:
+        """메모리에 저장된 항목 수"""
+        return len(self._entries)
+
+    def make_key(self, name: str, params: Mapping[str, object], data: pd.DataFrame,
+                 columns: List[str], ticker: str = '', interval: str = '') -> IndicatorKey:
+        return IndicatorKey(ticker, str(interval), fingerprint(data, columns),
+                            name, tuple(sorted(params.items())))
+
+    def get_or_compute(self, name: str, params: Mapping[str, object], data: pd.DataFrame,
+                       columns: List[str], compute: Compute,
+                       ticker: str = '', interval: str = '') -> Arrays:
+        """저장된 결과가 있으면 복사본을 반환하고, 없으면 compute() 로 계산해 저장
+
+        columns 는 지표 계산에 쓰이는 입력 컬럼이며 이 값과 인덱스로 데이터 해시를 만든다.
+        """
+        key = self.make_key(name, params, data, columns, ticker, interval)
+
+        values = self._entries.get(key)
+        if values is not None:
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return _copy_arrays(values)
+
+        values = self._load(key)
+        if values is not None:
+            self.stats.disk_hits += 1
+        else:
+            self.stats.misses += 1
+            values = _to_arrays(compute())
+            self._save(key, values)
+        self._store(key, values)
+        return _copy_arrays(values)
+
+    def _store(self, key: IndicatorKey, values: Arrays) -> None:
+        """메모리에 저장 후 한도를 넘으면 오래된 항목부터 제거"""
+        size = sum(value.nbytes for value in values.values())
+        if size > self.max_bytes:
+            return
+        self._entries[key] = values
+        self._sizes[key] = size
+        self.memory_bytes += size
+        while self.memory_bytes > self.max_bytes:
+            evicted, _ = self._entries.popitem(last=False)
+            self.memory_bytes -= self._sizes.pop(evicted)
+            self.stats.evictions += 1
+
+    def _path(self, key: IndicatorKey) -> str:
+        return os.path.join(self.directory, f"{key.name}_{key.digest()}.npz")
+
+    def _load(self, key: IndicatorKey) -> Optional[Arrays]:
+        """디스크에서 읽기 (파일이 없거나 손상되었으면 None)"""
+        if not self.directory:
+            return None
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with np.load(path) as stored:
+                return {name: stored[name] for name in stored.files}
+        except Exception as e:
+            logging.warning(f"지표 캐시 파일을 읽지 못했습니다: {path} - {str(e)}")
+            return None
+
+    def _save(self, key: IndicatorKey, values: Arrays) -> None:
+        """디스크에 저장 (임시 파일에 쓴 후 교체)"""
+        if not self.directory:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp.npz"
+        np.savez(tmp_path, **values)
+        os.replace(tmp_path, path)
+
+    def clear(self) -> None:
+        """메모리 항목과 통계 초기화 (디스크 파일은 유지)"""
+        self._entries.clear()
+        self._sizes.clear()
+        self.memory_bytes = 0
+        self.stats = CacheStats()
+
+    def log_stats(self) -> None:
+        """조회 통계 출력"""
+        logging.info(f"지표 캐시: 적중 {self.stats.hits}회, 디스크 적중 {self.stats.disk_hits}회, "
+                     f"계산 {self.stats.misses}회 (적중률 {self.stats.hit_rate:.1%}), "
+                     f"제거 {self.stats.evictions}회, 메모리 {self.entries}개 항목 "
+                     f"{self.memory_bytes / (1024 * 1024):.1f}MB")
+
+
+class NullIndicatorCache:
+    """저장하지 않고 매번 계산하는 캐시 (벤치마크 등 계산 시간을 재야 할 때 사용)"""
+    enabled = False
+
+    def __init__(self):
+        self.stats = CacheStats()
+
+    def get_or_compute(self, name: str, params: Mapping[str, object], data: pd.DataFrame,
+                       columns: List[str], compute: Compute,
+                       ticker: str = '', interval: str = '') -> Arrays:
+        return _to_arrays(compute())
+
+    def clear(self) -> None:
+        pass
+
+    def log_stats(self) -> None:
+        pass
+
+
+NULL_CACHE = NullIndicatorCache()
+
+_default_cache: Optional[IndicatorCache] = None
+
+
+def get_default_cache() -> IndicatorCache:
+    """INDICATOR_CACHE_CONFIG 설정을 사용하는 기본 캐시"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = IndicatorCache()
+    return _default_cache
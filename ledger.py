@@ -0,0 +1,171 @@
+# Standard library imports
+from decimal import Decimal
+from typing import Dict, List, Union
+
+# Third-party imports
+import numpy as np
+
+# === Constants ===
+# 고정소수점 배율 (KRW 금액/가격, 코인 수량, 비율 모두 소수점 8자리)
+AMOUNT_SCALE = 10 ** 8
+QUANTITY_SCALE = 10 ** 8
+RATE_SCALE = 10 ** 8
+# 거래 기록(int64)의 KRW 총액/수수료 배율 (0.0001원 단위, 약 9.2e14 원까지 기록 가능)
+TRADE_AMOUNT_SCALE = 10 ** 4
+INT64_MAX = np.iinfo(np.int64).max
+
+Amount = Union[Decimal, int]
+
+
+def scale_decimal(value: Decimal, scale: int) -> int:
+    """Decimal 값을 scale 배율 정수로 반올림"""
+    return int((value * scale).to_integral_value())
+
+
+class DecimalLedger:
+    """Decimal 기반 거래 계산 (감사용 기준 구현)"""
+    name = 'decimal'
+
+    def __init__(self, fee_rate: Decimal):
+        self.fee_rate = fee_rate
+
+    def from_decimal(self, value: Decimal) -> Decimal:
+        """Decimal 값을 내부 표현으로 변환"""
+        return value
+
+    def to_decimal(self, value: Decimal) -> Decimal:
+        """내부 표현을 Decimal 로 변환"""
+        return value
+
+    def to_float(self, value: Decimal) -> float:
+        """내부 표현을 float 로 변환"""
+        return float(value)
+
+    def quantity_to_decimal(self, quantity: Decimal) -> Decimal:
+        """내부 수량 표현을 Decimal 로 변환"""
+        return quantity
+
+    def to_fixed(self, value: Decimal) -> int:
+        """가격을 AMOUNT_SCALE 배율 정수로 변환 (거래 기록용)"""
+        return scale_decimal(value, AMOUNT_SCALE)
+
+    def to_trade_amount(self, value: Decimal) -> int:
+        """KRW 총액/수수료를 TRADE_AMOUNT_SCALE 배율 정수로 변환 (거래 기록용)"""
+        return scale_decimal(value, TRADE_AMOUNT_SCALE)
+
+    def quantity_to_fixed(self, quantity: Decimal) -> int:
+        """수량을 QUANTITY_SCALE 배율 정수로 변환 (거래 기록용)"""
+        return scale_decimal(quantity, QUANTITY_SCALE)
+
+    def zero(self) -> Decimal:
+        return Decimal('0')
+
+    def prices(self, close: np.ndarray) -> List[Decimal]:
+        """종가 배열을 가격 목록으로 변환"""
+        return [Decimal(str(price)) for price in close]
+
+    def price(self, close: float) -> Decimal:
+        """종가를 가격으로 변환"""
+        return Decimal(str(close))
+
+    def is_above_rate(self, base: Decimal, rate: Decimal, price: Decimal) -> bool:
+        """base * rate < price"""
+        return base * rate < price
+
+    def is_below_rate(self, base: Decimal, rate: Decimal, price: Decimal) -> bool:
+        """base * rate > price"""
+        return base * rate > price
+
+    def buy_quantity(self, balance: Decimal, price: Decimal) -> Decimal:
+        """잔고로 살 수 있는 정수 단위 수량"""
+        return Decimal(str(int(balance / price)))
+
+    def trade_amount(self, price: Decimal, quantity: Decimal) -> Decimal:
+        """거래 금액"""
+        return price * quantity
+
+    def trade_fee(self, amount: Decimal) -> Decimal:
+        """거래 수수료"""
+        return amount * self.fee_rate
+
+
+class FixedPointLedger:
+    """정수 고정소수점 기반 거래 계산
+
+    KRW 금액과 가격은 AMOUNT_SCALE, 코인 수량은 QUANTITY_SCALE 배율의 정수로 표현한다.
+    봉마다 Decimal 을 만들지 않으므로 Decimal 계산보다 빠르며,
+    거래 횟수와 수수료는 원 단위까지 Decimal 계산과 같다.
+    """
+    name = 'fixed'
+
+    def __init__(self, fee_rate: Decimal):
+        self._rates: Dict[Decimal, int] = {}
+        self.fee_rate = self._scale_rate(fee_rate)
+
+    def _scale_rate(self, rate: Decimal) -> int:
+        """비율을 RATE_SCALE 배율 정수로 변환 (설정값은 몇 개뿐이므로 캐시)"""
+        scaled = self._rates.get(rate)
+        if scaled is None:
+            scaled = self._rates[rate] = int(rate * RATE_SCALE)
+        return scaled
+
+    def from_decimal(self, value: Decimal) -> int:
+        return int(value * AMOUNT_SCALE)
+
+    def to_decimal(self, value: int) -> Decimal:
+        return Decimal(value) / AMOUNT_SCALE
+
+    def to_float(self, value: int) -> float:
+        return value / AMOUNT_SCALE
+
+    def quantity_to_decimal(self, quantity: int) -> Decimal:
+        return Decimal(quantity) / QUANTITY_SCALE
+
+    def to_fixed(self, value: int) -> int:
+        return value
+
+    def to_trade_amount(self, value: int) -> int:
+        # 반올림
+        return (value * TRADE_AMOUNT_SCALE + AMOUNT_SCALE // 2) // AMOUNT_SCALE
+
+    def quantity_to_fixed(self, quantity: int) -> int:
+        return quantity
+
+    def zero(self) -> int:
+        return 0
+
+    def prices(self, close: np.ndarray) -> List[int]:
+        # int64 배열로 한 번에 변환한 뒤 Python 정수 목록으로 꺼냄
+        return np.rint(np.asarray(close, dtype=np.float64) * AMOUNT_SCALE).astype(np.int64).tolist()
+
+    def price(self, close: float) -> int:
+        return int(round(float(close) * AMOUNT_SCALE))
+
+    def is_above_rate(self, base: int, rate: Decimal, price: int) -> bool:
+        return base * self._scale_rate(rate) < price * RATE_SCALE
+
+    def is_below_rate(self, base: int, rate: Decimal, price: int) -> bool:
+        return base * self._scale_rate(rate) > price * RATE_SCALE
+
+    def buy_quantity(self, balance: int, price: int) -> int:
+        return balance // price * QUANTITY_SCALE
+
+    def trade_amount(self, price: int, quantity: int) -> int:
+        return price * quantity // QUANTITY_SCALE
+
+    def trade_fee(self, amount: int) -> int:
+        # 반올림
+        return (amount * self.fee_rate + RATE_SCALE // 2) // RATE_SCALE
+
+
+LEDGERS = {
+    'decimal': DecimalLedger,
+    'fixed': FixedPointLedger
+}
+
+
+def create_ledger(name: str, fee_rate: Decimal) -> Union[DecimalLedger, FixedPointLedger]:
+    """이름으로 거래 계산 방식 생성 ('decimal', 'fixed')"""
+    if name not in LEDGERS:
+        raise ValueError(f"알 수 없는 계산 방식입니다: {name}")
+    return LEDGERS[name](fee_rate)
@@ -1,11 +1,14 @@
 # Standard library imports
+import os
 import sys
 import logging
-from dataclasses import dataclass
+import argparse
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import List, Dict, Optional, Union, Tuple
 from calendar import monthrange
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dateutil.relativedelta import relativedelta
 
 # Third-party imports
@@ -15,6 +18,15 @@ import numpy as np
 # Local imports
 import tick_db as db
 import rsi_sample as dw
+import data_source as ds
+import ledger as lg
+import profiling as pf
+import results_sink as rs
+import indicator_cache as ic
+import metrics as mx
+import results_store as rst
+import strategies as st
+import fills as fl
 
 # === Constants ===
 # Date and Time Constants
@@ -24,6 +36,7 @@ INITIAL_DATE = '2017-01-01 00:00:00'
 
 # Trading Constants
 DEFAULT_WINDOW_SIZE = 20
+WARMUP_BARS = 200  # 연속 실행 시 첫 기간 앞에 추가로 불러오는 지표 준비용 봉 수
 ELLIOTT_WAVE_PATTERN_LENGTH = 5
 EXPECTED_WAVE_PATTERN = ['up', 'down', 'up', 'down', 'up']
 
@@ -39,6 +52,15 @@ RSI_PERIODS = {
     'NEUTRAL': 50
 }
 
+SMA_WINDOW_SIZE = 14
+
+# 엘리어트 신호 강도 기준
+SIGNAL_STRENGTH_THRESHOLDS = {
+    'STRONG': 50,  # 단독으로 매수/매도
+    'COMBINED': 30,  # 기본 가격 조건과 결합
+    'BASIC': 40  # RSI 없이 엘리어트 분석만으로 거래
+}
+
 PRICE_CHANGE_RATES = {
     'MIN': Decimal('1.01'),
     'MAX': Decimal('1.01')
@@ -52,6 +74,30 @@ FIBONACCI_LEVELS = {
     'LEVEL_618': Decimal('0.618'),
     'LEVEL_786': Decimal('0.786')
 }
+FIBONACCI_TOLERANCE = Decimal('0.01')  # 피보나치 수준 허용 범위 (가격 범위 대비)
+FIBONACCI_LOOKBACK_PERIOD = 20
+WAVE_STRENGTH_LENGTH = 5
+NO_ORDER_PRICE = -1.0  # 주문이 없는 봉의 주문가
+NO_DATA_ERROR = '데이터 없음'  # 기간에 봉이 없을 때 (상장 전 등) 의 결과 메시지
+INITIAL_TRADE_CAPACITY = 64
+TRADE_TYPES = {'BUY': 1, 'SELL': -1}
+BUY_FILL, SELL_FILL = 0, 1  # fills.FillPrices 위치
+# 거래 내역 구조화 배열 (가격은 AMOUNT_SCALE, 수량은 QUANTITY_SCALE, 총액/수수료는 TRADE_AMOUNT_SCALE 배율 정수)
+TRADE_DTYPE = np.dtype([
+    ('timestamp', 'datetime64[ns]'),
+    ('type', np.int8),
+    ('price', np.int64),
+    ('quantity', np.int64),
+    ('total_amount', np.int64),
+    ('fee', np.int64)
+])
+BAR_SIGNAL_COLUMNS = ['rsi_k', 'rsi_d', 'signal', 'buy_signal_strength', 'sell_signal_strength']
+ELLIOTT_SIGNAL_COLUMNS = [
+    'wave_up', 'elliott_buy', 'elliott_sell',
+    'wave_strength', 'wave_direction', 'wave_volatility',
+    'at_fibonacci', 'fibonacci_level', 'support_resistance',
+    'buy_signal_strength', 'sell_signal_strength'
+]
 
 # Display Configuration
 CHART_CONFIG = {
@@ -63,8 +109,9 @@ CHART_CONFIG = {
 # Logging Configuration
 LOG_CONFIG = {
     'FORMAT': '%(message)s',
-    # 'LEVEL': logging.INFO
-    'LEVEL': logging.DEBUG
+    'LEVEL': logging.INFO,
+    # 'LEVEL': logging.DEBUG,  # 거래별 상세 로그 (느림)
+    'PERIOD_SUMMARY': True  # 기간별 계좌 요약 출력 (대량 스윕에서는 False 권장)
 }
 
 # 설정
@@ -82,7 +129,13 @@ TRADING_CONFIG = {
         # 2018: [3, 6, 9, 12],  # 분기별 테스트
         # 2019: [6, 12],  # 반기별 테스트
         # 2020: [12]  # 연간 테스트
-    }
+    },
+    'max_workers': None,  # 병렬 작업 프로세스 수 (None: CPU 수, 1: 순차 실행)
+    'continuous_run': False,  # 이어진 기간을 한 번에 불러와 지표 계산 후 기간별로 나누어 실행
+    'profile_dir': None,  # 작업별 단계 프로파일(JSON) 저장 디렉터리 (None: 측정 안 함)
+    'results_dir': None,  # 작업별 거래 내역/기간 요약 레코드 저장 디렉터리 (None: 저장 안 함)
+    'results_format': 'jsonl',  # 'jsonl' 또는 'parquet'
+    'results_store': None  # 기간별 결과 SQLite 파일 (지정하면 저장된 기간은 건너뛰고 이어서 실행)
 }
 
 
@@ -97,18 +150,25 @@ class TradingConfig:
     RSI_OVERBOUGHT: int = RSI_PERIODS['OVERBOUGHT']
     DISPLAY_CHART: bool = CHART_CONFIG['DISPLAY_ENABLED']
     TRADING_FEE: Decimal = TRADING_FEE_RATE
+    ACCOUNTING_BACKEND: str = 'decimal'  # 'decimal' (감사용) 또는 'fixed' (정수 고정소수점)
+    SMA_WINDOW: int = SMA_WINDOW_SIZE
+    STRONG_SIGNAL_STRENGTH: int = SIGNAL_STRENGTH_THRESHOLDS['STRONG']
+    COMBINED_SIGNAL_STRENGTH: int = SIGNAL_STRENGTH_THRESHOLDS['COMBINED']
+    BASIC_SIGNAL_STRENGTH: int = SIGNAL_STRENGTH_THRESHOLDS['BASIC']
+    STRATEGY: str = 'rsi_elliott'  # strategies.STRATEGIES 이름 ('rsi_elliott': 벡터화, 'rsi_elliott_bar': 봉 단위)
+    FILL_MODEL: str = 'close'  # fills.FILL_MODELS ('close': 신호 봉 종가, 'next_open'/'vwap'/'limit': 1분 하위 봉 체결)
 
 
 @dataclass
 class TradingState:
-    """거래 상태를 추적하기 위한 데이터 클래스"""
-    balance: Decimal
-    coin_quantity: Decimal
-    min_price: Decimal
-    max_price: Decimal
-    start_price: Decimal
-    end_price: Decimal
-    total_fee: Decimal = Decimal('0')
+    """거래 상태를 추적하기 위한 데이터 클래스 (금액 표현은 ledger 방식에 따름)"""
+    balance: lg.Amount
+    coin_quantity: lg.Amount
+    min_price: lg.Amount
+    max_price: lg.Amount
+    start_price: lg.Amount
+    end_price: lg.Amount
+    total_fee: lg.Amount = Decimal('0')
     trade_count: int = 0
 
 
@@ -130,6 +190,19 @@ class PeriodResult:
     coin_change_rate: float
     start_price: float
     end_price: float
+    equity: Optional[mx.EquityCurve] = field(default=None, repr=False)
+    trades: Optional[np.ndarray] = field(default=None, repr=False)  # TRADE_DTYPE 거래 내역
+    error: Optional[str] = None  # 오류로 채운 결과이면 오류 메시지
+
+    @property
+    def failed(self) -> bool:
+        """예외로 채운 결과인지 여부 (데이터가 없는 기간은 완료된 빈 결과로 보고 결과 저장소에 저장)"""
+        return self.error is not None and self.error != NO_DATA_ERROR
+
+    @property
+    def metrics(self) -> Optional[mx.RiskMetrics]:
+        """평가금액 곡선의 위험/성과 지표 (곡선이 없으면 None)"""
+        return mx.compute_metrics(self.equity) if self.equity is not None else None
 
 
 class TradingPeriod:
@@ -141,31 +214,185 @@ class TradingPeriod:
 
 
 class TradingResult:
-    """거래 결과를 저장하고 관리하는 클래스"""
-
-    def __init__(self):
-        self.buy_orders: List[float] = []
-        self.sell_orders: List[float] = []
-        self.trades: List[TradeInfo] = []
-        self.profit_history: List[Tuple[datetime, Decimal]] = []
+    """거래 결과를 저장하고 관리하는 클래스
+
+    봉별 주문가는 봉 수만큼 미리 할당한 NumPy 배열에, 거래 내역은 고정소수점 정수
+    (TRADE_DTYPE) 구조화 배열에 기록한다.
+    봉 수가 늘어도 Python 객체가 쌓이지 않아 메모리 사용량이 일정하다.
+    exact_trades 이면 add_trade 로 받은 Decimal 거래 기록도 그대로 보관한다 (Decimal 계산 방식의 감사용).
+    """
+
+    def __init__(self, capacity: int = 0, exact_trades: bool = False):
+        self._buy_orders = np.full(capacity, NO_ORDER_PRICE)
+        self._sell_orders = np.full(capacity, NO_ORDER_PRICE)
+        self._order_count = 0
+        self._trades = np.zeros(INITIAL_TRADE_CAPACITY, dtype=TRADE_DTYPE)
+        self._trade_count = 0
+        self._exact_trades: Optional[List[TradeInfo]] = [] if exact_trades else None
+
+    def reserve(self, capacity: int) -> None:
+        """봉별 주문 배열을 capacity 크기 이상으로 확보"""
+        if capacity <= len(self._buy_orders):
+            return
+        buy_orders = np.full(capacity, NO_ORDER_PRICE)
+        sell_orders = np.full(capacity, NO_ORDER_PRICE)
+        buy_orders[:self._order_count] = self._buy_orders[:self._order_count]
+        sell_orders[:self._order_count] = self._sell_orders[:self._order_count]
+        self._buy_orders, self._sell_orders = buy_orders, sell_orders
+
+    def add_order(self, buy_price: float = NO_ORDER_PRICE, sell_price: float = NO_ORDER_PRICE) -> None:
+        """봉별 주문가 기록 (주문이 없으면 -1)"""
+        if self._order_count == len(self._buy_orders):
+            self.reserve(max(2 * self._order_count, 16))
+        # 배열이 -1 로 초기화되어 있으므로 주문이 있을 때만 기록
+        if buy_price != NO_ORDER_PRICE:
+            self._buy_orders[self._order_count] = buy_price
+        if sell_price != NO_ORDER_PRICE:
+            self._sell_orders[self._order_count] = sell_price
+        self._order_count += 1
+
+    def skip_orders(self, count: int) -> None:
+        """주문이 없는 봉 count 개를 한 번에 기록"""
+        if count <= 0:
+            return
+        self.reserve(self._order_count + count)
+        self._order_count += count
+
+    @property
+    def order_count(self) -> int:
+        return self._order_count
+
+    @property
+    def buy_orders(self) -> np.ndarray:
+        return self._buy_orders[:self._order_count]
+
+    @property
+    def sell_orders(self) -> np.ndarray:
+        return self._sell_orders[:self._order_count]
+
+    def record_trade(self, timestamp: datetime, trade_type: str, price: int,
+                     quantity: int, total_amount: int, fee: int) -> None:
+        """거래 기록 추가 (금액/수량은 고정소수점 정수)"""
+        for name, value in (('가격', price), ('수량', quantity), ('총액', total_amount), ('수수료', fee)):
+            if abs(value) > lg.INT64_MAX:
+                raise ValueError(f"거래 기록 범위(int64)를 넘는 {name}입니다: {value} "
+                                 f"(총액/수수료는 약 {lg.INT64_MAX // lg.TRADE_AMOUNT_SCALE:.2e} 원까지)")
+        if self._trade_count == len(self._trades):
+            self._trades = np.resize(self._trades, 2 * len(self._trades))
+        self._trades[self._trade_count] = (
+            np.datetime64(pd.Timestamp(timestamp).value, 'ns'),
+            TRADE_TYPES[trade_type],
+            price, quantity, total_amount, fee
+        )
+        self._trade_count += 1
 
     def add_trade(self, trade: TradeInfo) -> None:
-        """거래 기록 추가"""
-        self.trades.append(trade)
-
-    def add_profit_point(self, timestamp: datetime, profit: Decimal) -> None:
-        """수익률 포인트 추가"""
-        self.profit_history.append((timestamp, profit))
+        """Decimal 거래 기록 추가 (exact_trades 이면 원래 값도 보관)"""
+        self.record_trade(trade.timestamp, trade.type,
+                          lg.scale_decimal(trade.price, lg.AMOUNT_SCALE),
+                          lg.scale_decimal(trade.quantity, lg.QUANTITY_SCALE),
+                          lg.scale_decimal(trade.total_amount, lg.TRADE_AMOUNT_SCALE),
+                          lg.scale_decimal(trade.fee, lg.TRADE_AMOUNT_SCALE))
+        if self._exact_trades is not None:
+            self._exact_trades.append(trade)
+
+    @property
+    def trade_records(self) -> np.ndarray:
+        """거래 내역 구조화 배열"""
+        return self._trades[:self._trade_count]
+
+    @property
+    def trades(self) -> List[TradeInfo]:
+        """거래 내역 (Decimal TradeInfo 목록, exact_trades 가 아니면 필요할 때 정수 기록에서 생성)"""
+        if self._exact_trades is not None:
+            return list(self._exact_trades)
+        trade_types = {code: name for name, code in TRADE_TYPES.items()}
+        return [TradeInfo(
+            timestamp=pd.Timestamp(record['timestamp']),
+            type=trade_types[int(record['type'])],
+            price=Decimal(int(record['price'])) / lg.AMOUNT_SCALE,
+            quantity=Decimal(int(record['quantity'])) / lg.QUANTITY_SCALE,
+            total_amount=Decimal(int(record['total_amount'])) / lg.TRADE_AMOUNT_SCALE,
+            fee=Decimal(int(record['fee'])) / lg.TRADE_AMOUNT_SCALE
+        ) for record in self.trade_records]
+
+    def trades_frame(self) -> pd.DataFrame:
+        """거래 내역 DataFrame"""
+        records = self.trade_records
+        trade_types = {code: name for name, code in TRADE_TYPES.items()}
+        return pd.DataFrame({
+            'type': [trade_types[int(code)] for code in records['type']],
+            'price': records['price'] / lg.AMOUNT_SCALE,
+            'quantity': records['quantity'] / lg.QUANTITY_SCALE,
+            'total_amount': records['total_amount'] / lg.TRADE_AMOUNT_SCALE,
+            'fee': records['fee'] / lg.TRADE_AMOUNT_SCALE
+        }, index=pd.DatetimeIndex(records['timestamp'], name='timestamp'))
+
+    def orders_frame(self, index: pd.Index) -> pd.DataFrame:
+        """봉 인덱스에 맞춘 buy_order/sell_order DataFrame (rsi_sample.display_rsi 용)
+
+        마지막 봉 이후의 기록(미체결 코인 청산)은 마지막 봉에 합친다.
+        """
+        bars = len(index)
+        buy_orders = np.full(bars, NO_ORDER_PRICE)
+        sell_orders = np.full(bars, NO_ORDER_PRICE)
+        count = min(self._order_count, bars)
+        buy_orders[:count] = self._buy_orders[:count]
+        sell_orders[:count] = self._sell_orders[:count]
+        if bars and self._order_count > bars:
+            extra_buy = self._buy_orders[bars:self._order_count]
+            extra_sell = self._sell_orders[bars:self._order_count]
+            if (extra_buy != NO_ORDER_PRICE).any():
+                buy_orders[-1] = extra_buy[extra_buy != NO_ORDER_PRICE][-1]
+            if (extra_sell != NO_ORDER_PRICE).any():
+                sell_orders[-1] = extra_sell[extra_sell != NO_ORDER_PRICE][-1]
+        return pd.DataFrame({'buy_order': buy_orders, 'sell_order': sell_orders}, index=index)
+
+    def equity_curve(self, index: pd.Index, close: np.ndarray, initial_balance: float,
+                     periods_per_year: float) -> mx.EquityCurve:
+        """거래 내역으로 봉별 평가금액 계산
+
+        거래를 해당 봉에 모아 현금/수량 변화를 누적합으로 구하므로 봉 단위 반복이 없다.
+        마지막 봉 이후의 기록(미체결 코인 청산)은 마지막 봉에 합친다.
+        """
+        bars = len(index)
+        records = self.trade_records
+        times = np.asarray(index.values, dtype='datetime64[ns]')
+        bar = np.clip(times.searchsorted(records['timestamp'], side='right') - 1, 0, max(bars - 1, 0))
+
+        # 매수: 현금 -(총액 + 수수료), 수량 +, 매도: 현금 +(총액 - 수수료), 수량 -
+        side = np.sign(records['type'])
+        cash_change = -side * records['total_amount'] - records['fee']
+        quantity_change = side * records['quantity']
+        cash = np.zeros(bars, dtype=np.int64)
+        quantity = np.zeros(bars, dtype=np.int64)
+        np.add.at(cash, bar, cash_change)
+        np.add.at(quantity, bar, quantity_change)
+        cash = round(initial_balance * lg.TRADE_AMOUNT_SCALE) + np.cumsum(cash)
+        quantity = np.cumsum(quantity)
+
+        return mx.EquityCurve(
+            equity=cash / lg.TRADE_AMOUNT_SCALE + quantity / lg.QUANTITY_SCALE * close,
+            in_market=quantity > 0,
+            # 거래가 많으면 정수 합계가 int64 를 넘을 수 있어 float 로 합산
+            traded_value=float(records['total_amount'].sum(dtype=np.float64) / lg.TRADE_AMOUNT_SCALE),
+            initial_balance=initial_balance,
+            periods_per_year=periods_per_year
+        )
 
 
 # === Utility Functions ===
 def setup_logging() -> None:
-    """로깅 설정 초기화"""
+    """로깅 설정 초기화 (여러 번 호출해도 핸들러는 한 번만 추가)"""
+    logger = logging.getLogger()
+    logger.setLevel(LOG_CONFIG['LEVEL'])
+    if any(getattr(handler, '_backtest_handler', False) for handler in logger.handlers):
+        return
+
     ch = logging.StreamHandler(sys.stdout)
     ch.setFormatter(logging.Formatter(LOG_CONFIG['FORMAT']))
-    logger = logging.getLogger()
+    ch._backtest_handler = True
     logger.addHandler(ch)
-    logger.setLevel(LOG_CONFIG['LEVEL'])
 
 
 def calculate_trade_fee(amount: Decimal) -> Decimal:
@@ -198,6 +425,26 @@ def get_selected_periods(config: Dict) -> List[TradingPeriod]:
     return sorted(periods, key=lambda x: (x.year, x.month))
 
 
+def group_contiguous_periods(periods: List, interval: str) -> List[List[int]]:
+    """start/end 를 가진 기간들을 한 번에 조회할 이어진 구간끼리 묶은 인덱스 목록 (시작 시각 순)
+
+    다음 기간의 워밍업(WARMUP_BARS 개 봉) 시작이 앞 구간 끝 이전이면 같은 구간으로 묶는다.
+    떨어진 기간(예: 2018-01, 2022-01)은 각자 워밍업과 함께 따로 조회해 사이의 봉을 불러오지 않는다.
+    """
+    warmup = ds.interval_to_timedelta(interval) * WARMUP_BARS
+    spans: List[List[int]] = []
+    span_end = None
+    for number in sorted(range(len(periods)), key=lambda number: periods[number].start):
+        period = periods[number]
+        if spans and period.start - warmup <= span_end:
+            spans[-1].append(number)
+            span_end = max(span_end, period.end)
+        else:
+            spans.append([number])
+            span_end = period.end
+    return spans
+
+
 def format_month_name(month: int) -> str:
     """월 이름 포맷팅"""
     return {
@@ -370,7 +617,7 @@ def check_elliott_sell_pattern(data: pd.DataFrame, index: int) -> tuple:
         return False, f"Error in Elliott sell pattern analysis: {str(e)}"
 
 
-def analyze_wave_strength(data: pd.DataFrame, index: int, wave_length: int = 5) -> Dict:
+def analyze_wave_strength(data: pd.DataFrame, index: int, wave_length: int = WAVE_STRENGTH_LENGTH) -> Dict:
     """파동 강도 분석"""
     if index < wave_length:
         return {'strength': 0, 'direction': 'neutral', 'volatility': 0}
@@ -407,7 +654,8 @@ def analyze_wave_strength(data: pd.DataFrame, index: int, wave_length: int = 5)
         return {'strength': 0, 'direction': 'neutral', 'volatility': 0, 'error': str(e)}
 
 
-def check_fibonacci_levels(data: pd.DataFrame, index: int, lookback_period: int = 20) -> Dict:
+def check_fibonacci_levels(data: pd.DataFrame, index: int,
+                           lookback_period: int = FIBONACCI_LOOKBACK_PERIOD) -> Dict:
     """피보나치 되돌림 수준 확인"""
     if index < lookback_period:
         return {'at_fibonacci_level': False, 'level': None, 'support_resistance': None}
@@ -431,7 +679,7 @@ def check_fibonacci_levels(data: pd.DataFrame, index: int, lookback_period: int
             fibonacci_levels[level_name] = float(fib_price)
 
         # 현재 가격이 피보나치 수준 근처에 있는지 확인 (±1% 허용)
-        tolerance = price_range * Decimal('0.01')  # 1% 허용 범위
+        tolerance = price_range * FIBONACCI_TOLERANCE  # 1% 허용 범위
 
         for level_name, fib_price in fibonacci_levels.items():
             if abs(current_price - fib_price) <= float(tolerance):
@@ -510,22 +758,173 @@ def enhanced_elliott_analysis(data: pd.DataFrame, index: int) -> Dict:
     return combined_signal
 
 
+def _elliott_components(close: np.ndarray,
+                        wave_length: int = WAVE_STRENGTH_LENGTH,
+                        lookback_period: int = FIBONACCI_LOOKBACK_PERIOD) -> Dict[str, np.ndarray]:
+    """엘리어트 파동 분석의 수치 배열 계산
+
+    close 는 (봉,) 또는 (봉, 경로) 배열이며 모든 계산은 봉 축(axis 0)을 따라 수행한다.
+    피보나치 수준은 FIBONACCI_LEVELS 순서의 번호(-1: 없음)로, 지지/저항은 불리언으로 반환한다.
+    """
+    n = close.shape[0]
+    pattern_length = ELLIOTT_WAVE_PATTERN_LENGTH
+
+    # 봉별 가격 변동 방향 (직전 봉 대비 상승 여부)
+    wave_up = np.zeros(close.shape, dtype=bool)
+    wave_up[1:] = close[1:] > close[:-1]
+
+    # 엘리어트 매수/매도 패턴
+    elliott_pattern = np.zeros(close.shape, dtype=bool)
+    trend_reversal = np.zeros(close.shape, dtype=bool)
+    if n > pattern_length:
+        matched = np.ones((n - pattern_length,) + close.shape[1:], dtype=bool)
+        for offset, expected in enumerate(EXPECTED_WAVE_PATTERN):
+            window = wave_up[offset + 1:n - pattern_length + offset + 1]
+            matched &= window if expected == 'up' else ~window
+        elliott_pattern[pattern_length:] = matched
+
+        # 연속 상승 후 하락
+        trend_reversal[pattern_length:] = (wave_up[pattern_length - 2:-2] &
+                                           wave_up[pattern_length - 1:-1] &
+                                           ~wave_up[pattern_length:])
+
+    # 파동 강도 분석
+    wave_strength = np.zeros(close.shape, dtype=np.float64)
+    wave_volatility = np.zeros(close.shape, dtype=np.float64)
+    total_change_rate = np.full(close.shape, np.nan)
+    if n > wave_length and wave_length > 1:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            change_rate = np.abs(close[1:] - close[:-1]) / close[:-1] * 100
+            # sum() 과 같은 순서로 누적해 부동소수점 결과를 일치시킴
+            change_sum = np.zeros((n - wave_length,) + close.shape[1:], dtype=np.float64)
+            for offset in range(wave_length - 1):
+                change_sum = change_sum + change_rate[offset + 1:n - wave_length + offset + 1]
+            volatility = change_sum / (wave_length - 1)
+
+            first = close[1:n - wave_length + 1]
+            total_change = (close[wave_length:] - first) / first * 100
+            wave_volatility[wave_length:] = volatility
+            total_change_rate[wave_length:] = total_change
+            wave_strength[wave_length:] = volatility * (1 + np.abs(total_change) / 100)
+
+    # 피보나치 되돌림 수준
+    # check_fibonacci_levels 는 float 가격에 Decimal 비율을 곱하다 TypeError 로 항상 실패하므로
+    # 결과를 그대로 맞추기 위해 피보나치 수준 일치는 없는 것으로 둔다
+    at_fibonacci = np.zeros(close.shape, dtype=bool)
+    fibonacci_level = np.full(close.shape, -1, dtype=np.int64)
+    at_support = np.zeros(close.shape, dtype=bool)
+
+    # 매수/매도 신호 강도
+    strong_wave = wave_strength > 2
+    elliott_buy = elliott_pattern
+    elliott_sell = elliott_pattern | trend_reversal
+    buy_signal_strength = (30 * elliott_buy +
+                           20 * (strong_wave & (total_change_rate > 0)) +
+                           15 * (at_fibonacci & at_support))
+    sell_signal_strength = (30 * elliott_sell +
+                            20 * (strong_wave & (total_change_rate < 0)) +
+                            15 * (at_fibonacci & ~at_support))
+
+    return {
+        'wave_up': wave_up,
+        'elliott_buy': elliott_buy,
+        'elliott_sell': elliott_sell,
+        'wave_strength': wave_strength,
+        'total_change_rate': total_change_rate,
+        'wave_volatility': wave_volatility,
+        'at_fibonacci': at_fibonacci,
+        'fibonacci_level': fibonacci_level,
+        'at_support': at_support,
+        'buy_signal_strength': buy_signal_strength.astype(np.int64),
+        'sell_signal_strength': sell_signal_strength.astype(np.int64)
+    }
+
+
+def precompute_elliott_signal_strength(close: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """(봉, 경로) 종가 배열의 엘리어트 매수/매도 신호 강도를 한 번에 계산"""
+    components = _elliott_components(np.asarray(close, dtype=np.float64))
+    return components['buy_signal_strength'], components['sell_signal_strength']
+
+
+def precompute_elliott_analysis(data: pd.DataFrame,
+                                wave_length: int = WAVE_STRENGTH_LENGTH,
+                                lookback_period: int = FIBONACCI_LOOKBACK_PERIOD,
+                                ticker: str = '', interval: str = '',
+                                cache: Optional[ic.IndicatorCache] = None) -> pd.DataFrame:
+    """전체 구간 엘리어트 파동 분석 일괄 계산 (enhanced_elliott_analysis 와 동일한 결과)
+
+    각 봉마다 구간을 다시 분석하는 대신 NumPy 배열 연산으로 모든 봉의 결과를 한 번에 계산한다.
+    수치 배열은 지표 캐시에 저장해 같은 종가 데이터에서 재사용한다. 종가에 결측치가 없다고 가정한다.
+    """
+    cache = cache or ic.get_default_cache()
+    components = cache.get_or_compute(
+        'elliott', {'wave_length': wave_length, 'lookback_period': lookback_period}, data, ['close'],
+        lambda: _elliott_components(data['close'].to_numpy(dtype=np.float64), wave_length, lookback_period),
+        ticker, interval)
+    n = len(data)
+
+    total_change_rate = components['total_change_rate']
+    wave_direction = np.full(n, 'neutral', dtype=object)
+    wave_direction[total_change_rate > 0] = 'up'
+    wave_direction[total_change_rate < 0] = 'down'
+
+    at_fibonacci = components['at_fibonacci']
+    level_names = np.array([None] + list(FIBONACCI_LEVELS), dtype=object)
+    fibonacci_level = level_names[components['fibonacci_level'] + 1]
+    support_resistance = np.full(n, None, dtype=object)
+    support_resistance[at_fibonacci & components['at_support']] = 'support'
+    support_resistance[at_fibonacci & ~components['at_support']] = 'resistance'
+
+    # 문자열/None 컬럼은 enhanced_elliott_analysis 의 값과 같도록 object 타입으로 유지
+    return pd.DataFrame({
+        'wave_up': components['wave_up'],
+        'elliott_buy': components['elliott_buy'],
+        'elliott_sell': components['elliott_sell'],
+        'wave_strength': components['wave_strength'],
+        'wave_direction': pd.Series(wave_direction, index=data.index, dtype=object),
+        'wave_volatility': components['wave_volatility'],
+        'at_fibonacci': at_fibonacci,
+        'fibonacci_level': pd.Series(fibonacci_level, index=data.index, dtype=object),
+        'support_resistance': pd.Series(support_resistance, index=data.index, dtype=object),
+        'buy_signal_strength': components['buy_signal_strength'],
+        'sell_signal_strength': components['sell_signal_strength'],
+    }, index=data.index)
+
+
+def get_elliott_signal_strength(data: pd.DataFrame, index: int, column: str) -> int:
+    """엘리어트 신호 강도 조회 (사전 계산된 컬럼이 없으면 해당 봉만 분석)"""
+    if column in data.columns:
+        return data[column].iat[index]
+    return enhanced_elliott_analysis(data, index)[column]
+
+
 # === BackTest Class ===
 class BackTest:
-    def __init__(self, config: TradingConfig = None):
+    def __init__(self, config: TradingConfig = None, data_source: Optional[ds.DataSource] = None,
+                 profiler: Optional[pf.StageProfiler] = None, sink: Optional[rs.ResultSink] = None,
+                 strategy: Optional[st.AnyStrategy] = None, sub_bars: Optional[fl.SubBarIndex] = None):
         self.config = config or TradingConfig()
-        self.state = TradingState(
-            balance=self.config.INITIAL_BALANCE,
-            coin_quantity=Decimal('0'),
-            min_price=Decimal('0'),
-            max_price=Decimal('0'),
-            start_price=Decimal('0'),
-            end_price=Decimal('0')
-        )
-        self.result = TradingResult()
-        setup_logging()
+        # 매수/매도 규칙 (지정하지 않으면 config.STRATEGY 이름으로 생성)
+        self.strategy = strategy or st.create_strategy(self.config.STRATEGY)
+        if self.config.FILL_MODEL not in fl.FILL_MODELS:
+            raise ValueError(f"알 수 없는 체결 방식입니다: {self.config.FILL_MODEL}")
+        # 하위 봉 인덱스는 조회한 구간을 덮는 동안 재사용 (데이터셋이 공유하는 인덱스를 넘겨받을 수 있음)
+        self._sub_bars = sub_bars
+        self.data_source = data_source or ds.UpbitDataSource()
+        # 거래 내역과 기간 요약은 구조화된 레코드로 저장소에 기록
+        self.sink = sink or rs.NULL_SINK
+        # 프로파일러가 없으면 측정 코드를 거치지 않음
+        self.profiler = profiler or pf.NULL_PROFILER
+        if self.profiler.enabled:
+            self.execute_buy = self.profiler.wrap('execute_buy', self.execute_buy)
+            self.execute_sell = self.profiler.wrap('execute_sell', self.execute_sell)
+        # 수수료는 calculate_trade_fee 와 같이 TRADING_FEE_RATE 를 사용
+        self.ledger = lg.create_ledger(self.config.ACCOUNTING_BACKEND, TRADING_FEE_RATE)
+        self._reset_state()
+        self._bar_data: Optional[pd.DataFrame] = None
+        self._bar_columns: Dict[str, np.ndarray] = {}
 
-    def check_buy_condition(self, price: Decimal, data: Optional[pd.DataFrame] = None,
+    def check_buy_condition(self, price: lg.Amount, data: Optional[pd.DataFrame] = None,
                             current_index: Optional[int] = None) -> bool:
         """매수 조건 확인 (엘리어트 파동 분석 포함)"""
         if self.state.min_price == 0:
@@ -535,7 +934,7 @@ class BackTest:
         should_buy = False
 
         # 기본 가격 조건
-        if self.state.min_price * self.config.MIN_PRICE_CHANGE_RATE < price:
+        if self.ledger.is_above_rate(self.state.min_price, self.config.MIN_PRICE_CHANGE_RATE, price):
             self.state.min_price = price
             should_buy = True
         else:
@@ -543,20 +942,20 @@ class BackTest:
 
         # 엘리어트 파동 분석 추가
         if data is not None and current_index is not None:
-            elliott_analysis = enhanced_elliott_analysis(data, current_index)
+            buy_signal_strength = self._elliott_signal_strength(data, current_index, 'buy_signal_strength')
 
             # 강한 매수 신호 (50점 이상)
-            if elliott_analysis['buy_signal_strength'] >= 50:
+            if buy_signal_strength >= self.config.STRONG_SIGNAL_STRENGTH:
                 should_buy = True
-                logging.debug(f"Strong Elliott buy signal: {elliott_analysis['buy_signal_strength']}")
+                logging.debug("Strong Elliott buy signal: %s", buy_signal_strength)
 
             # 중간 매수 신호 (30점 이상) - 기본 조건과 결합
-            elif elliott_analysis['buy_signal_strength'] >= 30 and should_buy:
-                logging.debug(f"Combined buy signal: {elliott_analysis['buy_signal_strength']}")
+            elif buy_signal_strength >= self.config.COMBINED_SIGNAL_STRENGTH and should_buy:
+                logging.debug("Combined buy signal: %s", buy_signal_strength)
 
         return should_buy
 
-    def check_sell_condition(self, price: Decimal, data: Optional[pd.DataFrame] = None,
+    def check_sell_condition(self, price: lg.Amount, data: Optional[pd.DataFrame] = None,
                              current_index: Optional[int] = None) -> bool:
         """매도 조건 확인 (엘리어트 파동 분석 포함)"""
         if self.state.max_price == 0:
@@ -566,7 +965,7 @@ class BackTest:
         should_sell = False
 
         # 기본 가격 조건
-        if self.state.max_price * self.config.MAX_PRICE_CHANGE_RATE > price:
+        if self.ledger.is_below_rate(self.state.max_price, self.config.MAX_PRICE_CHANGE_RATE, price):
             self.state.max_price = price
             should_sell = True
         else:
@@ -574,20 +973,20 @@ class BackTest:
 
         # 엘리어트 파동 분석 추가
         if data is not None and current_index is not None:
-            elliott_analysis = enhanced_elliott_analysis(data, current_index)
+            sell_signal_strength = self._elliott_signal_strength(data, current_index, 'sell_signal_strength')
 
             # 강한 매도 신호 (50점 이상)
-            if elliott_analysis['sell_signal_strength'] >= 50:
+            if sell_signal_strength >= self.config.STRONG_SIGNAL_STRENGTH:
                 should_sell = True
-                logging.debug(f"Strong Elliott sell signal: {elliott_analysis['sell_signal_strength']}")
+                logging.debug("Strong Elliott sell signal: %s", sell_signal_strength)
 
             # 중간 매도 신호 (30점 이상) - 기본 조건과 결합
-            elif elliott_analysis['sell_signal_strength'] >= 30 and should_sell:
-                logging.debug(f"Combined sell signal: {elliott_analysis['sell_signal_strength']}")
+            elif sell_signal_strength >= self.config.COMBINED_SIGNAL_STRENGTH and should_sell:
+                logging.debug("Combined sell signal: %s", sell_signal_strength)
 
         return should_sell
 
-    def execute_buy(self, price: Decimal, timestamp: datetime = None,
+    def execute_buy(self, price: lg.Amount, timestamp: datetime = None,
                     force: bool = False, data: Optional[pd.DataFrame] = None,
                     current_index: Optional[int] = None) -> None:
         """매수 실행"""
@@ -596,11 +995,14 @@ class BackTest:
 
         if self.state.balance > price:
             should_buy = force or self.check_buy_condition(price, data, current_index)
+            # 조건은 신호 가격으로 확인하고 체결은 체결 모델 가격으로 (체결되지 않으면 None)
+            fill_price = self._fill_price(BUY_FILL, price, current_index) if should_buy else None
 
-            if should_buy:
-                buy_quantity = Decimal(str(int(self.state.balance / price)))
-                total_amount = price * buy_quantity
-                fee = calculate_trade_fee(total_amount)
+            if fill_price is not None:
+                price = fill_price
+                buy_quantity = self.ledger.buy_quantity(self.state.balance, price)
+                total_amount = self.ledger.trade_amount(price, buy_quantity)
+                fee = self.ledger.trade_fee(total_amount)
 
                 if self.state.balance >= (total_amount + fee):
                     self.state.coin_quantity += buy_quantity
@@ -608,32 +1010,19 @@ class BackTest:
                     self.state.total_fee += fee
                     self.state.trade_count += 1
 
-                    trade_info = TradeInfo(
-                        timestamp=timestamp,
-                        type='BUY',
-                        price=price,
-                        quantity=buy_quantity,
-                        total_amount=total_amount,
-                        fee=fee
-                    )
-
-                    self.result.add_trade(trade_info)
-                    self.result.buy_orders.append(float(price))
-                    self.result.sell_orders.append(-1)
-
-                    logging.debug(
-                        f"[매수] 가격: {format_currency(price)}, "
-                        f"수량: {buy_quantity}, "
-                        f"총액: {format_currency(total_amount)}, "
-                        f"수수료: {format_currency(fee)}"
-                    )
-                    logging.debug(f"[잔고] {format_currency(self.state.balance)}")
+                    self._record_trade(timestamp, 'BUY', price, buy_quantity, total_amount, fee)
+                    self.result.add_order(buy_price=self.ledger.to_float(price))
+
+                    if self._trade_log:
+                        self._log_trade('매수', price, buy_quantity, total_amount, fee)
+                else:
+                    self._append_no_trade()
             else:
                 self._append_no_trade()
         else:
             self._append_no_trade()
 
-    def execute_sell(self, price: Decimal, timestamp: datetime = None,
+    def execute_sell(self, price: lg.Amount, timestamp: datetime = None,
                      force: bool = False, data: Optional[pd.DataFrame] = None,
                      current_index: Optional[int] = None) -> None:
         """매도 실행"""
@@ -642,161 +1031,330 @@ class BackTest:
 
         if self.state.coin_quantity > 0:
             should_sell = force or self.check_sell_condition(price, data, current_index)
+            fill_price = self._fill_price(SELL_FILL, price, current_index) if should_sell else None
 
-            if should_sell:
-                total_amount = price * self.state.coin_quantity
-                fee = calculate_trade_fee(total_amount)
+            if fill_price is not None:
+                price = fill_price
+                total_amount = self.ledger.trade_amount(price, self.state.coin_quantity)
+                fee = self.ledger.trade_fee(total_amount)
 
                 self.state.balance += (total_amount - fee)
                 self.state.total_fee += fee
                 self.state.trade_count += 1
 
-                trade_info = TradeInfo(
-                    timestamp=timestamp,
-                    type='SELL',
-                    price=price,
-                    quantity=self.state.coin_quantity,
-                    total_amount=total_amount,
-                    fee=fee
-                )
-
-                self.result.add_trade(trade_info)
-                self.result.sell_orders.append(float(price))
-                self.result.buy_orders.append(-1)
+                self._record_trade(timestamp, 'SELL', price, self.state.coin_quantity, total_amount, fee)
+                self.result.add_order(sell_price=self.ledger.to_float(price))
 
-                logging.debug(
-                    f"[매도] 가격: {format_currency(price)}, "
-                    f"수량: {self.state.coin_quantity}, "
-                    f"총액: {format_currency(total_amount)}, "
-                    f"수수료: {format_currency(fee)}"
-                )
-                logging.debug(f"[잔고] {format_currency(self.state.balance)}")
+                if self._trade_log:
+                    self._log_trade('매도', price, self.state.coin_quantity, total_amount, fee)
 
-                self.state.coin_quantity = Decimal('0')
+                self.state.coin_quantity = self.ledger.zero()
             else:
                 self._append_no_trade()
         else:
             self._append_no_trade()
 
+    def _fill_price(self, side: int, price: lg.Amount, index: Optional[int]) -> Optional[lg.Amount]:
+        """체결가 (하위 봉 체결 모델이 없거나 봉 위치를 모르면 신호 가격, 체결되지 않으면 None)
+
+        봉별 체결가는 실행 전에 배열로 계산해 두므로 체결마다 위치 조회 한 번이다.
+        """
+        if self._fills is None or index is None:
+            return price
+        fill = self._fills[side][index]
+        return None if np.isnan(fill) else self.ledger.price(fill)
+
+    def _prepare_fills(self, data: pd.DataFrame, ticker: str, interval: str) -> Optional[fl.FillPrices]:
+        """FILL_MODEL 의 봉별 (매수, 매도) 체결가 ('close' 이면 None)"""
+        if self.config.FILL_MODEL == 'close' or data.empty:
+            return None
+        self._sub_bars = fl.load_sub_bars(self.data_source, ticker, data.index, interval, self._sub_bars)
+        return self._sub_bars.fill_prices(self.config.FILL_MODEL, data.index, interval,
+                                          data['close'].to_numpy(dtype=np.float64))
+
+    def _log_trade(self, label: str, price: lg.Amount, quantity: lg.Amount,
+                   total_amount: lg.Amount, fee: lg.Amount) -> None:
+        """거래 상세 로그 (DEBUG 레벨일 때만 호출)"""
+        logging.debug(
+            f"[{label}] 가격: {format_currency(self.ledger.to_decimal(price))}, "
+            f"수량: {self.ledger.quantity_to_decimal(quantity)}, "
+            f"총액: {format_currency(self.ledger.to_decimal(total_amount))}, "
+            f"수수료: {format_currency(self.ledger.to_decimal(fee))}"
+        )
+        logging.debug(f"[잔고] {format_currency(self.ledger.to_decimal(self.state.balance))}")
+
+    def _record_trade(self, timestamp: datetime, trade_type: str, price: lg.Amount,
+                      quantity: lg.Amount, total_amount: lg.Amount, fee: lg.Amount) -> None:
+        """거래 내역 기록 (Decimal 계산 방식은 원래 값을 그대로, 그 외는 고정소수점 정수로 변환)"""
+        if self.ledger.name == 'decimal':
+            self.result.add_trade(TradeInfo(timestamp, trade_type, price, quantity, total_amount, fee))
+            return
+        self.result.record_trade(
+            timestamp, trade_type,
+            self.ledger.to_fixed(price),
+            self.ledger.quantity_to_fixed(quantity),
+            self.ledger.to_trade_amount(total_amount),
+            self.ledger.to_trade_amount(fee)
+        )
+
     def _append_no_trade(self) -> None:
         """미체결 주문 기록"""
-        self.result.buy_orders.append(-1)
-        self.result.sell_orders.append(-1)
+        self.result.add_order()
 
     def display_account_summary(self, ticker: str, interval: str,
                                 start_time: datetime, end_time: datetime) -> Tuple[float, float]:
         """계좌 요약 정보 표시 및 수익률과 코인 변동률 반환"""
-        total_profit = self.state.balance - self.config.INITIAL_BALANCE
+        balance = self.ledger.to_decimal(self.state.balance)
+        start_price = self.ledger.to_decimal(self.state.start_price)
+        end_price = self.ledger.to_decimal(self.state.end_price)
+        total_fee = self.ledger.to_decimal(self.state.total_fee)
+
+        total_profit = balance - self.config.INITIAL_BALANCE
         profit_rate = (total_profit * Decimal('100') / self.config.INITIAL_BALANCE)
 
-        if self.state.start_price > 0:
-            coin_change_rate = ((self.state.end_price - self.state.start_price) *
-                                Decimal('100') / self.state.start_price)
+        if start_price > 0:
+            coin_change_rate = ((end_price - start_price) *
+                                Decimal('100') / start_price)
         else:
             coin_change_rate = Decimal('0')
 
-        logging.info("\n" + "=" * 70)
-        logging.info(f"종목, 주기: {ticker}, {interval}")
-        logging.info(f"기간: {start_time} ~ {end_time}")
-        logging.info("-" * 70)
-        logging.info(f"초기자본: {format_currency(self.config.INITIAL_BALANCE)}")
-        logging.info(f"최종자본: {format_currency(self.state.balance)}")
-        logging.info(f"순손익: {format_currency(total_profit)}")
-        logging.info(f"거래횟수: {self.state.trade_count}회")
-        logging.info(f"총 수수료: {format_currency(self.state.total_fee)}")
-        logging.info("-" * 70)
-        logging.info(f"시작가격: {format_currency(self.state.start_price)}")
-        logging.info(f"종료가격: {format_currency(self.state.end_price)}")
-        logging.info(f"코인가격 변동률: {format_percentage(coin_change_rate)}")
-        logging.info(f"거래 수익률: {format_percentage(profit_rate)}")
-        logging.info(f"거래 vs 코인 성과: {format_percentage(profit_rate - coin_change_rate)}")
-        logging.info("=" * 70 + "\n")
+        # 사람이 읽는 요약은 설정과 로그 레벨이 허용할 때만 만듦
+        if LOG_CONFIG['PERIOD_SUMMARY'] and logging.getLogger().isEnabledFor(logging.INFO):
+            logging.info("\n" + "=" * 70)
+            logging.info(f"종목, 주기: {ticker}, {interval}")
+            logging.info(f"기간: {start_time} ~ {end_time}")
+            logging.info("-" * 70)
+            logging.info(f"초기자본: {format_currency(self.config.INITIAL_BALANCE)}")
+            logging.info(f"최종자본: {format_currency(balance)}")
+            logging.info(f"순손익: {format_currency(total_profit)}")
+            logging.info(f"거래횟수: {self.state.trade_count}회")
+            logging.info(f"총 수수료: {format_currency(total_fee)}")
+            logging.info("-" * 70)
+            logging.info(f"시작가격: {format_currency(start_price)}")
+            logging.info(f"종료가격: {format_currency(end_price)}")
+            logging.info(f"코인가격 변동률: {format_percentage(coin_change_rate)}")
+            logging.info(f"거래 수익률: {format_percentage(profit_rate)}")
+            logging.info(f"거래 vs 코인 성과: {format_percentage(profit_rate - coin_change_rate)}")
+            logging.info("=" * 70 + "\n")
 
         return float(profit_rate), float(coin_change_rate)
 
+    def _write_results(self, ticker: str, interval: str, start_time: datetime, end_time: datetime,
+                       profit_rate: float, coin_change_rate: float, metrics: mx.RiskMetrics) -> None:
+        """거래 내역과 기간 요약을 결과 저장소에 기록"""
+        self.sink.write_trades(self.result.trades_frame(), ticker=ticker, interval=str(interval),
+                               period_start=pd.Timestamp(start_time))
+        self.sink.write_period(
+            ticker=ticker,
+            interval=str(interval),
+            period_start=pd.Timestamp(start_time),
+            period_end=pd.Timestamp(end_time),
+            initial_balance=float(self.config.INITIAL_BALANCE),
+            final_balance=self.ledger.to_float(self.state.balance),
+            trading_profit=profit_rate,
+            coin_change_rate=coin_change_rate,
+            trade_count=self.state.trade_count,
+            total_fee=self.ledger.to_float(self.state.total_fee),
+            start_price=self.ledger.to_float(self.state.start_price),
+            end_price=self.ledger.to_float(self.state.end_price),
+            **metrics.to_dict()
+        )
+
     def run_backTest(self, ticker: str, interval: str,
                      start_time: datetime, end_time: datetime,
                      display_chart: bool = False) -> PeriodResult:
         """백테스트 실행 (기존 인터페이스 호환성 유지, PeriodResult 반환)"""
-        self._reset_state()
         data = self._prepare_data(ticker, interval, start_time, end_time)
+        return self.run_prepared(data, ticker, interval, start_time, end_time, display_chart)
+
+    def run_prepared(self, data: pd.DataFrame, ticker: str, interval: str,
+                     start_time: datetime, end_time: datetime,
+                     display_chart: bool = False) -> PeriodResult:
+        """지표가 계산된 데이터로 백테스트 실행"""
+        self._reset_state()
+        # 봉마다 하나씩, 미체결 코인 청산 기록 하나
+        self.result.reserve(len(data) + 1)
 
         if data.empty:
             logging.warning(f"데이터가 없습니다: {ticker}, {interval}, {start_time} ~ {end_time}")
-            return PeriodResult(0.0, 0.0, 0.0, 0.0)
+            return PeriodResult(0.0, 0.0, 0.0, 0.0, error=NO_DATA_ERROR)
 
-        self._process_trading_data(data)
+        with self.profiler.stage('fill_model'):
+            self._fills = self._prepare_fills(data, ticker, str(interval))
 
-        # 미체결 코인 청산
-        if self.state.coin_quantity > 0:
-            final_price = Decimal(str(data.iloc[-1]['close']))
-            final_timestamp = data.index[-1] if hasattr(data.index[-1], 'to_pydatetime') else datetime.now()
-            self.execute_sell(final_price, final_timestamp, force=True)
+        with self.profiler.stage('trading_loop'):
+            self._process_trading_data(data)
+        self._liquidate_position(data)
 
-        profit_rate, coin_change_rate = self.display_account_summary(ticker, interval, start_time, end_time)
+        with self.profiler.stage('account_summary'):
+            profit_rate, coin_change_rate = self.display_account_summary(ticker, interval, start_time, end_time)
+            equity = self.result.equity_curve(data.index, data['close'].to_numpy(dtype=np.float64),
+                                              float(self.config.INITIAL_BALANCE),
+                                              mx.periods_per_year(interval))
+            if self.sink.enabled:
+                self._write_results(ticker, interval, start_time, end_time, profit_rate, coin_change_rate,
+                                    mx.compute_metrics(equity))
 
         if display_chart:
-            self._display_chart(data)
+            self._display_chart(data.join(self.result.orders_frame(data.index)))
 
         return PeriodResult(
             trading_profit=profit_rate,
             coin_change_rate=coin_change_rate,
-            start_price=float(self.state.start_price),
-            end_price=float(self.state.end_price)
+            start_price=self.ledger.to_float(self.state.start_price),
+            end_price=self.ledger.to_float(self.state.end_price),
+            equity=equity,
+            trades=self.result.trade_records.copy()
         )
 
+    def run_periods(self, ticker: str, interval: str, periods: List[TradingPeriod],
+                    display_chart: bool = False) -> List[PeriodResult]:
+        """이어진 기간을 한 번에 불러와 지표를 계산한 뒤 기간별로 나누어 실행 (결과는 periods 순서)
+
+        기간마다 다시 조회하지 않으며, 이어진 구간(group_contiguous_periods)마다 첫 기간 앞
+        WARMUP_BARS 개 봉으로 지표를 미리 준비하므로 기간 시작 부분의 신호가 지표 결측으로 누락되지 않는다.
+        계좌는 기간마다 새로 시작한다.
+        """
+        results: List[Optional[PeriodResult]] = [None] * len(periods)
+        for span in group_contiguous_periods(periods, str(interval)):
+            span_periods = [periods[number] for number in span]
+            for number, result in zip(span, self._run_span(ticker, interval, span_periods, display_chart)):
+                results[number] = result
+        return results
+
+    def _run_span(self, ticker: str, interval: str, periods: List[TradingPeriod],
+                  display_chart: bool = False) -> List[PeriodResult]:
+        """이어진 기간들을 워밍업 봉과 함께 한 번에 조회해 실행"""
+        first_start = min(period.start for period in periods)
+        last_end = max(period.end for period in periods)
+        warmup_start = first_start - ds.interval_to_timedelta(interval) * WARMUP_BARS
+        data = self._prepare_data(ticker, interval, warmup_start, last_end)
+        if self.config.FILL_MODEL != 'close' and not data.empty:
+            # 하위 봉은 구간 전체에 대해 한 번만 조회해 모든 기간이 공유
+            with self.profiler.stage('fill_model'):
+                self._sub_bars = fl.load_sub_bars(self.data_source, ticker, data.index, str(interval))
+
+        with self.profiler.stage('elliott_analysis'):
+            elliott = precompute_elliott_analysis(data, ticker=ticker, interval=str(interval))
+            for column in ELLIOTT_SIGNAL_COLUMNS:
+                data[column] = elliott[column]
+
+        results = []
+        for period in periods:
+            try:
+                segment = ds.slice_range(data, period.start, period.end)
+                results.append(self.run_prepared(segment, ticker, interval,
+                                                 period.start, period.end, display_chart))
+            except Exception as e:
+                logging.error(f"오류 발생: {ticker} {period.year}-{period.month} - {str(e)}")
+                results.append(PeriodResult(0, 0, 0, 0, error=str(e)))
+        return results
+
+    def _liquidate_position(self, data: pd.DataFrame) -> None:
+        """미체결 코인 청산"""
+        if self.state.coin_quantity > 0:
+            final_price = self.ledger.price(data['close'].iat[-1])
+            final_timestamp = data.index[-1] if hasattr(data.index[-1], 'to_pydatetime') else datetime.now()
+            self.execute_sell(final_price, final_timestamp, force=True)
+
     def _reset_state(self) -> None:
         """상태 초기화"""
+        zero = self.ledger.zero()
         self.state = TradingState(
-            balance=self.config.INITIAL_BALANCE,
-            coin_quantity=Decimal('0'),
-            min_price=Decimal('0'),
-            max_price=Decimal('0'),
-            start_price=Decimal('0'),
-            end_price=Decimal('0')
+            balance=self.ledger.from_decimal(self.config.INITIAL_BALANCE),
+            coin_quantity=zero,
+            min_price=zero,
+            max_price=zero,
+            start_price=zero,
+            end_price=zero,
+            total_fee=zero
         )
-        self.result = TradingResult()
+        self.result = TradingResult(exact_trades=self.ledger.name == 'decimal')
+        self._fills: Optional[fl.FillPrices] = None
+        # 로그 레벨은 실행마다 한 번만 확인 (DEBUG 가 아니면 거래 로그 문자열을 만들지 않음)
+        self._trade_log = logging.getLogger().isEnabledFor(logging.DEBUG)
 
     def _prepare_data(self, ticker: str, interval: str,
                       start_time: datetime, end_time: datetime) -> pd.DataFrame:
-        """거래 데이터 준비"""
-        return db.make_tick_db(start_time, end_time, ticker, interval)
+        """거래 데이터 준비 (db.make_tick_db 와 같으며 조회와 지표 계산을 나누어 측정)"""
+        with self.profiler.stage('fetch'):
+            data = self.data_source.get_ohlcv(ticker, str(interval), start_time, end_time)
+        with self.profiler.stage('indicators'):
+            return db.add_indicators(data, self.config.SMA_WINDOW, ticker, str(interval))
 
     def _process_trading_data(self, data: pd.DataFrame) -> None:
-        """거래 데이터 처리"""
-        for i in range(len(data)):
-            try:
-                price = Decimal(str(data.iloc[i]['close']))
-                timestamp = data.index[i] if hasattr(data.index[i], 'to_pydatetime') else datetime.now()
-
-                if i == 0:
-                    self.state.start_price = price
-                elif i == len(data) - 1:
-                    self.state.end_price = price
-
-                # RSI 데이터가 없는 경우 건너뛰기
-                if 'rsi_k' in data.columns and 'rsi_d' in data.columns:
-                    if pd.isna(data.iloc[i]['rsi_k']) or pd.isna(data.iloc[i]['rsi_d']):
-                        self._append_no_trade()
-                        continue
-
-                    self._process_trading_signals(data, i, price, timestamp)
+        """거래 데이터 처리 (벡터화 전략은 신호 봉만, 봉 단위 전략은 모든 봉 방문)"""
+        # 엘리어트 파동 분석은 봉마다 다시 하지 않고 전체 구간에 대해 한 번만 계산
+        if not set(ELLIOTT_SIGNAL_COLUMNS).issubset(data.columns):
+            with self.profiler.stage('elliott_analysis'):
+                elliott = precompute_elliott_analysis(data)
+                for column in ELLIOTT_SIGNAL_COLUMNS:
+                    data[column] = elliott[column]
+
+        # 신호 처리에서 봉마다 읽는 컬럼은 배열로 꺼내 둠
+        self._bar_data = data
+        self._bar_columns = {column: data[column].to_numpy()
+                             for column in BAR_SIGNAL_COLUMNS if column in data.columns}
+        close = data['close'].to_numpy(dtype=np.float64)
+        if len(close):
+            self.state.start_price = self.ledger.price(close[0])
+        if len(close) > 1:
+            self.state.end_price = self.ledger.price(close[-1])
+
+        if self.strategy.vectorized:
+            self._process_signal_bars(data, close)
+        else:
+            self._process_bar_callbacks(data, close)
+
+    def _process_signal_bars(self, data: pd.DataFrame, close: np.ndarray) -> None:
+        """벡터화 전략: 진입/청산 신호가 있는 봉만 방문해 포지션과 수수료 계산"""
+        signals = self.strategy.signals(data, self.config)
+        active_bars = signals.active_bars
+        # 가격 변환과 시각 조회도 신호 봉만
+        prices = self.ledger.prices(close[active_bars])
+        timestamps = data.index[active_bars].tolist()
+
+        next_bar = 0
+        for i, price, timestamp in zip(active_bars.tolist(), prices, timestamps):
+            self.result.skip_orders(i - next_bar)
+            next_bar = i + 1
+            if not hasattr(timestamp, 'to_pydatetime'):
+                timestamp = datetime.now()
+
+            if signals.entries[i]:
+                if self.state.balance > price and self.strategy.confirm_entry(self, data, i, price):
+                    self.execute_buy(price, timestamp, force=True, current_index=i)
                 else:
-                    # RSI 데이터가 없는 경우 기본 로직으로 처리
-                    self._process_basic_trading_signals(data, i, price, timestamp)
+                    self._append_no_trade()
+            elif self.state.coin_quantity > 0 and self.strategy.confirm_exit(self, data, i, price):
+                self.execute_sell(price, timestamp, force=True, current_index=i)
+            else:
+                self._append_no_trade()
+        self.result.skip_orders(len(data) - next_bar)
 
+    def _process_bar_callbacks(self, data: pd.DataFrame, close: np.ndarray) -> None:
+        """봉 단위 전략: 모든 봉에서 on_bar 호출 (주문이 없는 봉은 여기서 기록)"""
+        prices = self.ledger.prices(close)
+        timestamps = data.index.tolist()
+        self.strategy.prepare(self, data)
+
+        for i in range(len(data)):
+            orders = self.result.order_count
+            try:
+                timestamp = timestamps[i] if hasattr(timestamps[i], 'to_pydatetime') else datetime.now()
+                self.strategy.on_bar(self, data, i, prices[i], timestamp)
             except (KeyError, ValueError, IndexError) as e:
-                logging.debug(f"데이터 처리 오류 (인덱스 {i}): {str(e)}")
+                logging.debug("데이터 처리 오류 (인덱스 %d): %s", i, e)
+            if self.result.order_count == orders:
                 self._append_no_trade()
-                continue
 
     def _process_trading_signals(self, data: pd.DataFrame, index: int,
-                                 price: Decimal, timestamp: datetime) -> None:
+                                 price: lg.Amount, timestamp: datetime) -> None:
         """거래 신호 처리 (RSI 포함)"""
         try:
-            rsi_k = data.iloc[index]['rsi_k']
-            rsi_d = data.iloc[index]['rsi_d']
-            signal = data.iloc[index]['signal'] if 'signal' in data.columns else 0
+            rsi_k = self._column_value(data, index, 'rsi_k')
+            rsi_d = self._column_value(data, index, 'rsi_d')
+            signal = self._column_value(data, index, 'signal') if 'signal' in data.columns else 0
 
             if ((rsi_k > rsi_d) and (rsi_k < self.config.RSI_OVERSOLD) and
                     signal > 0):
@@ -807,19 +1365,32 @@ class BackTest:
             else:
                 self._append_no_trade()
         except Exception as e:
-            logging.debug(f"RSI 신호 처리 오류: {str(e)}")
+            logging.debug("RSI 신호 처리 오류: %s", e)
             self._append_no_trade()
 
+    def _column_value(self, data: pd.DataFrame, index: int, column: str):
+        """봉 단위 컬럼 값 조회 (_process_trading_data 가 꺼내 둔 배열 우선 사용)"""
+        if data is self._bar_data and column in self._bar_columns:
+            return self._bar_columns[column][index]
+        return data[column].iat[index]
+
+    def _elliott_signal_strength(self, data: pd.DataFrame, index: int, column: str) -> int:
+        """엘리어트 신호 강도 조회 (꺼내 둔 배열 우선 사용)"""
+        if data is self._bar_data and column in self._bar_columns:
+            return self._bar_columns[column][index]
+        return get_elliott_signal_strength(data, index, column)
+
     def _process_basic_trading_signals(self, data: pd.DataFrame, index: int,
-                                       price: Decimal, timestamp: datetime) -> None:
+                                       price: lg.Amount, timestamp: datetime) -> None:
         """기본 거래 신호 처리 (RSI 없이)"""
         # RSI 데이터가 없는 경우 엘리어트 파동 분석만으로 거래
         if index > ELLIOTT_WAVE_PATTERN_LENGTH:
-            elliott_analysis = enhanced_elliott_analysis(data, index)
+            buy_signal_strength = self._elliott_signal_strength(data, index, 'buy_signal_strength')
+            sell_signal_strength = self._elliott_signal_strength(data, index, 'sell_signal_strength')
 
-            if elliott_analysis['buy_signal_strength'] >= 40:
+            if buy_signal_strength >= self.config.BASIC_SIGNAL_STRENGTH:
                 self.execute_buy(price, timestamp, data=data, current_index=index)
-            elif elliott_analysis['sell_signal_strength'] >= 40:
+            elif sell_signal_strength >= self.config.BASIC_SIGNAL_STRENGTH:
                 self.execute_sell(price, timestamp, data=data, current_index=index)
             else:
                 self._append_no_trade()
@@ -835,7 +1406,276 @@ class BackTest:
             logging.warning(f"차트 표시 오류: {str(e)}")
 
 
+@st.register_strategy
+class RsiElliottStrategy(st.Strategy):
+    """Stoch RSI + SMA signal 에 엘리어트 신호 강도와 추적 최저/최고가 조건을 더한 기본 전략 (벡터화)
+
+    RSI 컬럼이 없으면 엘리어트 신호 강도만으로 진입/청산한다.
+    추적 최저/최고가는 포지션에 따라 달라지므로 신호 봉에서 check_buy_condition / check_sell_condition 으로 확인한다.
+    """
+    name = 'rsi_elliott'
+
+    def signals(self, data: pd.DataFrame, config: TradingConfig) -> st.Signals:
+        bars = len(data)
+        if 'rsi_k' in data.columns and 'rsi_d' in data.columns:
+            rsi_k = data['rsi_k'].to_numpy(dtype=np.float64)
+            rsi_d = data['rsi_d'].to_numpy(dtype=np.float64)
+            signal = data['signal'].to_numpy(dtype=np.float64) if 'signal' in data.columns else np.zeros(bars)
+            # RSI 결측 봉은 비교 결과가 모두 False 이므로 거래하지 않음
+            with np.errstate(invalid='ignore'):
+                return st.Signals(
+                    entries=(rsi_k > rsi_d) & (rsi_k < config.RSI_OVERSOLD) & (signal > 0),
+                    exits=(rsi_k < rsi_d) & (rsi_k > config.RSI_OVERBOUGHT) & (signal < 0)
+                )
+
+        # RSI 데이터가 없는 경우 엘리어트 파동 분석만으로 거래
+        eligible = np.arange(bars) > ELLIOTT_WAVE_PATTERN_LENGTH
+        return st.Signals(
+            entries=eligible & (data['buy_signal_strength'].to_numpy() >= config.BASIC_SIGNAL_STRENGTH),
+            exits=eligible & (data['sell_signal_strength'].to_numpy() >= config.BASIC_SIGNAL_STRENGTH)
+        )
+
+    def confirm_entry(self, back_tester: BackTest, data: pd.DataFrame, index: int, price: lg.Amount) -> bool:
+        return back_tester.check_buy_condition(price, data, index)
+
+    def confirm_exit(self, back_tester: BackTest, data: pd.DataFrame, index: int, price: lg.Amount) -> bool:
+        return back_tester.check_sell_condition(price, data, index)
+
+
+@st.register_strategy
+class RsiElliottBarStrategy(st.BarStrategy):
+    """RsiElliottStrategy 와 같은 규칙을 봉마다 실행하는 콜백 전략 (기존 BackTest 봉 단위 경로)"""
+    name = 'rsi_elliott_bar'
+
+    def prepare(self, back_tester: BackTest, data: pd.DataFrame) -> None:
+        self.has_rsi = 'rsi_k' in data.columns and 'rsi_d' in data.columns
+        if self.has_rsi:
+            self.rsi_missing = (data['rsi_k'].isna() | data['rsi_d'].isna()).to_numpy()
+
+    def on_bar(self, back_tester: BackTest, data: pd.DataFrame, index: int,
+               price: lg.Amount, timestamp: datetime) -> None:
+        if not self.has_rsi:
+            # RSI 데이터가 없는 경우 기본 로직으로 처리
+            back_tester._process_basic_trading_signals(data, index, price, timestamp)
+        elif not self.rsi_missing[index]:
+            # RSI 데이터가 없는 봉은 건너뛰기
+            back_tester._process_trading_signals(data, index, price, timestamp)
+
+
 # === Main Execution ===
+def _dump_job_profile(profiler: pf.StageProfiler, profile_dir: Optional[str], name: str) -> None:
+    """작업별 프로파일 저장"""
+    if profile_dir and profiler.enabled:
+        profiler.dump(os.path.join(profile_dir, name + pf.PROFILE_EXTENSION))
+
+
+def _create_job_sink(results_dir: Optional[str], results_format: str, name: str):
+    """작업별 결과 저장소 (작업 프로세스마다 다른 파일에 기록)"""
+    return rs.create_sink(results_format, os.path.join(results_dir, name) if results_dir else None)
+
+
+def _run_backtest_job(config: TradingConfig, data_source: Optional[ds.DataSource],
+                      ticker: str, interval: str, period: TradingPeriod,
+                      display_chart: bool = False, profile_dir: Optional[str] = None,
+                      results_dir: Optional[str] = None, results_format: str = 'jsonl') -> PeriodResult:
+    """단일 (종목, 기간, 주기) 백테스트 실행 (작업마다 독립된 BackTest 사용)"""
+    job_name = f"{ticker}_{interval}_{period.year}-{period.month:02d}"
+    profiler = pf.create_profiler(enabled=bool(profile_dir))
+    sink = _create_job_sink(results_dir, results_format, job_name)
+    try:
+        back_tester = BackTest(config, data_source, profiler, sink)
+        with profiler.session():
+            return back_tester.run_backTest(ticker, interval, period.start, period.end, display_chart)
+    except Exception as e:
+        logging.error(f"오류 발생: {ticker} {period.year}-{period.month} - {str(e)}")
+        return PeriodResult(0, 0, 0, 0, error=str(e))
+    finally:
+        sink.close()
+        _dump_job_profile(profiler, profile_dir, job_name)
+
+
+def _run_continuous_job(config: TradingConfig, data_source: Optional[ds.DataSource],
+                        ticker: str, interval: str, periods: List[TradingPeriod],
+                        display_chart: bool = False, profile_dir: Optional[str] = None,
+                        results_dir: Optional[str] = None, results_format: str = 'jsonl') -> List[PeriodResult]:
+    """(종목, 주기) 의 모든 기간을 한 번의 조회로 실행"""
+    # 결과 저장소로 이어서 실행할 때 이미 끝난 기간의 레코드 파일을 덮어쓰지 않도록 기간 범위를 이름에 포함
+    first, last = min(periods, key=lambda p: p.start), max(periods, key=lambda p: p.start)
+    job_name = f"{ticker}_{interval}_{first.year}-{first.month:02d}_{last.year}-{last.month:02d}"
+    profiler = pf.create_profiler(enabled=bool(profile_dir))
+    sink = _create_job_sink(results_dir, results_format, job_name)
+    try:
+        back_tester = BackTest(config, data_source, profiler, sink)
+        with profiler.session():
+            return back_tester.run_periods(ticker, interval, periods, display_chart)
+    except Exception as e:
+        logging.error(f"오류 발생: {ticker} {interval}분 - {str(e)}")
+        return [PeriodResult(0, 0, 0, 0, error=str(e)) for _ in periods]
+    finally:
+        sink.close()
+        _dump_job_profile(profiler, profile_dir, job_name)
+
+
+def _save_result(store: Optional[rst.ResultsStore], config: TradingConfig, ticker: str,
+                 interval: str, period: TradingPeriod, result: PeriodResult) -> None:
+    """완료된 기간 결과를 결과 저장소에 기록 (저장소가 없으면 무시)"""
+    if store is not None:
+        store.save(ticker, interval, period, config, result)
+
+
+def _stored_period_result(row: Dict) -> PeriodResult:
+    """결과 저장소 행으로 PeriodResult 복원"""
+    arrays = rst.decode_equity(row)
+    equity = None
+    if arrays is not None:
+        equity = mx.EquityCurve(arrays[0], arrays[1], row['traded_value'],
+                                row['initial_balance'], row['periods_per_year'])
+    return PeriodResult(row['trading_profit'], row['coin_change_rate'],
+                        row['start_price'], row['end_price'], equity=equity,
+                        error=row['error'] if isinstance(row.get('error'), str) else None)
+
+
+def _fill_results(results: Dict, tickers: List[str], periods: List[TradingPeriod], intervals: List[str],
+                  computed: Dict, stored_rows: Dict) -> Dict:
+    """이번에 계산한 결과와 저장된 결과를 결과 구조에 기록
+
+    같은 칸에 여러 주기가 있으면 순차 실행처럼 마지막 주기 결과를 남긴다.
+    """
+    for ticker in tickers:
+        for period in periods:
+            for interval in intervals:
+                key = rst.ResultsStore.period_key(ticker, interval, period.start, period.end)
+                if key in computed:
+                    results[ticker][period.year][period.month] = computed[key]
+                elif key in stored_rows:
+                    results[ticker][period.year][period.month] = _stored_period_result(stored_rows[key])
+    return results
+
+
+def load_stored_results(store_path: str, config: TradingConfig, tickers: List[str],
+                        periods: List[TradingPeriod], intervals: List[str]) -> Dict:
+    """결과 저장소에서 initialize_results_structure 구조로 결과 복원 (저장되지 않은 칸은 0 결과)"""
+    with rst.ResultsStore(store_path) as store:
+        return _fill_results(initialize_results_structure(tickers, periods), tickers, periods,
+                             intervals, {}, store.rows(config))
+
+
+def _run_continuous_grid(config: TradingConfig, tickers: List[str], periods: List[TradingPeriod],
+                         intervals: List[str], display_chart: bool, max_workers: Optional[int],
+                         data_source: Optional[ds.DataSource], store: Optional[rst.ResultsStore],
+                         done: set, profile_dir: Optional[str] = None, results_dir: Optional[str] = None,
+                         results_format: str = 'jsonl') -> Dict:
+    """(종목, 주기) 단위로 연속 실행 (저장소에 이미 있는 기간은 제외)"""
+    jobs = []
+    for ticker in tickers:
+        for interval in intervals:
+            pending = [period for period in periods
+                       if rst.ResultsStore.period_key(ticker, interval, period.start, period.end) not in done]
+            if pending:
+                jobs.append((ticker, interval, pending))
+
+    computed = {}
+
+    def collect(ticker: str, interval: str, pending: List[TradingPeriod],
+                period_results: List[PeriodResult]) -> None:
+        for period, result in zip(pending, period_results):
+            computed[rst.ResultsStore.period_key(ticker, interval, period.start, period.end)] = result
+            _save_result(store, config, ticker, interval, period, result)
+
+    if max_workers == 1:
+        for ticker, interval, pending in jobs:
+            collect(ticker, interval, pending,
+                    _run_continuous_job(config, data_source, ticker, interval, pending,
+                                        display_chart, profile_dir, results_dir, results_format))
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(_run_continuous_job, config, data_source,
+                                       ticker, interval, pending, display_chart, profile_dir,
+                                       results_dir, results_format): (ticker, interval, pending)
+                       for ticker, interval, pending in jobs}
+            # 끝나는 대로 저장소에 기록
+            for future in as_completed(futures):
+                collect(*futures[future], future.result())
+    return computed
+
+
+def run_backtest_grid(config: TradingConfig, tickers: List[str], periods: List[TradingPeriod],
+                      intervals: List[str], display_chart: bool = False,
+                      max_workers: Optional[int] = None,
+                      data_source: Optional[ds.DataSource] = None,
+                      continuous: bool = False, profile_dir: Optional[str] = None,
+                      results_dir: Optional[str] = None, results_format: str = 'jsonl',
+                      store_path: Optional[str] = None) -> Dict:
+    """종목 x 기간 x 주기 전체 백테스트를 프로세스 풀로 실행
+
+    max_workers 가 1 이면 현재 프로세스에서 순차 실행한다.
+    continuous 이면 기간마다 조회하지 않고 (종목, 주기) 마다 전체 구간을 한 번에 실행한다.
+    결과는 순차 실행과 같은 순서로 initialize_results_structure 구조에 기록된다.
+    profile_dir 을 지정하면 작업마다 단계별 프로파일을 JSON 으로 저장한다 (profiling.load_profile_directory 로 집계).
+    results_dir 을 지정하면 작업마다 거래 내역과 기간 요약 레코드를 저장한다 (results_sink.load_records 로 집계).
+    store_path 를 지정하면 끝난 기간마다 결과와 거래 내역을 SQLite 결과 저장소에 기록하고,
+    같은 설정/코드 버전으로 이미 저장된 기간은 다시 계산하지 않는다 (중단 후 이어서 실행).
+    """
+    store = rst.ResultsStore(store_path) if store_path else None
+    try:
+        done = store.completed(config, tickers) if store is not None else set()
+        if continuous:
+            computed = _run_continuous_grid(config, tickers, periods, intervals, display_chart,
+                                            max_workers, data_source, store, done, profile_dir,
+                                            results_dir, results_format)
+        else:
+            computed = _run_period_grid(config, tickers, periods, intervals, display_chart,
+                                        max_workers, data_source, store, done, profile_dir,
+                                        results_dir, results_format)
+        if done:
+            logging.info(f"결과 저장소에서 {len(done)}개 기간 결과를 재사용했습니다")
+        return _fill_results(initialize_results_structure(tickers, periods), tickers, periods, intervals,
+                             computed, store.rows(config) if store is not None else {})
+    finally:
+        if store is not None:
+            store.close()
+
+
+def _run_period_grid(config: TradingConfig, tickers: List[str], periods: List[TradingPeriod],
+                     intervals: List[str], display_chart: bool, max_workers: Optional[int],
+                     data_source: Optional[ds.DataSource], store: Optional[rst.ResultsStore],
+                     done: set, profile_dir: Optional[str] = None, results_dir: Optional[str] = None,
+                     results_format: str = 'jsonl') -> Dict:
+    """(종목, 기간, 주기) 단위로 실행 (저장소에 이미 있는 기간은 제외)"""
+    jobs = [(ticker, period, interval)
+            for ticker in tickers
+            for period in periods
+            for interval in intervals
+            if rst.ResultsStore.period_key(ticker, interval, period.start, period.end) not in done]
+    total_tests = len(jobs)
+    computed = {}
+
+    if max_workers == 1:
+        for current_test, (ticker, period, interval) in enumerate(jobs, 1):
+            logging.info(f"진행률: {current_test}/{total_tests} - {ticker} {period.year}-{period.month}")
+            result = _run_backtest_job(config, data_source, ticker, interval, period, display_chart,
+                                       profile_dir, results_dir, results_format)
+            computed[rst.ResultsStore.period_key(ticker, interval, period.start, period.end)] = result
+            _save_result(store, config, ticker, interval, period, result)
+        return computed
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_run_backtest_job, config, data_source,
+                                   ticker, interval, period, display_chart, profile_dir,
+                                   results_dir, results_format)
+                   for ticker, period, interval in jobs]
+        future_jobs = dict(zip(futures, jobs))
+
+        for current_test, future in enumerate(as_completed(futures), 1):
+            ticker, period, interval = future_jobs[future]
+            result = future.result()
+            computed[rst.ResultsStore.period_key(ticker, interval, period.start, period.end)] = result
+            _save_result(store, config, ticker, interval, period, result)
+            logging.info(f"진행률: {current_test}/{total_tests} - {ticker} {period.year}-{period.month} {interval}분 완료")
+
+    return computed
+
+
 def main():
     """메인 실행 함수"""
     # 거래 설정
@@ -849,7 +1689,7 @@ def main():
         TRADING_FEE=Decimal('0.0005')
     )
 
-    back_tester = BackTest(trading_config)
+    setup_logging()
     tickers = TRADING_CONFIG['tickers']
     intervals = TRADING_CONFIG['time_intervals']
     display_chart = False
@@ -857,9 +1697,6 @@ def main():
     # 테스트할 기간 생성
     trading_periods = get_selected_periods(TRADING_CONFIG)
 
-    # 결과 저장 구조 초기화
-    trading_results = initialize_results_structure(tickers, trading_periods)
-
     logging.info("=" * 50)
     logging.info("백테스트 시작")
     logging.info("=" * 50)
@@ -870,36 +1707,25 @@ def main():
     logging.info(f"테스트 기간: {len(trading_periods)}개 기간")
     logging.info("=" * 50)
 
-    # 백테스트 실행
-    total_tests = len(tickers) * len(trading_periods) * len(intervals)
-    current_test = 0
-
-    for ticker in tickers:
-        logging.info(f"\n{ticker} 백테스트 진행중...")
-        ticker_start_time = datetime.now()
-
-        for period in trading_periods:
-            for interval in intervals:
-                current_test += 1
-                try:
-                    logging.info(f"진행률: {current_test}/{total_tests} - {ticker} {period.year}-{period.month}")
-
-                    result = back_tester.run_backTest(
-                        ticker,
-                        interval,
-                        period.start,
-                        period.end,
-                        display_chart
-                    )
-                    trading_results[ticker][period.year][period.month] = result
-
-                except Exception as e:
-                    logging.error(f"오류 발생: {ticker} {period.year}-{period.month} - {str(e)}")
-                    trading_results[ticker][period.year][period.month] = PeriodResult(0, 0, 0, 0)
-
-        ticker_end_time = datetime.now()
-        ticker_duration = ticker_end_time - ticker_start_time
-        logging.info(f"{ticker} 완료 (소요시간: {ticker_duration})")
+    # 백테스트 실행 (작업 단위로 프로세스 풀에 분산)
+    start_time = datetime.now()
+    trading_results = run_backtest_grid(
+        trading_config,
+        tickers,
+        trading_periods,
+        intervals,
+        display_chart,
+        max_workers=TRADING_CONFIG['max_workers'],
+        continuous=TRADING_CONFIG['continuous_run'],
+        profile_dir=TRADING_CONFIG['profile_dir'],
+        results_dir=TRADING_CONFIG['results_dir'],
+        results_format=TRADING_CONFIG['results_format'],
+        store_path=TRADING_CONFIG['results_store']
+    )
+    logging.info(f"전체 완료 (소요시간: {datetime.now() - start_time})")
+    if TRADING_CONFIG['profile_dir']:
+        profile = pf.load_profile_directory(TRADING_CONFIG['profile_dir'])
+        logging.info("\n" + pf.format_summary(profile.summary()))
 
     # 결과 출력
     logging.info("\n" + "=" * 50)
@@ -914,10 +1740,12 @@ def main():
         total_months = 0
         total_trading_profit = 0
         total_coin_change = 0
+        curves = []
 
-        for year, monthly_data in yearly_data.items():
-            for month, period_result in monthly_data.items():
+        for year, monthly_data in sorted(yearly_data.items()):
+            for month, period_result in sorted(monthly_data.items()):
                 if isinstance(period_result, PeriodResult):
+                    curves.append(period_result.equity)
                     total_months += 1
                     total_trading_profit += period_result.trading_profit
                     total_coin_change += period_result.coin_change_rate
@@ -936,14 +1764,21 @@ def main():
         logging.info(f"평균 코인변동률: {avg_coin_change:+.2f}%")
         logging.info(f"알파 (초과수익): {alpha:+.2f}%p")
 
-        if avg_coin_change != 0:
-            sharpe_like_ratio = avg_trading_profit / abs(avg_coin_change)
-            logging.info(f"수익 효율성: {sharpe_like_ratio:.2f}")
+        # 기간별 평가금액 곡선을 복리로 이어 붙인 전체 구간 지표
+        combined = mx.combine_curves(curves)
+        if combined.bars:
+            for line in mx.format_metrics(mx.compute_metrics(combined)):
+                logging.info(line)
+
+def run_specific_period_backtest(ticker: str, interval: str, start_date: str, end_date: str,
+                                 trading_config: Optional[TradingConfig] = None,
+                                 data_source: Optional[ds.DataSource] = None) -> Optional[PeriodResult]:
+    """특정 임의의 기간에 대해 백테스트 실행 (날짜는 '2023-01-01' 또는 '2023-01-01 09:00:00' 형식)
 
-def run_specific_period_backtest():
-    """특정 임의의 기간에 대해 백테스트 실행"""
+    여러 구간/설정을 한 번에 실행할 때는 batch_jobs.run_batch 를 사용한다.
+    """
     # 거래 설정 생성
-    trading_config = TradingConfig(
+    trading_config = trading_config or TradingConfig(
         INITIAL_BALANCE=Decimal('10000000'),  # 초기 자본금: 10,000,000 KRW
         MIN_PRICE_CHANGE_RATE=Decimal('1.01'),
         MAX_PRICE_CHANGE_RATE=Decimal('1.01'),
@@ -953,19 +1788,15 @@ def run_specific_period_backtest():
         TRADING_FEE=Decimal('0.0005')
     )
 
-    # 지정한 설정으로 BackTest 객체 생성
-    back_tester = BackTest(trading_config)
+    setup_logging()
 
-    # 특정 기간 입력 받기
-    ticker = input("백테스트할 코인을 입력하세요 (예: KRW-ETH): ")
-    interval = input("테스트할 간격(분)을 입력하세요 (예: 60): ")
-    start_date = input("테스트 시작 날짜를 입력하세요 (예: 2023-01-01): ")
-    end_date = input("테스트 종료 날짜를 입력하세요 (예: 2023-12-31): ")
+    # 지정한 설정으로 BackTest 객체 생성
+    back_tester = BackTest(trading_config, data_source)
 
     try:
         # 날짜를 파싱
-        start_datetime = datetime.strptime(start_date, "%Y-%m-%d")
-        end_datetime = datetime.strptime(end_date, "%Y-%m-%d")
+        start_datetime = pd.Timestamp(start_date).to_pydatetime()
+        end_datetime = pd.Timestamp(end_date).to_pydatetime()
 
         # 실행
         result = back_tester.run_backTest(
@@ -982,9 +1813,39 @@ def run_specific_period_backtest():
         print(f"코인 변동률: {result.coin_change_rate:.2f}%")
         print(f"시작가: {result.start_price}")
         print(f"종료가: {result.end_price}")
+        return result
     except Exception as e:
         print(f"오류 발생: {str(e)}")
+        return None
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    """명령행 인자 (인자가 없으면 TRADING_CONFIG 전체 실행)
+
+    예: python main.py KRW-ETH 60 2023-01-01 2023-12-31  # 특정 기간
+        python main.py --jobs jobs.jsonl --output results/overnight  # 작업 파일 배치 실행
+    """
+    parser = argparse.ArgumentParser(description='업비트 백테스트')
+    parser.add_argument('period', nargs='*', metavar='TICKER INTERVAL START END',
+                        help="특정 기간 백테스트 (예: KRW-ETH 60 2023-01-01 2023-12-31)")
+    parser.add_argument('--jobs', default=None, help="배치 작업 파일 (batch_jobs.py 와 같음)")
+    parser.add_argument('--output', default=None, help="배치 결과 파일 경로 앞부분")
+    parser.add_argument('--workers', type=int, default=1, help="배치 데이터셋 묶음을 나누어 실행할 프로세스 수")
+    args = parser.parse_args(argv)
+    if args.period and len(args.period) != 4:
+        parser.error("특정 기간 백테스트에는 TICKER INTERVAL START END 네 값이 필요합니다")
+    return args
+
 
 if __name__ == '__main__':
-    #main()
-    run_specific_period_backtest()
+    arguments = parse_args()
+    if arguments.jobs:
+        import batch_jobs
+        batch_options = ['--workers', str(arguments.workers)]
+        if arguments.output:
+            batch_options += ['--output', arguments.output]
+        sys.exit(batch_jobs.main([arguments.jobs] + batch_options))
+    elif arguments.period:
+        run_specific_period_backtest(*arguments.period)
+    else:
+        main()
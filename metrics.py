@@ -0,0 +1,122 @@
+# Standard library imports
+from dataclasses import dataclass
+from typing import List, Union
+
+# Third-party imports
+import numpy as np
+
+# Local imports
+import data_source as ds
+
+
+def periods_per_year(interval: Union[str, int]) -> float:
+    """주기별 1년 봉 수 (연환산에 사용)"""
+    minutes = ds.interval_to_timedelta(interval).total_seconds() / 60
+    return ds.MINUTES_PER_YEAR / minutes
+
+
+@dataclass
+class EquityCurve:
+    """봉별 평가금액 (현금 + 보유 코인 x 종가)
+
+    equity[i] 는 i 번째 봉의 거래를 반영한 종가 기준 평가금액이고,
+    in_market[i] 는 그 시점에 코인을 보유하고 있는지 여부다.
+    """
+    equity: np.ndarray
+    in_market: np.ndarray
+    traded_value: float
+    initial_balance: float
+    periods_per_year: float
+
+    @property
+    def bars(self) -> int:
+        return len(self.equity)
+
+    def returns(self) -> np.ndarray:
+        """봉별 수익률 (첫 봉은 초기 자본 대비)"""
+        previous = np.concatenate(([self.initial_balance], self.equity[:-1]))
+        return self.equity / previous - 1
+
+
+@dataclass
+class RiskMetrics:
+    """평가금액 곡선의 위험/성과 지표 (수익률/낙폭/노출은 %, 회전율은 연환산 배수)"""
+    total_return: float
+    annual_return: float
+    max_drawdown: float
+    sharpe: float
+    sortino: float
+    calmar: float
+    exposure: float
+    turnover: float
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__dataclass_fields__}
+
+
+def max_drawdown(equity: np.ndarray, initial_balance: float) -> float:
+    """최대 낙폭 (0~1, 초기 자본도 고점 후보에 포함)"""
+    peaks = np.maximum.accumulate(np.concatenate(([initial_balance], equity)))[1:]
+    return float(np.max(1 - equity / peaks)) if len(equity) else 0.0
+
+
+def compute_metrics(curve: EquityCurve) -> RiskMetrics:
+    """평가금액 곡선에서 지표를 한 번에 계산 (무위험 수익률 0 가정)"""
+    if curve.bars == 0:
+        return RiskMetrics(0.0, 0.0, 0.0, np.nan, np.nan, np.nan, 0.0, 0.0)
+
+    returns = curve.returns()
+    scale = np.sqrt(curve.periods_per_year)
+    mean = returns.mean()
+    volatility = returns.std(ddof=1) if curve.bars > 1 else 0.0
+    downside = np.sqrt(np.mean(np.minimum(returns, 0) ** 2))
+
+    growth = curve.equity[-1] / curve.initial_balance
+    years = curve.bars / curve.periods_per_year
+    annual_return = growth ** (1 / years) - 1 if growth > 0 else -1.0
+    drawdown = max_drawdown(curve.equity, curve.initial_balance)
+
+    return RiskMetrics(
+        total_return=float((growth - 1) * 100),
+        annual_return=float(annual_return * 100),
+        max_drawdown=drawdown * 100,
+        sharpe=float(mean / volatility * scale) if volatility > 0 else np.nan,
+        sortino=float(mean / downside * scale) if downside > 0 else np.nan,
+        calmar=float(annual_return / drawdown) if drawdown > 0 else np.nan,
+        exposure=float(curve.in_market.mean() * 100),
+        turnover=float(curve.traded_value / curve.equity.mean() / years)
+    )
+
+
+def combine_curves(curves: List[EquityCurve]) -> EquityCurve:
+    """기간별 곡선을 복리로 이어 붙인 전체 곡선 (각 기간은 초기 자본에서 다시 시작한 결과)
+
+    기간 i 의 곡선은 이전 기간까지 누적된 자본 비율만큼 늘려 이어 붙인다.
+    """
+    curves = [curve for curve in curves if curve is not None and curve.bars]
+    if not curves:
+        return EquityCurve(np.zeros(0), np.zeros(0, dtype=bool), 0.0, 0.0, 1.0)
+
+    initial_balance = curves[0].initial_balance
+    # 기간별 최종 자본 비율의 누적곱으로 각 기간 시작 시점 배율 계산
+    growth = np.array([curve.equity[-1] / curve.initial_balance for curve in curves])
+    starts = initial_balance * np.concatenate(([1.0], np.cumprod(growth)[:-1]))
+    factors = starts / np.array([curve.initial_balance for curve in curves])
+
+    return EquityCurve(
+        equity=np.concatenate([curve.equity * factor for curve, factor in zip(curves, factors)]),
+        in_market=np.concatenate([curve.in_market for curve in curves]),
+        traded_value=float(sum(curve.traded_value * factor for curve, factor in zip(curves, factors))),
+        initial_balance=initial_balance,
+        periods_per_year=curves[0].periods_per_year
+    )
+
+
+def format_metrics(metrics: RiskMetrics) -> List[str]:
+    """로그 출력용 지표 문자열"""
+    return [
+        f"누적 수익률: {metrics.total_return:+.2f}% (연환산 {metrics.annual_return:+.2f}%)",
+        f"최대 낙폭: {metrics.max_drawdown:.2f}%",
+        f"샤프 / 소르티노 / 칼마: {metrics.sharpe:.2f} / {metrics.sortino:.2f} / {metrics.calmar:.2f}",
+        f"시장 노출: {metrics.exposure:.1f}%, 연간 회전율: {metrics.turnover:.1f}배"
+    ]
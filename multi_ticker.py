@@ -0,0 +1,264 @@
+# Standard library imports
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional
+
+# Third-party imports
+import pandas as pd
+import numpy as np
+
+# Local imports
+import main as bt
+import tick_db as db
+import rsi_sample as rsi
+import data_source as ds
+
+# === Constants ===
+BUY, SELL = 1, -1
+
+
+class MultiTickerPanel:
+    """여러 종목의 OHLCV 와 지표를 공통 시간 인덱스에 맞춘 (봉 x 종목) 배열
+
+    지표(Stoch RSI, SMA signal, 엘리어트 신호 강도)는 종목마다 자기 봉 순서대로 계산한 뒤
+    공통 인덱스로 정렬하므로 단일 종목 BackTest 와 같은 값을 가진다.
+    어떤 종목에 봉이 없는 시각은 close 가 NaN 이며 거래하지 않는다.
+    """
+
+    def __init__(self, frames: Dict[str, pd.DataFrame], sma_window: int = bt.SMA_WINDOW_SIZE):
+        self.tickers: List[str] = list(frames)
+        prepared = {ticker: self._prepare(frame, sma_window, ticker) for ticker, frame in frames.items()}
+
+        index = pd.DatetimeIndex([])
+        for frame in prepared.values():
+            index = index.union(frame.index)
+        self.index = index
+
+        def matrix(column: str, fill) -> np.ndarray:
+            return pd.concat({ticker: frame[column] for ticker, frame in prepared.items()},
+                             axis=1).reindex(index).fillna(fill).to_numpy(dtype=np.float64) \
+                if prepared else np.empty((len(index), 0))
+
+        self.close = matrix('close', np.nan)
+        self.rsi_k = matrix('rsi_k', np.nan)
+        self.rsi_d = matrix('rsi_d', np.nan)
+        self.signal = matrix('signal', 0)
+        self.buy_signal_strength = matrix('buy_signal_strength', 0)
+        self.sell_signal_strength = matrix('sell_signal_strength', 0)
+
+    @classmethod
+    def from_arrays(cls, index: pd.DatetimeIndex, tickers: List[str], open_price: np.ndarray,
+                    close: np.ndarray, sma_window: int = bt.SMA_WINDOW_SIZE) -> 'MultiTickerPanel':
+        """결측 없는 (봉 x 종목) 시가/종가 배열로 패널 생성
+
+        SMA 와 엘리어트 신호 강도는 2차원 배열 연산으로 모든 종목을 한 번에 계산하고,
+        Stoch RSI 는 TA-Lib 이 1차원만 받으므로 종목별로 계산한다.
+        """
+        panel = cls.__new__(cls)
+        panel.tickers = list(tickers)
+        panel.index = index
+        panel.close = np.asarray(close, dtype=np.float64)
+
+        sma = pd.DataFrame(open_price).rolling(window=sma_window).mean().to_numpy()
+        panel.signal = np.where(open_price > sma, 1.0, -1.0)
+
+        panel.rsi_k = np.empty_like(panel.close)
+        panel.rsi_d = np.empty_like(panel.close)
+        for column in range(panel.close.shape[1]):
+            panel.rsi_k[:, column], panel.rsi_d[:, column] = rsi.get_stoch_rsi(
+                {'close': panel.close[:, column]})
+
+        buy_strength, sell_strength = bt.precompute_elliott_signal_strength(panel.close)
+        panel.buy_signal_strength = buy_strength.astype(np.float64)
+        panel.sell_signal_strength = sell_strength.astype(np.float64)
+        return panel
+
+    @staticmethod
+    def _prepare(frame: pd.DataFrame, sma_window: int, ticker: str = '') -> pd.DataFrame:
+        """종목 하나의 지표 계산 (BackTest._prepare_data 및 _process_trading_data 와 같은 순서)"""
+        frame = db.add_indicators(frame.copy(), sma_window, ticker)
+        elliott = bt.precompute_elliott_analysis(frame, ticker=ticker)
+        for column in ('buy_signal_strength', 'sell_signal_strength'):
+            frame[column] = elliott[column].astype(np.float64)
+        return frame
+
+    @classmethod
+    def load(cls, source: ds.DataSource, tickers: List[str], interval: str,
+             start: datetime, end: datetime, sma_window: int = bt.SMA_WINDOW_SIZE) -> 'MultiTickerPanel':
+        """데이터 제공자에서 종목별로 조회해 패널 생성"""
+        return cls({ticker: source.get_ohlcv(ticker, interval, start, end) for ticker in tickers},
+                   sma_window)
+
+    @property
+    def shape(self):
+        return self.close.shape
+
+
+@dataclass
+class MultiTickerResult:
+    """종목별 계좌 결과"""
+    tickers: List[str]
+    results: Dict[str, bt.PeriodResult]
+    final_balance: np.ndarray
+    trade_count: np.ndarray
+    total_fee: np.ndarray
+    trades: pd.DataFrame
+
+    def to_frame(self) -> pd.DataFrame:
+        """종목별 요약 DataFrame"""
+        return pd.DataFrame({
+            'trading_profit': [self.results[ticker].trading_profit for ticker in self.tickers],
+            'coin_change_rate': [self.results[ticker].coin_change_rate for ticker in self.tickers],
+            'start_price': [self.results[ticker].start_price for ticker in self.tickers],
+            'end_price': [self.results[ticker].end_price for ticker in self.tickers],
+            'final_balance': self.final_balance,
+            'trade_count': self.trade_count,
+            'total_fee': self.total_fee
+        }, index=pd.Index(self.tickers, name='ticker'))
+
+
+class MultiTickerBackTest:
+    """모든 종목의 독립된 계좌를 한 봉씩 함께 진행하는 벡터화 백테스트
+
+    BackTest 의 매수/매도 규칙을 종목 축 NumPy 연산으로 수행한다.
+    매수/매도 신호가 있는 봉만 방문하므로 종목이 늘어도 Python 반복 횟수는 거의 늘지 않는다.
+    계좌 계산은 float64 이며, 거래 횟수와 수익률은 Decimal BackTest 와 반올림 오차 범위에서 같다.
+    """
+
+    def __init__(self, config: Optional[bt.TradingConfig] = None):
+        self.config = config or bt.TradingConfig()
+
+    def _signal_masks(self, panel: MultiTickerPanel):
+        """봉 x 종목 매수/매도 신호 (BackTest._process_trading_signals 조건)"""
+        config = self.config
+        valid = ~(np.isnan(panel.rsi_k) | np.isnan(panel.rsi_d) | np.isnan(panel.close))
+        with np.errstate(invalid='ignore'):
+            buy = valid & (panel.rsi_k > panel.rsi_d) & (panel.rsi_k < config.RSI_OVERSOLD) & (panel.signal > 0)
+            sell = valid & (panel.rsi_k < panel.rsi_d) & (panel.rsi_k > config.RSI_OVERBOUGHT) & (panel.signal < 0)
+        strong_buy = panel.buy_signal_strength >= config.STRONG_SIGNAL_STRENGTH
+        strong_sell = panel.sell_signal_strength >= config.STRONG_SIGNAL_STRENGTH
+        return buy, sell, strong_buy, strong_sell
+
+    def run(self, panel: MultiTickerPanel) -> MultiTickerResult:
+        """패널 전체 구간 실행"""
+        config = self.config
+        bars, count = panel.shape
+        initial_balance = float(config.INITIAL_BALANCE)
+        fee_rate = float(bt.TRADING_FEE_RATE)
+        min_rate = float(config.MIN_PRICE_CHANGE_RATE)
+        max_rate = float(config.MAX_PRICE_CHANGE_RATE)
+
+        balance = np.full(count, initial_balance)
+        coin_quantity = np.zeros(count)
+        min_price = np.zeros(count)
+        max_price = np.zeros(count)
+        total_fee = np.zeros(count)
+        trade_count = np.zeros(count, dtype=np.int64)
+        trade_log: List[tuple] = []
+
+        buy, sell, strong_buy, strong_sell = self._signal_masks(panel)
+        active_bars = np.flatnonzero(buy.any(axis=1) | sell.any(axis=1))
+
+        for i in active_bars:
+            price = panel.close[i]
+
+            # 매수: 잔고가 가격보다 많은 종목만 조건 확인 (check_buy_condition)
+            candidates = buy[i] & (balance > price)
+            if candidates.any():
+                first = candidates & (min_price == 0)
+                should_buy = candidates & ~first & ((min_price * min_rate < price) | strong_buy[i])
+                min_price[candidates] = price[candidates]
+                if should_buy.any():
+                    quantity = np.floor(balance / np.where(should_buy, price, 1.0))
+                    amount = price * quantity
+                    fee = amount * fee_rate
+                    executed = should_buy & (balance >= amount + fee)
+                    if executed.any():
+                        coin_quantity[executed] += quantity[executed]
+                        balance[executed] -= amount[executed] + fee[executed]
+                        total_fee[executed] += fee[executed]
+                        trade_count[executed] += 1
+                        for j in np.flatnonzero(executed):
+                            trade_log.append((i, j, BUY, price[j], quantity[j], amount[j], fee[j]))
+
+            # 매도: 보유 종목만 조건 확인 (check_sell_condition)
+            candidates = sell[i] & (coin_quantity > 0)
+            if candidates.any():
+                first = candidates & (max_price == 0)
+                should_sell = candidates & ~first & ((max_price * max_rate > price) | strong_sell[i])
+                max_price[candidates] = price[candidates]
+                if should_sell.any():
+                    self._sell(i, should_sell, price, balance, coin_quantity, total_fee,
+                               trade_count, fee_rate, trade_log)
+
+        # 종목별 시작/종료 가격과 미체결 코인 청산
+        has_price = ~np.isnan(panel.close)
+        first_bar = np.argmax(has_price, axis=0)
+        last_bar = bars - 1 - np.argmax(has_price[::-1], axis=0)
+        columns = np.arange(count)
+        start_price = np.where(has_price.any(axis=0), panel.close[first_bar, columns], 0.0) \
+            if bars else np.zeros(count)
+        end_price = np.where(has_price.any(axis=0), panel.close[last_bar, columns], 0.0) \
+            if bars else np.zeros(count)
+
+        holding = coin_quantity > 0
+        for j in np.flatnonzero(holding):
+            mask = columns == j
+            self._sell(last_bar[j], mask, np.where(mask, end_price, 0.0), balance, coin_quantity,
+                       total_fee, trade_count, fee_rate, trade_log)
+
+        profit = (balance - initial_balance) * 100 / initial_balance
+        with np.errstate(divide='ignore', invalid='ignore'):
+            coin_change = np.where(start_price > 0, (end_price - start_price) * 100 / start_price, 0.0)
+
+        results = {
+            ticker: bt.PeriodResult(
+                trading_profit=float(profit[j]),
+                coin_change_rate=float(coin_change[j]),
+                start_price=float(start_price[j]),
+                end_price=float(end_price[j])
+            ) for j, ticker in enumerate(panel.tickers)
+        }
+        logging.debug("다종목 백테스트 완료: %d개 종목, %d개 봉 중 %d개 신호 봉",
+                      count, bars, len(active_bars))
+        return MultiTickerResult(panel.tickers, results, balance, trade_count, total_fee,
+                                 self._trades_frame(panel, trade_log))
+
+    @staticmethod
+    def _sell(i: int, mask: np.ndarray, price: np.ndarray, balance: np.ndarray,
+              coin_quantity: np.ndarray, total_fee: np.ndarray, trade_count: np.ndarray,
+              fee_rate: float, trade_log: List[tuple]) -> None:
+        """mask 종목 전량 매도"""
+        amount = price * coin_quantity
+        fee = amount * fee_rate
+        for j in np.flatnonzero(mask):
+            trade_log.append((i, j, SELL, price[j], coin_quantity[j], amount[j], fee[j]))
+        balance[mask] += amount[mask] - fee[mask]
+        total_fee[mask] += fee[mask]
+        trade_count[mask] += 1
+        coin_quantity[mask] = 0.0
+
+    @staticmethod
+    def _trades_frame(panel: MultiTickerPanel, trade_log: List[tuple]) -> pd.DataFrame:
+        """거래 기록 DataFrame (TradingResult.trades_frame 과 같은 컬럼에 ticker 추가)"""
+        records = np.array(trade_log, dtype=np.float64).reshape(-1, 7)
+        bar, column = records[:, 0].astype(np.int64), records[:, 1].astype(np.int64)
+        return pd.DataFrame({
+            'ticker': np.array(panel.tickers, dtype=object)[column],
+            'type': np.where(records[:, 2] == BUY, 'BUY', 'SELL'),
+            'price': records[:, 3],
+            'quantity': records[:, 4],
+            'total_amount': records[:, 5],
+            'fee': records[:, 6]
+        }, index=pd.DatetimeIndex(panel.index[bar], name='timestamp'))
+
+
+def run_multi_ticker_backtest(tickers: List[str], interval: str, start: datetime, end: datetime,
+                              config: Optional[bt.TradingConfig] = None,
+                              data_source: Optional[ds.DataSource] = None) -> MultiTickerResult:
+    """여러 종목을 한 번의 벡터화 실행으로 백테스트"""
+    config = config or bt.TradingConfig()
+    panel = MultiTickerPanel.load(data_source or ds.UpbitDataSource(), tickers, interval,
+                                  start, end, config.SMA_WINDOW)
+    return MultiTickerBackTest(config).run(panel)
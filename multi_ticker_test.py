@@ -1,6 +1,7 @@
 import logging
 from datetime import datetime, timedelta
 import main as bt
+import multi_ticker as mt
 
 date_str = '2019-01-01 00:00:00'
 start = datetime.strptime(date_str, '%Y-%m-%d %H:%M:%S')
@@ -9,14 +10,17 @@ time_gap = timedelta(days=30)
 tic = ['15']
 ticker = ['KRW-ETH','KRW-ETC']
 
-up = bt.backTest()
+bt.setup_logging()
 
-for i in range(1,2): #Ticker
-	total_profit = 0
-	for j in range(1): #Tic
-		for k in range(16): #Range
-			total_profit =  total_profit + up.run_backTest(ticker[i], tic[j], start+time_gap*k, start+time_gap*(k+1), False)
+# 모든 종목을 한 번에 (봉 x 종목) 배열로 실행
+for j in range(1): #Tic
+	total_profit = {t: 0 for t in ticker}
+	for k in range(16): #Range
+		result = mt.run_multi_ticker_backtest(ticker, tic[j], start+time_gap*k, start+time_gap*(k+1))
+		for t in ticker:
+			total_profit[t] = total_profit[t] + result.results[t].trading_profit
 
-	logging.info(f"\n======== Total Profit =========")
-	logging.info(f"{round(total_profit, 2)} %")
-	logging.info(f"============================\n")
+	for t in ticker:
+		logging.info(f"\n======== {t} Total Profit =========")
+		logging.info(f"{round(total_profit[t], 2)} %")
+		logging.info(f"============================\n")
@@ -0,0 +1,264 @@
+# Standard library imports
+import os
+import logging
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+# Third-party imports
+import pandas as pd
+import numpy as np
+
+try:
+    import fcntl  # POSIX
+except ImportError:
+    fcntl = None
+    import msvcrt  # Windows
+
+# === Constants ===
+OHLCV_COLUMNS = ['open', 'high', 'low', 'close', 'volume', 'value']
+RANGE_RESOLUTION_NS = 1_000_000_000  # 저장 구간은 초 단위로 관리
+# 업비트 봉은 UTC 00:00 기준으로 나뉘며 pyupbit 인덱스는 한국 시간(UTC+9)
+UPBIT_BAR_ORIGIN = pd.Timedelta(hours=9)
+
+# Cache Configuration
+CACHE_CONFIG = {
+    'DIRECTORY': os.environ.get('OHLCV_CACHE_DIR', '.ohlcv_cache'),
+    # 네트워크를 사용하지 않고 저장된 데이터만 사용
+    'OFFLINE': os.environ.get('OHLCV_CACHE_OFFLINE', '0') == '1'
+}
+
+TimeLike = Union[datetime, str, pd.Timestamp]
+Fetcher = Callable[[str, str, datetime, datetime], Optional[pd.DataFrame]]
+
+
+# === Range Utilities ===
+def _to_ns(value: TimeLike) -> int:
+    """시간 값을 초 단위로 내림한 ns 정수로 변환"""
+    return pd.Timestamp(value).floor('s').value
+
+
+def merge_ranges(ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """겹치거나 맞닿은 구간 병합"""
+    merged: List[Tuple[int, int]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + RANGE_RESOLUTION_NS:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def missing_ranges(ranges: List[Tuple[int, int]], start: int, end: int) -> List[Tuple[int, int]]:
+    """저장된 구간에 포함되지 않은 [start, end] 의 빈 구간 계산"""
+    gaps = []
+    cursor = start
+    for range_start, range_end in merge_ranges(ranges):
+        if range_end < cursor:
+            continue
+        if range_start > end:
+            break
+        if range_start > cursor:
+            gaps.append((cursor, range_start - RANGE_RESOLUTION_NS))
+        cursor = max(cursor, range_end + RANGE_RESOLUTION_NS)
+    if cursor <= end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+@contextmanager
+def _file_lock(path: str):
+    """다른 프로세스와 공유하는 배타적 파일 잠금 (path + '.lock')"""
+    with open(path + '.lock', 'a+b') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def open_bar_start(interval: str, now: Optional[TimeLike] = None) -> pd.Timestamp:
+    """now(기본값 현재 시각)가 속한, 아직 마감되지 않은 봉의 시작 시각"""
+    utc = pd.Timestamp(now if now is not None else datetime.now()) - UPBIT_BAR_ORIGIN
+    interval = str(interval)
+    if interval.isdigit() or interval.startswith('minute'):
+        start = utc.floor(f"{int(interval[len('minute'):] if interval.startswith('minute') else interval)}min")
+    elif interval == 'day':
+        start = utc.floor('D')
+    elif interval == 'week':
+        start = utc.floor('D') - pd.Timedelta(days=utc.dayofweek)  # 월요일 시작
+    elif interval == 'month':
+        start = utc.floor('D').replace(day=1)
+    else:
+        raise ValueError(f"지원하지 않는 주기입니다: {interval}")
+    return start + UPBIT_BAR_ORIGIN
+
+
+def closed_bars_end(interval: str, now: Optional[TimeLike] = None) -> int:
+    """마감된 봉만 포함하는 저장 구간 끝 (ns 정수, 진행 중인 봉 시작 직전)"""
+    return _to_ns(open_bar_start(interval, now)) - RANGE_RESOLUTION_NS
+
+
+def fetch_from_upbit(ticker: str, interval: str,
+                     start: datetime, end: datetime) -> Optional[pd.DataFrame]:
+    """pyupbit 로 OHLCV 조회"""
+    import pyupbit as up
+    return up.get_ohlcv_from(ticker, interval, start, end)
+
+
+# === OHLCV Cache ===
+class OHLCVCache:
+    """(종목, 주기) 별 OHLCV 를 NumPy 컬럼 파일로 저장하는 로컬 캐시
+
+    저장된 시간 구간을 함께 기록해 요청 구간 중 비어 있는 부분만 조회하고,
+    이미 저장된 구간의 요청은 디스크에서 바로 응답한다.
+    """
+
+    def __init__(self, directory: Optional[str] = None, offline: Optional[bool] = None,
+                 fetcher: Optional[Fetcher] = None):
+        self.directory = directory or CACHE_CONFIG['DIRECTORY']
+        self.offline = CACHE_CONFIG['OFFLINE'] if offline is None else offline
+        self.fetcher = fetcher or fetch_from_upbit
+        self._frames: Dict[Tuple[str, str], pd.DataFrame] = {}
+        self._ranges: Dict[Tuple[str, str], List[Tuple[int, int]]] = {}
+        # 마지막으로 읽거나 쓴 캐시 파일의 (수정 시각, 크기)
+        self._stamps: Dict[Tuple[str, str], Optional[Tuple[int, int]]] = {}
+
+    def _path(self, ticker: str, interval: str) -> str:
+        """캐시 파일 경로"""
+        return os.path.join(self.directory, f"{ticker}_{interval}.npz")
+
+    @staticmethod
+    def _stamp(path: str) -> Optional[Tuple[int, int]]:
+        """파일 (수정 시각, 크기) (없으면 None)"""
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _load(self, ticker: str, interval: str) -> Tuple[pd.DataFrame, List[Tuple[int, int]]]:
+        """캐시 파일 로드 (메모리에 있으면 재사용)"""
+        key = (ticker, interval)
+        if key not in self._frames:
+            path = self._path(ticker, interval)
+            self._stamps[key] = self._stamp(path)
+            if os.path.exists(path):
+                with np.load(path) as stored:
+                    index = pd.DatetimeIndex(stored['index'].astype('datetime64[ns]'))
+                    frame = pd.DataFrame({column: stored[column] for column in OHLCV_COLUMNS},
+                                         index=index)
+                    ranges = [tuple(r) for r in stored['ranges'].tolist()]
+            else:
+                frame = pd.DataFrame({column: np.empty(0) for column in OHLCV_COLUMNS},
+                                     index=pd.DatetimeIndex([], dtype='datetime64[ns]'))
+                ranges = []
+            self._frames[key] = frame
+            self._ranges[key] = ranges
+        return self._frames[key], self._ranges[key]
+
+    def _save(self, ticker: str, interval: str) -> None:
+        """캐시 파일 저장 (프로세스별 임시 파일에 쓴 후 교체)"""
+        key = (ticker, interval)
+        frame = self._frames[key]
+        path = self._path(ticker, interval)
+        tmp_path = f"{path}.{os.getpid()}.tmp.npz"
+        np.savez(tmp_path,
+                 index=frame.index.values.astype('datetime64[ns]').astype(np.int64),
+                 ranges=np.array(self._ranges[key], dtype=np.int64).reshape(-1, 2),
+                 **{column: frame[column].to_numpy(dtype=np.float64) for column in OHLCV_COLUMNS})
+        os.replace(tmp_path, path)
+        self._stamps[key] = self._stamp(path)
+
+    def cached_ranges(self, ticker: str, interval: str) -> List[Tuple[pd.Timestamp, pd.Timestamp]]:
+        """저장된 시간 구간 목록"""
+        _, ranges = self._load(ticker, interval)
+        return [(pd.Timestamp(start), pd.Timestamp(end)) for start, end in ranges]
+
+    def store(self, ticker: str, interval: str, data: pd.DataFrame,
+              start: TimeLike, end: TimeLike) -> None:
+        """조회한 데이터를 저장하고 [start, end] 를 저장 구간으로 기록"""
+        self.store_chunks(ticker, interval, [(data, start, end)])
+
+    def store_chunks(self, ticker: str, interval: str,
+                     chunks: List[Tuple[Optional[pd.DataFrame], TimeLike, TimeLike]]) -> None:
+        """(데이터, 시작, 끝) 조각 여러 개를 저장 (파일은 한 번만 기록)"""
+        key = (ticker, interval)
+        frames = [data[OHLCV_COLUMNS].astype(np.float64)
+                  for data, _, _ in chunks if data is not None and not data.empty]
+        os.makedirs(self.directory, exist_ok=True)
+        # 읽기-병합-쓰기 동안 파일을 잠가 다른 프로세스가 기록한 구간을 덮어쓰지 않음
+        path = self._path(ticker, interval)
+        with _file_lock(path):
+            # 마지막으로 읽거나 쓴 뒤 다른 프로세스가 기록했을 때만 디스크에서 다시 읽어 병합
+            if self._stamps.get(key) != self._stamp(path):
+                self._frames.pop(key, None)
+            frame, ranges = self._load(ticker, interval)
+            if frames:
+                data = pd.concat(frames)
+                data.index = pd.DatetimeIndex(data.index).astype('datetime64[ns]')
+                frame = pd.concat([frame, data])
+                frame = frame[~frame.index.duplicated(keep='last')].sort_index()
+            self._frames[key] = frame
+            self._ranges[key] = merge_ranges(ranges + [(_to_ns(start), _to_ns(end)) for _, start, end in chunks])
+            self._save(ticker, interval)
+
+    def missing_ranges(self, ticker: str, interval: str,
+                       start: TimeLike, end: TimeLike) -> List[Tuple[int, int]]:
+        """[start, end] 중 저장되지 않은 구간 (ns 정수)"""
+        _, ranges = self._load(ticker, interval)
+        return missing_ranges(ranges, _to_ns(start), _to_ns(end))
+
+    def ensure(self, ticker: str, interval: str, start: TimeLike, end: TimeLike) -> None:
+        """[start, end] 구간 중 저장되지 않은 부분만 네트워크에서 가져와 저장"""
+        gaps = self.missing_ranges(ticker, interval, start, end)
+        if gaps and self.offline:
+            logging.debug(f"오프라인 모드: {ticker} {interval} 캐시에 없는 구간 {len(gaps)}개는 제외됩니다")
+        elif gaps:
+            closed_end = closed_bars_end(interval)
+            for gap_start, gap_end in gaps:
+                if gap_start > closed_end:
+                    continue
+                # 진행 중인 봉은 OHLCV 가 아직 바뀌므로 저장하지 않고 마감된 봉까지만 저장 구간으로 기록
+                gap_end = min(gap_end, closed_end)
+                fetched = self.fetcher(ticker, interval,
+                                       pd.Timestamp(gap_start).to_pydatetime(),
+                                       pd.Timestamp(gap_end).to_pydatetime())
+                if fetched is None:
+                    logging.warning(f"데이터 조회 실패: {ticker} {interval} "
+                                    f"{pd.Timestamp(gap_start)} ~ {pd.Timestamp(gap_end)}")
+                    continue
+                fetched = fetched[fetched.index <= pd.Timestamp(gap_end)]
+                self.store(ticker, interval, fetched, gap_start, gap_end)
+
+    def frame(self, ticker: str, interval: str) -> pd.DataFrame:
+        """저장된 전체 OHLCV (복사하지 않으므로 수정하지 말 것, 저장할 때마다 새 객체로 바뀜)"""
+        frame, _ = self._load(ticker, interval)
+        return frame
+
+    def get(self, ticker: str, interval: str, start: TimeLike, end: TimeLike) -> pd.DataFrame:
+        """[start, end] 구간 OHLCV 조회 (빈 구간만 네트워크에서 가져옴)"""
+        self.ensure(ticker, interval, start, end)
+        frame = self.frame(ticker, interval)
+        lo = frame.index.searchsorted(pd.Timestamp(_to_ns(start)), side='left')
+        hi = frame.index.searchsorted(pd.Timestamp(_to_ns(end)), side='right')
+        return frame.iloc[lo:hi].copy()
+
+
+_default_cache: Optional[OHLCVCache] = None
+
+
+def get_default_cache() -> OHLCVCache:
+    """CACHE_CONFIG 설정을 사용하는 기본 캐시"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = OHLCVCache()
+    return _default_cache
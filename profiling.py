@@ -0,0 +1,178 @@
+# Standard library imports
+import os
+import json
+import cProfile
+from array import array
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from time import perf_counter
+from typing import Callable, Dict, Iterable, Iterator, List, Union
+
+# Third-party imports
+import numpy as np
+
+# === Constants ===
+PERCENTILES = [50, 90, 95, 99]
+PROFILE_EXTENSION = '.json'
+CPROFILE_EXTENSION = '.prof'
+
+
+class StageProfiler:
+    """BackTest 단계별 호출 횟수와 소요시간 기록
+
+    stage(name) 컨텍스트 매니저로 구간을 측정하고, wrap(name, func) 로 메서드 호출마다 측정한다.
+    cprofile=True 이면 session() 안에서 cProfile 도 함께 실행해 pstats 호환 파일로 저장할 수 있다.
+    """
+    enabled = True
+
+    def __init__(self, cprofile: bool = False):
+        self._durations: Dict[str, array] = {}
+        self._cprofile = cProfile.Profile() if cprofile else None
+
+    def record(self, name: str, seconds: float) -> None:
+        """소요시간 기록"""
+        durations = self._durations.get(name)
+        if durations is None:
+            durations = self._durations[name] = array('d')
+        durations.append(seconds)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """with 블록 소요시간 측정"""
+        started = perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, perf_counter() - started)
+
+    def wrap(self, name: str, func: Callable) -> Callable:
+        """호출마다 소요시간을 기록하는 함수로 감싸기"""
+        @wraps(func)
+        def timed(*args, **kwargs):
+            started = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.record(name, perf_counter() - started)
+        return timed
+
+    @contextmanager
+    def session(self) -> Iterator['StageProfiler']:
+        """측정 구간 (cProfile 사용 시 이 구간만 프로파일링)"""
+        if self._cprofile is not None:
+            self._cprofile.enable()
+        try:
+            yield self
+        finally:
+            if self._cprofile is not None:
+                self._cprofile.disable()
+
+    def merge(self, other: 'StageProfiler') -> 'StageProfiler':
+        """다른 프로파일의 기록 합치기"""
+        for name, durations in other._durations.items():
+            self._durations.setdefault(name, array('d')).extend(durations)
+        return self
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """단계별 호출 횟수, 누적/평균/최대 시간과 백분위 시간(초)"""
+        result = {}
+        for name, durations in self._durations.items():
+            values = np.frombuffer(durations, dtype=np.float64) if durations else np.zeros(0)
+            stats = {
+                'count': int(len(values)),
+                'total': float(values.sum()),
+                'mean': float(values.mean()) if len(values) else 0.0,
+                'max': float(values.max()) if len(values) else 0.0
+            }
+            for percentile, value in zip(PERCENTILES, np.percentile(values, PERCENTILES)
+                                         if len(values) else [0.0] * len(PERCENTILES)):
+                stats[f"p{percentile}"] = float(value)
+            result[name] = stats
+        return result
+
+    def to_dict(self) -> Dict:
+        """JSON 저장용 사전 (원시 측정값 포함, 여러 실행을 합쳐 백분위를 다시 계산할 수 있음)"""
+        return {
+            'summary': self.summary(),
+            'durations': {name: durations.tolist() for name, durations in self._durations.items()}
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'StageProfiler':
+        profiler = cls()
+        for name, durations in data.get('durations', {}).items():
+            profiler._durations[name] = array('d', durations)
+        return profiler
+
+    def dump(self, path: str) -> None:
+        """JSON 파일로 저장 (cProfile 사용 시 같은 이름의 .prof 파일도 저장)"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f)
+        if self._cprofile is not None:
+            # pstats.Stats(*paths) 로 여러 파일을 합쳐 볼 수 있음
+            self._cprofile.dump_stats(os.path.splitext(path)[0] + CPROFILE_EXTENSION)
+
+
+class NullProfiler:
+    """측정하지 않는 프로파일러 (기본값, 추가 비용 없음)"""
+    enabled = False
+
+    _null_stage = nullcontext()
+
+    def record(self, name: str, seconds: float) -> None:
+        pass
+
+    def stage(self, name: str):
+        return self._null_stage
+
+    def wrap(self, name: str, func: Callable) -> Callable:
+        return func
+
+    def session(self):
+        return nullcontext(self)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        return {}
+
+
+NULL_PROFILER = NullProfiler()
+
+
+def load_profile(path: str) -> StageProfiler:
+    """JSON 프로파일 파일 읽기"""
+    with open(path, encoding='utf-8') as f:
+        return StageProfiler.from_dict(json.load(f))
+
+
+def merge_profiles(profiles: Iterable[StageProfiler]) -> StageProfiler:
+    """여러 실행의 프로파일을 하나로 합치기"""
+    merged = StageProfiler()
+    for profiler in profiles:
+        merged.merge(profiler)
+    return merged
+
+
+def load_profile_directory(directory: str) -> StageProfiler:
+    """디렉터리의 모든 JSON 프로파일을 합쳐 읽기 (스윕/그리드 전체 집계용)"""
+    paths: List[str] = sorted(os.path.join(directory, name) for name in os.listdir(directory)
+                              if name.endswith(PROFILE_EXTENSION))
+    return merge_profiles(load_profile(path) for path in paths)
+
+
+def format_summary(summary: Dict[str, Dict[str, float]]) -> str:
+    """단계별 요약 표 문자열 (누적 시간 내림차순)"""
+    lines = [f"{'단계':<18} {'호출':>8} {'누적(s)':>10} {'평균(ms)':>10} {'p95(ms)':>10} {'최대(ms)':>10}"]
+    for name, stats in sorted(summary.items(), key=lambda item: item[1]['total'], reverse=True):
+        lines.append(f"{name:<18} {stats['count']:>8} {stats['total']:>10.4f} "
+                     f"{stats['mean'] * 1000:>10.4f} {stats['p95'] * 1000:>10.4f} {stats['max'] * 1000:>10.4f}")
+    return "\n".join(lines)
+
+
+def create_profiler(enabled: bool = False, cprofile: bool = False) -> Union[StageProfiler, NullProfiler]:
+    """설정에 맞는 프로파일러 생성 (비활성화 시 NULL_PROFILER)"""
+    if not enabled and not cprofile:
+        return NULL_PROFILER
+    return StageProfiler(cprofile=cprofile)
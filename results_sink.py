@@ -0,0 +1,185 @@
+# Standard library imports
+import os
+import glob
+import json
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+# Third-party imports
+import pandas as pd
+
+# === Constants ===
+# Results Sink Configuration
+SINK_CONFIG = {
+    'BUFFER_SIZE': 10_000  # 이 수만큼 레코드가 쌓이면 파일에 기록
+}
+
+TRADE_RECORD = 'trades'
+PERIOD_RECORD = 'periods'
+
+
+def _to_json_value(value):
+    """JSON 으로 기록할 수 없는 값 변환"""
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (datetime, pd.Timestamp)):
+        return value.isoformat()
+    if hasattr(value, 'item'):
+        return value.item()
+    return value
+
+
+class ResultSink:
+    """거래 내역과 기간별 요약을 구조화된 레코드로 모아 기록하는 저장소 인터페이스
+
+    레코드는 메모리에 모았다가 buffer_size 마다 한꺼번에 기록한다.
+    path 는 파일 이름 앞부분이며 '{path}.trades.*', '{path}.periods.*' 파일이 만들어진다.
+    같은 path 로 다시 만들면 이전 실행의 레코드가 중복으로 읽히지 않도록 기존 파일을 지운다.
+    """
+    enabled = True
+    extension = ''
+
+    def __init__(self, path: str, buffer_size: int = SINK_CONFIG['BUFFER_SIZE']):
+        self.path = path
+        self.buffer_size = buffer_size
+        self._buffers: Dict[str, List[pd.DataFrame]] = {TRADE_RECORD: [], PERIOD_RECORD: []}
+        self._buffered = 0
+        for kind in self._buffers:
+            for file_path in self._record_files(kind):
+                os.remove(file_path)
+
+    def record_path(self, kind: str) -> str:
+        """레코드 종류별 파일 경로"""
+        return f"{self.path}.{kind}{self.extension}"
+
+    def _record_files(self, kind: str) -> List[str]:
+        """이미 있는 레코드 종류별 파일 목록"""
+        path = self.record_path(kind)
+        return [path] if os.path.exists(path) else []
+
+    def write_trades(self, trades: pd.DataFrame, **context) -> None:
+        """거래 내역 추가 (TradingResult.trades_frame 형식, context 는 종목/주기 등 공통 컬럼)"""
+        if trades.empty:
+            return
+        frame = trades.reset_index()
+        for position, (name, value) in enumerate(context.items()):
+            frame.insert(position, name, value)
+        self._append(TRADE_RECORD, frame)
+
+    def write_period(self, **summary) -> None:
+        """기간별 요약 레코드 추가"""
+        self._append(PERIOD_RECORD, pd.DataFrame([summary]))
+
+    def _append(self, kind: str, frame: pd.DataFrame) -> None:
+        self._buffers[kind].append(frame)
+        self._buffered += len(frame)
+        if self._buffered >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """모아 둔 레코드 기록"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        for kind, frames in self._buffers.items():
+            if frames:
+                self._write(kind, pd.concat(frames, ignore_index=True))
+                frames.clear()
+        self._buffered = 0
+
+    def _write(self, kind: str, frame: pd.DataFrame) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self) -> 'ResultSink':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class JsonlSink(ResultSink):
+    """JSON Lines 파일 저장소 (생성할 때 비우고 flush 마다 파일 끝에 추가)"""
+    extension = '.jsonl'
+
+    def _write(self, kind: str, frame: pd.DataFrame) -> None:
+        columns = list(frame.columns)
+        with open(self.record_path(kind), 'a', encoding='utf-8') as f:
+            for row in frame.itertuples(index=False, name=None):
+                f.write(json.dumps({column: _to_json_value(value) for column, value in zip(columns, row)},
+                                   ensure_ascii=False))
+                f.write('\n')
+
+
+class ParquetSink(ResultSink):
+    """Parquet 파일 저장소 (pyarrow 필요)
+
+    Parquet 파일은 이어 쓸 수 없으므로 flush 마다 '{path}.{kind}.{번호}.parquet' 조각 파일을 만든다.
+    pd.read_parquet 에 조각 파일 목록을 넘기거나 load_records 로 한 번에 읽는다.
+    """
+    extension = '.parquet'
+
+    def __init__(self, path: str, buffer_size: int = SINK_CONFIG['BUFFER_SIZE']):
+        super().__init__(path, buffer_size)
+        self._parts: Dict[str, int] = {TRADE_RECORD: 0, PERIOD_RECORD: 0}
+
+    def record_path(self, kind: str) -> str:
+        return f"{self.path}.{kind}.{self._parts[kind]:05d}{self.extension}"
+
+    def _record_files(self, kind: str) -> List[str]:
+        return glob.glob(f"{glob.escape(self.path)}.{kind}.[0-9][0-9][0-9][0-9][0-9]{self.extension}")
+
+    def _write(self, kind: str, frame: pd.DataFrame) -> None:
+        frame = frame.apply(lambda column: column.map(_to_json_value)
+                            if column.dtype == object else column)
+        frame.to_parquet(self.record_path(kind), index=False)
+        self._parts[kind] += 1
+
+
+class NullSink:
+    """기록하지 않는 저장소 (기본값)"""
+    enabled = False
+
+    def write_trades(self, trades: pd.DataFrame, **context) -> None:
+        pass
+
+    def write_period(self, **summary) -> None:
+        pass
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+NULL_SINK = NullSink()
+
+SINKS = {
+    'jsonl': JsonlSink,
+    'parquet': ParquetSink
+}
+
+
+def create_sink(name: Optional[str], path: Optional[str] = None, **options):
+    """이름으로 결과 저장소 생성 ('jsonl', 'parquet', None: 기록 안 함)"""
+    if not name or not path:
+        return NULL_SINK
+    if name not in SINKS:
+        raise ValueError(f"알 수 없는 결과 저장 형식입니다: {name}")
+    return SINKS[name](path, **options)
+
+
+def load_records(directory: str, kind: str = PERIOD_RECORD) -> pd.DataFrame:
+    """디렉터리의 모든 결과 파일에서 한 종류의 레코드를 읽어 합치기"""
+    frames = []
+    for name in sorted(os.listdir(directory)):
+        path = os.path.join(directory, name)
+        if name.endswith(f".{kind}{JsonlSink.extension}"):
+            frames.append(pd.read_json(path, lines=True))
+        elif f".{kind}." in name and name.endswith(ParquetSink.extension):
+            frames.append(pd.read_parquet(path))
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
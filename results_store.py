@@ -0,0 +1,215 @@
+# Standard library imports
+import os
+import json
+import sqlite3
+import hashlib
+from dataclasses import asdict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# Third-party imports
+import pandas as pd
+import numpy as np
+
+# === Constants ===
+# 결과에 영향을 주는 모듈 (소스가 바뀌면 이전 결과를 다시 쓰지 않음)
+RESULT_MODULES = ['main.py', 'tick_db.py', 'rsi_sample.py', 'ledger.py', 'metrics.py', 'data_source.py',
+                  'strategies.py', 'fills.py']
+METRIC_COLUMNS = ['total_return', 'annual_return', 'max_drawdown', 'sharpe', 'sortino',
+                  'calmar', 'exposure', 'turnover']
+
+PeriodKey = Tuple[str, str, str, str]  # (종목, 주기, 기간 시작, 기간 끝)
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS configs (
+    config_hash TEXT PRIMARY KEY,
+    config TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS periods (
+    ticker TEXT NOT NULL,
+    interval TEXT NOT NULL,
+    period_start TEXT NOT NULL,
+    period_end TEXT NOT NULL,
+    config_hash TEXT NOT NULL,
+    code_version TEXT NOT NULL,
+    year INTEGER,
+    month INTEGER,
+    trading_profit REAL,
+    coin_change_rate REAL,
+    start_price REAL,
+    end_price REAL,
+    {', '.join(f'{column} REAL' for column in METRIC_COLUMNS)},
+    traded_value REAL,
+    initial_balance REAL,
+    periods_per_year REAL,
+    equity BLOB,
+    in_market BLOB,
+    completed_at TEXT,
+    error TEXT,
+    PRIMARY KEY (ticker, interval, period_start, period_end, config_hash, code_version)
+);
+CREATE TABLE IF NOT EXISTS trades (
+    ticker TEXT NOT NULL,
+    interval TEXT NOT NULL,
+    period_start TEXT NOT NULL,
+    period_end TEXT NOT NULL,
+    config_hash TEXT NOT NULL,
+    code_version TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    type INTEGER NOT NULL,
+    price INTEGER NOT NULL,
+    quantity INTEGER NOT NULL,
+    total_amount INTEGER NOT NULL,
+    fee INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS trades_period
+    ON trades (ticker, interval, period_start, period_end, config_hash, code_version);
+"""
+
+
+def config_hash(config) -> str:
+    """TradingConfig 값의 해시 (필드 순서와 무관)"""
+    text = json.dumps(asdict(config), sort_keys=True, default=str)
+    return hashlib.sha256(text.encode()).hexdigest()[:16]
+
+
+def source_code_version(modules: Iterable[str] = RESULT_MODULES) -> str:
+    """결과에 영향을 주는 모듈 소스의 해시 (BACKTEST_CODE_VERSION 환경 변수가 있으면 그 값)"""
+    version = os.environ.get('BACKTEST_CODE_VERSION')
+    if version:
+        return version
+    hasher = hashlib.sha256()
+    directory = os.path.dirname(os.path.abspath(__file__))
+    for module in modules:
+        path = os.path.join(directory, module)
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                hasher.update(f.read())
+    return hasher.hexdigest()[:16]
+
+
+def _time_text(value) -> str:
+    return pd.Timestamp(value).isoformat()
+
+
+class ResultsStore:
+    """기간별 결과와 거래 내역을 SQLite 파일에 저장하는 결과 저장소
+
+    결과는 (종목, 주기, 기간, 설정 해시, 코드 버전) 으로 구분하며, 완료된 기간만 저장하므로
+    중단 후 다시 실행하면 저장되지 않은 기간만 계산하면 된다.
+    여러 프로세스가 읽을 수 있지만 기록은 한 프로세스(그리드를 실행하는 부모 프로세스)에서만 한다.
+    """
+
+    def __init__(self, path: str, code_version: Optional[str] = None):
+        self.path = path
+        self.code_version = code_version or source_code_version()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(path, timeout=30)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.executescript(SCHEMA)
+        columns = {row[1] for row in self._connection.execute('PRAGMA table_info(periods)')}
+        if 'error' not in columns:
+            # error 컬럼이 없던 이전 저장소 파일
+            self._connection.execute('ALTER TABLE periods ADD COLUMN error TEXT')
+
+    def completed(self, config, tickers: Optional[List[str]] = None) -> Set[PeriodKey]:
+        """설정과 현재 코드 버전으로 완료된 (종목, 주기, 시작, 끝) 목록"""
+        rows = self._connection.execute(
+            'SELECT ticker, interval, period_start, period_end FROM periods '
+            'WHERE config_hash = ? AND code_version = ?',
+            (config_hash(config), self.code_version)).fetchall()
+        return {tuple(row) for row in rows if tickers is None or row[0] in tickers}
+
+    @staticmethod
+    def period_key(ticker: str, interval: str, start, end) -> PeriodKey:
+        return ticker, str(interval), _time_text(start), _time_text(end)
+
+    def save(self, ticker: str, interval: str, period, config, result) -> None:
+        """완료된 기간 결과와 거래 내역 저장 (같은 키가 있으면 교체)
+
+        result 는 main.PeriodResult 이며, 예외로 채운 결과(result.failed)는 저장하지 않아 다음 실행에서 다시 계산한다.
+        데이터가 없는 기간(상장 전 등)은 오류 메시지와 함께 완료된 빈 결과로 저장해 다시 조회하지 않는다.
+        """
+        if result.failed:
+            return
+        key = self.period_key(ticker, interval, period.start, period.end)
+        row_key = key + (config_hash(config), self.code_version)
+        equity = result.equity
+        metrics = result.metrics.to_dict() if equity is not None else {}
+        trades = result.trades if result.trades is not None else np.zeros(0)
+
+        with self._connection:
+            self._connection.execute('INSERT OR IGNORE INTO configs VALUES (?, ?)',
+                                     (row_key[4], json.dumps(asdict(config), sort_keys=True, default=str)))
+            self._connection.execute(
+                'DELETE FROM trades WHERE ticker = ? AND interval = ? AND period_start = ? '
+                'AND period_end = ? AND config_hash = ? AND code_version = ?', row_key)
+            values = row_key + (
+                period.year, period.month,
+                result.trading_profit, result.coin_change_rate, result.start_price, result.end_price,
+                *[metrics.get(column) for column in METRIC_COLUMNS],
+                equity.traded_value if equity is not None else None,
+                equity.initial_balance if equity is not None else None,
+                equity.periods_per_year if equity is not None else None,
+                equity.equity.astype(np.float64).tobytes() if equity is not None else None,
+                np.packbits(equity.in_market).tobytes() if equity is not None else None,
+                datetime.now().isoformat(),
+                result.error
+            )
+            self._connection.execute(
+                f"INSERT OR REPLACE INTO periods VALUES ({', '.join(['?'] * len(values))})", values)
+            self._connection.executemany(
+                'INSERT INTO trades VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                [row_key + (_time_text(record['timestamp']), int(record['type']), int(record['price']),
+                            int(record['quantity']), int(record['total_amount']), int(record['fee']))
+                 for record in trades])
+
+    def periods_frame(self, config=None, all_versions: bool = False) -> pd.DataFrame:
+        """저장된 기간 결과 DataFrame (config 가 있으면 그 설정만, 기본은 현재 코드 버전만)"""
+        conditions, parameters = [], []
+        if config is not None:
+            conditions.append('config_hash = ?')
+            parameters.append(config_hash(config))
+        if not all_versions:
+            conditions.append('code_version = ?')
+            parameters.append(self.code_version)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ''
+        return pd.read_sql_query(f"SELECT * FROM periods{where} ORDER BY ticker, interval, period_start",
+                                 self._connection, params=parameters)
+
+    def trades_frame(self, ticker: str, interval: str, period, config) -> pd.DataFrame:
+        """한 기간의 거래 내역 (main.TRADE_DTYPE 과 같은 배율의 고정소수점 정수)"""
+        key = self.period_key(ticker, interval, period.start, period.end)
+        frame = pd.read_sql_query(
+            'SELECT timestamp, type, price, quantity, total_amount, fee FROM trades '
+            'WHERE ticker = ? AND interval = ? AND period_start = ? AND period_end = ? '
+            'AND config_hash = ? AND code_version = ? ORDER BY rowid',
+            self._connection, params=key + (config_hash(config), self.code_version))
+        frame['timestamp'] = pd.to_datetime(frame['timestamp'])
+        return frame
+
+    def rows(self, config) -> Dict[PeriodKey, dict]:
+        """(종목, 주기, 시작, 끝) 별 저장된 행 (현재 코드 버전)"""
+        frame = self.periods_frame(config)
+        return {(row['ticker'], row['interval'], row['period_start'], row['period_end']): row
+                for row in frame.to_dict('records')}
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self) -> 'ResultsStore':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def decode_equity(row: dict) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """저장된 행의 평가금액/보유 여부 배열"""
+    if row.get('equity') is None:
+        return None
+    equity = np.frombuffer(row['equity'], dtype=np.float64)
+    in_market = np.unpackbits(np.frombuffer(row['in_market'], dtype=np.uint8))[:len(equity)].astype(bool)
+    return equity, in_market
@@ -0,0 +1,217 @@
+# Standard library imports
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+# Third-party imports
+import pandas as pd
+import numpy as np
+
+# Local imports
+import main as bt
+import multi_ticker as mt
+import data_source as ds
+
+# === Constants ===
+# Robustness Configuration
+ROBUSTNESS_CONFIG = {
+    'PATHS': 1_000,
+    'METHOD': 'block',  # 'block': 블록 부트스트랩, 'month_shuffle': 월 순서 섞기
+    'BLOCK_SIZE': 24,  # 블록 부트스트랩 블록 길이 (봉 수)
+    'BATCH_SIZE': 250,  # 한 번에 벡터화 실행할 경로 수
+    'SEED': 0,
+    'PERCENTILES': [1, 5, 10, 25, 50, 75, 90, 95, 99]
+}
+
+RESAMPLING_METHODS = ['block', 'month_shuffle']
+
+
+class PathResampler:
+    """과거 OHLCV 에서 가상 가격 경로를 만드는 리샘플러
+
+    봉마다 (종가 로그 수익률, 직전 종가 대비 시가 로그 갭) 을 한 쌍으로 다시 뽑아 이어 붙인다.
+    block 은 BLOCK_SIZE 봉 단위로 복원 추출하고, month_shuffle 은 달력 월 단위 구간의 순서를 섞는다.
+    """
+
+    def __init__(self, data: pd.DataFrame, method: str = ROBUSTNESS_CONFIG['METHOD'],
+                 block_size: int = ROBUSTNESS_CONFIG['BLOCK_SIZE']):
+        if method not in RESAMPLING_METHODS:
+            raise ValueError(f"알 수 없는 리샘플링 방식입니다: {method}")
+        if len(data) < 2:
+            raise ValueError("리샘플링에는 2개 이상의 봉이 필요합니다")
+
+        self.method = method
+        self.block_size = max(1, min(block_size, len(data) - 1))
+        self.index = data.index
+        close = data['close'].to_numpy(dtype=np.float64)
+        open_price = data['open'].to_numpy(dtype=np.float64)
+        self.first_open = open_price[0]
+        self.first_close = close[0]
+        # 1번째 봉부터의 봉별 수익률 (0번째 봉은 모든 경로의 시작점)
+        self.close_returns = np.log(close[1:] / close[:-1])
+        self.open_gaps = np.log(open_price[1:] / close[:-1])
+
+        months = pd.DatetimeIndex(data.index[1:]).to_period('M')
+        boundaries = np.flatnonzero(months[1:] != months[:-1]) + 1
+        self._month_slices = np.split(np.arange(len(self.close_returns)), boundaries)
+
+    @property
+    def steps(self) -> int:
+        return len(self.close_returns)
+
+    def _block_indices(self, rng: np.random.Generator, paths: int) -> np.ndarray:
+        """(봉, 경로) 복원 추출 블록 인덱스"""
+        blocks = -(-self.steps // self.block_size)
+        starts = rng.integers(0, self.steps - self.block_size + 1, size=(blocks, paths))
+        offsets = np.arange(self.block_size)
+        indices = (starts[:, None, :] + offsets[None, :, None]).reshape(-1, paths)
+        return indices[:self.steps]
+
+    def _month_indices(self, rng: np.random.Generator, paths: int) -> np.ndarray:
+        """(봉, 경로) 월 순서 섞기 인덱스"""
+        indices = np.empty((self.steps, paths), dtype=np.int64)
+        for path in range(paths):
+            order = rng.permutation(len(self._month_slices))
+            indices[:, path] = np.concatenate([self._month_slices[month] for month in order])
+        return indices
+
+    def generate(self, rng: np.random.Generator, paths: int) -> Tuple[np.ndarray, np.ndarray]:
+        """(봉, 경로) 시가/종가 배열 생성 (첫 봉은 원래 값)"""
+        if self.method == 'block':
+            indices = self._block_indices(rng, paths)
+        else:
+            indices = self._month_indices(rng, paths)
+
+        close = np.empty((self.steps + 1, paths))
+        close[0] = self.first_close
+        close[1:] = self.first_close * np.exp(np.cumsum(self.close_returns[indices], axis=0))
+        open_price = np.empty_like(close)
+        open_price[0] = self.first_open
+        open_price[1:] = close[:-1] * np.exp(self.open_gaps[indices])
+        return open_price, close
+
+
+@dataclass
+class RobustnessResult:
+    """경로별 수익률 분포"""
+    method: str
+    trading_profit: np.ndarray
+    coin_change_rate: np.ndarray
+    trade_count: np.ndarray
+    historical: Optional[bt.PeriodResult] = None
+
+    def to_frame(self) -> pd.DataFrame:
+        """경로별 결과 DataFrame"""
+        return pd.DataFrame({
+            'trading_profit': self.trading_profit,
+            'coin_change_rate': self.coin_change_rate,
+            'trade_count': self.trade_count
+        }, index=pd.RangeIndex(len(self.trading_profit), name='path'))
+
+    def summary(self, percentiles: List[int] = ROBUSTNESS_CONFIG['PERCENTILES']) -> pd.DataFrame:
+        """수익률/코인 변동률/거래 횟수의 평균, 표준편차, 백분위"""
+        frame = self.to_frame()
+        rows = {
+            'mean': frame.mean(),
+            'std': frame.std(),
+            **{f"p{percentile}": frame.quantile(percentile / 100) for percentile in percentiles}
+        }
+        table = pd.DataFrame(rows).T
+        table.loc['loss_probability', 'trading_profit'] = float((self.trading_profit < 0).mean())
+        table.loc['beat_coin_probability', 'trading_profit'] = float(
+            (self.trading_profit > self.coin_change_rate).mean())
+        return table
+
+
+def run_batch(resampler: PathResampler, config: bt.TradingConfig,
+              seed: np.random.SeedSequence, paths: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """경로 묶음 하나를 생성해 MultiTickerBackTest 로 한 번에 실행"""
+    rng = np.random.default_rng(seed)
+    open_price, close = resampler.generate(rng, paths)
+    panel = mt.MultiTickerPanel.from_arrays(resampler.index, [f"path{path}" for path in range(paths)],
+                                            open_price, close, config.SMA_WINDOW)
+    result = mt.MultiTickerBackTest(config).run(panel)
+    initial_balance = float(config.INITIAL_BALANCE)
+    profit = (result.final_balance - initial_balance) * 100 / initial_balance
+    coin_change = (close[-1] - close[0]) * 100 / close[0]
+    return profit, coin_change, result.trade_count
+
+
+# 작업 프로세스별 리샘플러와 설정 (초기화 시 한 번만 전달)
+_worker_resampler: Optional[PathResampler] = None
+_worker_config: Optional[bt.TradingConfig] = None
+
+
+def _init_worker(resampler: PathResampler, config: bt.TradingConfig) -> None:
+    global _worker_resampler, _worker_config
+    _worker_resampler, _worker_config = resampler, config
+
+
+def _run_worker_batch(seed: np.random.SeedSequence, paths: int):
+    return run_batch(_worker_resampler, _worker_config, seed, paths)
+
+
+def run_robustness(data: pd.DataFrame, config: Optional[bt.TradingConfig] = None,
+                   paths: int = ROBUSTNESS_CONFIG['PATHS'],
+                   method: str = ROBUSTNESS_CONFIG['METHOD'],
+                   block_size: int = ROBUSTNESS_CONFIG['BLOCK_SIZE'],
+                   batch_size: int = ROBUSTNESS_CONFIG['BATCH_SIZE'],
+                   seed: int = ROBUSTNESS_CONFIG['SEED'],
+                   max_workers: Optional[int] = 1) -> RobustnessResult:
+    """과거 데이터를 리샘플링한 여러 경로에서 전략을 실행해 수익률 분포 계산
+
+    경로는 batch_size 개씩 (봉 x 경로) 배열로 만들어 벡터화 실행하며,
+    max_workers 가 1 이 아니면 묶음을 프로세스 풀에서 나누어 실행한다.
+    묶음마다 SeedSequence 를 나누어 쓰므로 작업 프로세스 수와 관계없이 같은 결과가 나온다.
+    """
+    config = config or bt.TradingConfig()
+    resampler = PathResampler(data, method, block_size)
+    batches = [min(batch_size, paths - offset) for offset in range(0, paths, batch_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(batches))
+    start_time = datetime.now()
+
+    if max_workers == 1 or len(batches) <= 1:
+        outputs = [run_batch(resampler, config, batch_seed, batch_paths)
+                   for batch_seed, batch_paths in zip(seeds, batches)]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                 initargs=(resampler, config)) as executor:
+            outputs = list(executor.map(_run_worker_batch, seeds, batches))
+
+    # 원래 경로 결과도 함께 기록
+    historical = mt.MultiTickerBackTest(config).run(mt.MultiTickerPanel.from_arrays(
+        data.index, ['historical'], data[['open']].to_numpy(dtype=np.float64),
+        data[['close']].to_numpy(dtype=np.float64), config.SMA_WINDOW)).results['historical']
+
+    logging.info(f"강건성 분석 완료: {paths}개 경로 x {len(data)}개 봉 "
+                 f"(소요시간: {datetime.now() - start_time})")
+    return RobustnessResult(
+        method=method,
+        trading_profit=np.concatenate([output[0] for output in outputs]) if outputs else np.zeros(0),
+        coin_change_rate=np.concatenate([output[1] for output in outputs]) if outputs else np.zeros(0),
+        trade_count=np.concatenate([output[2] for output in outputs]) if outputs else np.zeros(0, dtype=np.int64),
+        historical=historical
+    )
+
+
+def main():
+    """캐시된 OHLCV 로 강건성 분석 예시"""
+    bt.setup_logging()
+    ticker = bt.TRADING_CONFIG['tickers'][0]
+    interval = bt.TRADING_CONFIG['time_intervals'][0]
+    periods = bt.get_selected_periods(bt.TRADING_CONFIG)
+    data = ds.UpbitDataSource().get_ohlcv(ticker, interval,
+                                          min(period.start for period in periods),
+                                          max(period.end for period in periods))
+
+    for method in RESAMPLING_METHODS:
+        result = run_robustness(data, method=method, max_workers=bt.TRADING_CONFIG['max_workers'])
+        logging.info(f"\n[{ticker} {interval}분 - {method}] 원래 경로 수익률: "
+                     f"{result.historical.trading_profit:+.2f}%")
+        logging.info(result.summary().to_string(float_format=lambda value: f"{value:,.2f}"))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,59 +1,131 @@
+import numpy as np
 import pandas as pd
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 
-import talib as ta
+import indicator_cache as ic
+
+# talib 과 plotly 는 import 가 느리므로 실제로 쓸 때 불러옴
+# (지표 캐시 적중 + 차트 없는 백테스트와 작업 프로세스 시작 시간 단축)
+
+STOCH_RSI_PARAMS = {'rsi_period': 14, 'stoch_period': 14, 'smooth_period': 3}
+CHART_MAX_POINTS = 2000  # 차트에 그리는 최대 봉/점 수 (넘으면 구간별로 줄여서 표시)
 
 def get_stoch_rsi(data):
+	import talib as ta
 	close = data['close']
-	rsi = ta.RSI(close, timeperiod=14)
-	sto_k, sto_d = ta.STOCH(rsi,rsi,rsi,14)
+	rsi = ta.RSI(close, timeperiod=STOCH_RSI_PARAMS['rsi_period'])
+	sto_k, sto_d = ta.STOCH(rsi,rsi,rsi,STOCH_RSI_PARAMS['stoch_period'])
 
-	k = ta.SMA(sto_k, 3)
-	d = ta.SMA(k, 3)
+	k = ta.SMA(sto_k, STOCH_RSI_PARAMS['smooth_period'])
+	d = ta.SMA(k, STOCH_RSI_PARAMS['smooth_period'])
 	return k,d
 
-def display_rsi(data):
-	time = data.index
-	fig = make_subplots(
-		rows=2, cols=1, shared_xaxes=True, vertical_spacing=0.02,
-		row_heights=[0.7, 0.3] ,
-	)
-	fig.add_candlestick(x=time,
-	                open=data['open'], high=data['high'],
-	                low=data['low'], close=data['close'], row=1,col=1)
-	k, d = get_stoch_rsi(data)
-
-	buy = data['buy_order']
-	df = pd.DataFrame({'buy':buy})
-	df.drop(df[df['buy'] < 0].index, inplace=True)
-	fig.add_trace(go.Scatter(x=df.index ,
-							 y = df['buy'],
-							 mode = "markers",
-							 marker_symbol = "diamond-dot",
-							 marker_size = 13,
-							 marker_line_width = 2,
-							 marker_line_color = "rgba(0,0,0,0.7)",
-							 marker_color = "rgba(0,255,0,0.7)",
-							 name = "Entries"),
-				  row=1, col=1)
+def get_cached_stoch_rsi(data, ticker='', interval='', cache=None):
+	# 같은 종가 데이터의 Stoch RSI 는 지표 캐시에서 재사용 (K/D 배열 반환)
+	cache = cache or ic.get_default_cache()
+	values = cache.get_or_compute('stoch_rsi', STOCH_RSI_PARAMS, data, ['close'],
+		lambda: dict(zip(('k', 'd'), get_stoch_rsi(data))), ticker, interval)
+	return values['k'], values['d']
 
-	sell = data['sell_order']
-	df = pd.DataFrame({'sell':sell})
-	df.drop(df[df['sell'] < 0].index, inplace=True)
-	fig.add_trace(go.Scatter(x=df.index ,
-							 y = df['sell'],
+def _bucket_size(n, max_points):
+	return max(1, -(-n // max(1, max_points)))
+
+def downsample_ohlc(data, max_points=CHART_MAX_POINTS):
+	# 연속된 봉을 묶어 시가/고가/저가/종가 유지 (묶음의 첫 시각을 인덱스로 사용)
+	n = len(data)
+	size = _bucket_size(n, max_points)
+	if size == 1:
+		return data[['open', 'high', 'low', 'close']]
+	first = np.arange(0, n, size)
+	last = np.append(first[1:] - 1, n - 1)
+	return pd.DataFrame({
+		'open': data['open'].to_numpy(dtype=np.float64)[first],
+		'high': np.fmax.reduceat(data['high'].to_numpy(dtype=np.float64), first),
+		'low': np.fmin.reduceat(data['low'].to_numpy(dtype=np.float64), first),
+		'close': data['close'].to_numpy(dtype=np.float64)[last],
+	}, index=data.index[first])
+
+def minmax_indices(values, max_points=CHART_MAX_POINTS):
+	# 구간마다 최솟값/최댓값 위치만 남김 (선의 모양과 극값 유지, 결측 구간은 그대로 끊김)
+	values = np.asarray(values, dtype=np.float64)
+	n = len(values)
+	size = _bucket_size(n, max_points // 2)
+	if size == 1:
+		return np.arange(n)
+	buckets = -(-n // size)
+	rows = np.full(buckets * size, np.nan)
+	rows[:n] = values
+	rows = rows.reshape(buckets, size)
+	offsets = np.arange(buckets) * size
+	missing = np.isnan(rows)
+	high = np.argmax(np.where(missing, -np.inf, rows), axis=1) + offsets
+	low = np.argmin(np.where(missing, np.inf, rows), axis=1) + offsets
+	indices = np.unique(np.concatenate((low, high)))
+	return indices[indices < n]
+
+def _plotly():
+	import plotly.graph_objects as go
+	from plotly.subplots import make_subplots
+	return go, make_subplots
+
+def _add_line(fig, time, values, name, max_points):
+	go, _ = _plotly()
+	values = np.asarray(values, dtype=np.float64)
+	indices = minmax_indices(values, max_points)
+	fig.add_trace(go.Scattergl(x=time[indices], y=values[indices], mode="lines", name=name), row=2, col=1)
+
+def _add_markers(fig, data, column, color, name):
+	# 주문이 없는 봉은 -1 이므로 0 이상인 봉만 표시
+	if column not in data.columns:
+		return
+	go, _ = _plotly()
+	orders = data[column].to_numpy(dtype=np.float64)
+	mask = orders >= 0
+	fig.add_trace(go.Scattergl(x=data.index[mask],
+							 y = orders[mask],
 							 mode = "markers",
 							 marker_symbol = "diamond-dot",
 							 marker_size = 13,
 							 marker_line_width = 2,
 							 marker_line_color = "rgba(0,0,0,0.7)",
-							 marker_color = "rgba(255,0,0,0.7)",
-							 name = "Exits"),
+							 marker_color = color,
+							 name = name),
 				  row=1, col=1)
-	fig.add_trace(go.Scatter(x=time, y=k, name = "Stoch_K"), row=2, col=1)
-	fig.add_trace(go.Scatter(x=time, y=d, name = "Stoch_D"), row=2, col=1)
+
+def make_rsi_figure(data, max_points=CHART_MAX_POINTS):
+	_, make_subplots = _plotly()
+	time = data.index
+	fig = make_subplots(
+		rows=2, cols=1, shared_xaxes=True, vertical_spacing=0.02,
+		row_heights=[0.7, 0.3] ,
+	)
+	candles = downsample_ohlc(data, max_points)
+	fig.add_candlestick(x=candles.index,
+	                open=candles['open'], high=candles['high'],
+	                low=candles['low'], close=candles['close'], row=1,col=1)
+	# 지표가 이미 계산된 데이터는 그대로 사용
+	if 'rsi_k' in data.columns and 'rsi_d' in data.columns:
+		k, d = data['rsi_k'], data['rsi_d']
+	else:
+		k, d = get_cached_stoch_rsi(data)
+
+	# 매수/매도 표시는 모두 그림 (봉 수보다 훨씬 적음)
+	_add_markers(fig, data, 'buy_order', "rgba(0,255,0,0.7)", "Entries")
+	_add_markers(fig, data, 'sell_order', "rgba(255,0,0,0.7)", "Exits")
+	_add_line(fig, time, k, "Stoch_K", max_points)
+	_add_line(fig, time, d, "Stoch_D", max_points)
 	fig.add_hline(y=80, row=2, col=1)
 	fig.add_hline(y=20, row=2, col=1)
 	fig.update_layout(xaxis_rangeslider_visible=False)
-	fig.show()
+	return fig
+
+def display_rsi(data, path=None, max_points=CHART_MAX_POINTS):
+	# path 가 없으면 브라우저로 표시, '.html' 이면 plotly.js 를 포함한 파일로 저장 (오프라인 열람 가능)
+	# 그 밖의 확장자(.png 등)는 이미지로 저장 (kaleido 필요)
+	fig = make_rsi_figure(data, max_points)
+	if path is None:
+		fig.show()
+	elif path.endswith('.html'):
+		fig.write_html(path, include_plotlyjs=True)
+	else:
+		fig.write_image(path)
+	return fig
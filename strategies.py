@@ -0,0 +1,82 @@
+# Standard library imports
+from dataclasses import dataclass
+from typing import Dict, Type, Union
+
+# Third-party imports
+import pandas as pd
+import numpy as np
+
+
+@dataclass
+class Signals:
+    """봉별 진입/청산 신호 (봉 수 길이의 bool 배열)
+
+    같은 봉에 둘 다 있으면 진입 신호만 사용한다.
+    """
+    entries: np.ndarray
+    exits: np.ndarray
+
+    def __post_init__(self):
+        self.entries = np.asarray(self.entries, dtype=bool)
+        self.exits = np.asarray(self.exits, dtype=bool) & ~self.entries
+
+    @property
+    def active_bars(self) -> np.ndarray:
+        """신호가 있는 봉 인덱스"""
+        return np.flatnonzero(self.entries | self.exits)
+
+
+class Strategy:
+    """벡터화 전략 인터페이스
+
+    signals() 가 준비된 데이터 전체의 진입/청산 배열을 한 번에 만들면, BackTest 는 신호가 있는 봉만 방문해
+    포지션과 수수료를 계산한다 (진입: 잔고 전액 매수, 청산: 보유 수량 전량 매도).
+    confirm_entry/confirm_exit 는 매수/매도가 가능한 신호 봉에서만 호출되며,
+    추적 최저/최고가처럼 포지션에 따라 달라지는 조건을 확인할 때 재정의한다.
+    """
+    name = ''
+    vectorized = True
+
+    def signals(self, data: pd.DataFrame, config) -> Signals:
+        raise NotImplementedError
+
+    def confirm_entry(self, back_tester, data: pd.DataFrame, index: int, price) -> bool:
+        return True
+
+    def confirm_exit(self, back_tester, data: pd.DataFrame, index: int, price) -> bool:
+        return True
+
+
+class BarStrategy:
+    """봉 단위 콜백 전략 인터페이스 (모든 봉에서 상태를 갱신해야 하는 경로 의존 전략용)
+
+    on_bar 에서 back_tester.execute_buy / execute_sell 을 호출하며, 주문이 없는 봉은 BackTest 가 기록한다.
+    """
+    name = ''
+    vectorized = False
+
+    def prepare(self, back_tester, data: pd.DataFrame) -> None:
+        """실행 전 한 번 호출 (봉마다 쓸 배열 준비)"""
+
+    def on_bar(self, back_tester, data: pd.DataFrame, index: int, price, timestamp) -> None:
+        raise NotImplementedError
+
+
+AnyStrategy = Union[Strategy, BarStrategy]
+
+STRATEGIES: Dict[str, Type] = {}
+
+
+def register_strategy(cls: Type) -> Type:
+    """cls.name 으로 전략 등록 (클래스 데코레이터)"""
+    if not cls.name:
+        raise ValueError(f"전략 이름이 없습니다: {cls.__name__}")
+    STRATEGIES[cls.name] = cls
+    return cls
+
+
+def create_strategy(name: str) -> AnyStrategy:
+    """이름으로 전략 생성 (TradingConfig.STRATEGY)"""
+    if name not in STRATEGIES:
+        raise ValueError(f"알 수 없는 전략입니다: {name} ({', '.join(sorted(STRATEGIES))})")
+    return STRATEGIES[name]()
@@ -0,0 +1,211 @@
+# Standard library imports
+import math
+from collections import deque
+from typing import Dict, Optional
+
+# === Constants ===
+RSI_PERIOD = 14
+STOCH_FASTK_PERIOD = 14
+STOCH_SLOWK_PERIOD = 3
+STOCH_SLOWD_PERIOD = 3
+STOCH_SMOOTH_PERIOD = 3  # get_stoch_rsi 의 K/D 추가 평활
+SMA_WINDOW = 14
+
+NAN = float('nan')
+
+
+def _is_zero(value: float) -> bool:
+    """TA-Lib TA_IS_ZERO 와 같은 0 판정"""
+    return -0.00000001 < value < 0.00000001
+
+
+class StreamingSMA:
+    """증분 단순 이동평균
+
+    TA-Lib SMA 와 같은 순서로 누적 합을 더하고 빼므로 배치 계산과 같은 값을 낸다.
+    """
+
+    def __init__(self, period: int):
+        self.period = period
+        self._total = 0.0
+        self._window: deque = deque()
+
+    def update(self, value: float) -> float:
+        """새 값을 반영하고 평균 반환 (기간이 차기 전에는 NaN)"""
+        self._total += value
+        self._window.append(value)
+        if len(self._window) < self.period:
+            return NAN
+        average = self._total / self.period
+        self._total -= self._window.popleft()
+        return average
+
+    def snapshot(self) -> Dict:
+        """상태 저장"""
+        return {'total': self._total, 'window': list(self._window)}
+
+    def restore(self, state: Dict) -> None:
+        """저장된 상태 복원"""
+        self._total = state['total']
+        self._window = deque(state['window'])
+
+
+class StreamingRSI:
+    """증분 RSI (TA-Lib RSI 의 Wilder 평활과 동일)"""
+
+    def __init__(self, period: int = RSI_PERIOD):
+        self.period = period
+        self._previous: Optional[float] = None
+        self._count = 0
+        self._gain = 0.0
+        self._loss = 0.0
+
+    def _value(self) -> float:
+        total = self._gain + self._loss
+        return 100.0 * (self._gain / total) if not _is_zero(total) else 0.0
+
+    def update(self, value: float) -> float:
+        """종가를 반영하고 RSI 반환 (기간이 차기 전에는 NaN)"""
+        if self._previous is None:
+            # TA-Lib 처럼 앞쪽 결측치는 건너뜀
+            if not math.isnan(value):
+                self._previous = value
+            return NAN
+
+        change = value - self._previous
+        self._previous = value
+        self._count += 1
+
+        if self._count <= self.period:
+            if change < 0:
+                self._loss -= change
+            else:
+                self._gain += change
+            if self._count < self.period:
+                return NAN
+            self._loss /= self.period
+            self._gain /= self.period
+            return self._value()
+
+        self._loss *= (self.period - 1)
+        self._gain *= (self.period - 1)
+        if change < 0:
+            self._loss -= change
+        else:
+            self._gain += change
+        self._loss /= self.period
+        self._gain /= self.period
+        return self._value()
+
+    def snapshot(self) -> Dict:
+        return {'previous': self._previous, 'count': self._count,
+                'gain': self._gain, 'loss': self._loss}
+
+    def restore(self, state: Dict) -> None:
+        self._previous = state['previous']
+        self._count = state['count']
+        self._gain = state['gain']
+        self._loss = state['loss']
+
+
+class StreamingStochRSI:
+    """증분 Stoch RSI (rsi_sample.get_stoch_rsi 와 같은 K/D)
+
+    RSI -> STOCH(fastK 14, slowK SMA 3, slowD SMA 3) 의 slowK -> SMA 3 (K) -> SMA 3 (D) 순서로 계산한다.
+    """
+
+    def __init__(self, rsi_period: int = RSI_PERIOD,
+                 fastk_period: int = STOCH_FASTK_PERIOD,
+                 slowk_period: int = STOCH_SLOWK_PERIOD,
+                 slowd_period: int = STOCH_SLOWD_PERIOD,
+                 smooth_period: int = STOCH_SMOOTH_PERIOD):
+        self.fastk_period = fastk_period
+        self.slowd_period = slowd_period
+        self.rsi = StreamingRSI(rsi_period)
+        self._rsi_window: deque = deque(maxlen=fastk_period)
+        self._slowk = StreamingSMA(slowk_period)
+        self._slowk_count = 0
+        self._k = StreamingSMA(smooth_period)
+        self._d = StreamingSMA(smooth_period)
+
+    def update(self, close: float) -> Dict[str, float]:
+        """종가를 반영하고 {'rsi', 'rsi_k', 'rsi_d'} 반환"""
+        rsi = self.rsi.update(close)
+        result = {'rsi': rsi, 'rsi_k': NAN, 'rsi_d': NAN}
+        if math.isnan(rsi):
+            return result
+
+        self._rsi_window.append(rsi)
+        if len(self._rsi_window) < self.fastk_period:
+            return result
+
+        # TA-Lib STOCH 의 fastK 계산식
+        lowest = min(self._rsi_window)
+        highest = max(self._rsi_window)
+        diff = (highest - lowest) / 100.0
+        fastk = (rsi - lowest) / diff if diff != 0.0 else 0.0
+
+        slowk = self._slowk.update(fastk)
+        if math.isnan(slowk):
+            return result
+
+        # STOCH 는 slowD 까지 계산 가능한 시점부터 slowK 를 출력
+        self._slowk_count += 1
+        if self._slowk_count < self.slowd_period:
+            return result
+
+        k = self._k.update(slowk)
+        if math.isnan(k):
+            return result
+        result['rsi_k'] = k
+        result['rsi_d'] = self._d.update(k)
+        return result
+
+    def snapshot(self) -> Dict:
+        return {
+            'rsi': self.rsi.snapshot(),
+            'rsi_window': list(self._rsi_window),
+            'slowk': self._slowk.snapshot(),
+            'slowk_count': self._slowk_count,
+            'k': self._k.snapshot(),
+            'd': self._d.snapshot()
+        }
+
+    def restore(self, state: Dict) -> None:
+        self.rsi.restore(state['rsi'])
+        self._rsi_window = deque(state['rsi_window'], maxlen=self.fastk_period)
+        self._slowk.restore(state['slowk'])
+        self._slowk_count = state['slowk_count']
+        self._k.restore(state['k'])
+        self._d.restore(state['d'])
+
+
+class StreamingIndicators:
+    """봉 하나씩 받아 tick_db.add_indicators 와 같은 컬럼을 계산하는 증분 지표 묶음
+
+    봉마다 O(1) 로 sma, signal, rsi_k, rsi_d 를 갱신하므로 실시간 시세에 사용할 수 있다.
+    snapshot()/restore() 로 상태를 저장하고 이어서 계산할 수 있다.
+    """
+
+    def __init__(self, sma_window: int = SMA_WINDOW):
+        self.sma = StreamingSMA(sma_window)
+        self.stoch_rsi = StreamingStochRSI()
+
+    def update(self, open_price: float, close: float) -> Dict[str, float]:
+        """봉 반영 후 {'sma', 'signal', 'rsi_k', 'rsi_d'} 반환"""
+        sma = self.sma.update(open_price)
+        stoch = self.stoch_rsi.update(close)
+        return {
+            'sma': sma,
+            # np.where(open > sma, 1, -1) 과 같이 NaN 이면 -1
+            'signal': 1 if open_price > sma else -1,
+            'rsi_k': stoch['rsi_k'],
+            'rsi_d': stoch['rsi_d']
+        }
+
+    def snapshot(self) -> Dict:
+        return {'sma': self.sma.snapshot(), 'stoch_rsi': self.stoch_rsi.snapshot()}
+
+    def restore(self, state: Dict) -> None:
+        self.sma.restore(state['sma'])
+        self.stoch_rsi.restore(state['stoch_rsi'])
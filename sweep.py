@@ -0,0 +1,155 @@
+# Standard library imports
+import itertools
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, replace
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+# Third-party imports
+import pandas as pd
+
+# Local imports
+import main as bt
+import fills as fl
+import tick_db as db
+import data_source as ds
+from ohlcv_cache import OHLCV_COLUMNS
+
+
+class SweepDataset:
+    """스윕 전체가 공유하는 데이터와 지표
+
+    Stoch RSI 와 엘리어트 파동 분석은 설정값과 무관하므로 한 번만 계산하고,
+    SMA/signal 은 SMA_WINDOW 값마다 한 번씩만 계산해 재사용한다.
+    하위 봉 체결 모델(FILL_MODEL)용 1분 하위 봉도 source 에서 처음 필요할 때 한 번만 조회한다.
+    """
+
+    def __init__(self, data: pd.DataFrame, ticker: str = '', interval: str = '',
+                 source: Optional[ds.DataSource] = None):
+        self.ticker = ticker
+        self.interval = interval
+        self.source = source
+        self._sub_bars: Optional[fl.SubBarIndex] = None
+
+        base = data[OHLCV_COLUMNS].copy()
+        db.add_stoch_rsi(base, ticker, interval)
+        elliott = bt.precompute_elliott_analysis(base, ticker=ticker, interval=interval)
+        for column in bt.ELLIOTT_SIGNAL_COLUMNS:
+            base[column] = elliott[column]
+        self.base = base
+        self._frames: Dict[int, pd.DataFrame] = {}
+
+    @classmethod
+    def load(cls, source: ds.DataSource, ticker: str, interval: str,
+             start: datetime, end: datetime) -> 'SweepDataset':
+        """데이터 제공자에서 한 번 조회해 데이터셋 생성"""
+        return cls(source.get_ohlcv(ticker, interval, start, end), ticker, interval, source)
+
+    @property
+    def start(self) -> datetime:
+        return self.base.index[0] if len(self.base) else None
+
+    @property
+    def end(self) -> datetime:
+        return self.base.index[-1] if len(self.base) else None
+
+    def frame(self, sma_window: int) -> pd.DataFrame:
+        """SMA_WINDOW 에 해당하는 지표 데이터 (컬럼만 추가한 얕은 복사본)"""
+        if sma_window not in self._frames:
+            frame = self.base.copy(deep=False)
+            db.add_sma_signal(frame, sma_window, self.ticker, self.interval)
+            self._frames[sma_window] = frame
+        return self._frames[sma_window]
+
+    def sub_bars(self) -> fl.SubBarIndex:
+        """데이터셋 전체 체결 구간을 덮는 하위 봉 인덱스 (처음 요청될 때 한 번만 조회)"""
+        if self._sub_bars is None:
+            if self.source is None:
+                raise ValueError(f"하위 봉을 조회할 데이터 제공자가 없습니다: {self.ticker} {self.interval}")
+            self._sub_bars = fl.load_sub_bars(self.source, self.ticker, self.base.index, self.interval)
+        return self._sub_bars
+
+    def preload_sub_bars(self, configs: Iterable[bt.TradingConfig]) -> None:
+        """하위 봉 체결 설정이 있으면 작업 프로세스에 넘기기 전에 하위 봉을 미리 조회"""
+        if len(self.base) and any(config.FILL_MODEL != 'close' for config in configs):
+            self.sub_bars()
+
+    def back_tester(self, config: bt.TradingConfig) -> bt.BackTest:
+        """데이터셋의 데이터 제공자와 하위 봉을 공유하는 BackTest"""
+        sub_bars = self.sub_bars() if config.FILL_MODEL != 'close' and len(self.base) else None
+        return bt.BackTest(config, self.source, sub_bars=sub_bars)
+
+
+def make_config_grid(base: Optional[bt.TradingConfig] = None, **grid: Iterable) -> List[bt.TradingConfig]:
+    """TradingConfig 필드별 후보값의 모든 조합 생성
+
+    예: make_config_grid(RSI_OVERSOLD=[20, 30], SMA_WINDOW=[10, 14, 20])
+    """
+    base = base or bt.TradingConfig()
+    names = list(grid)
+    return [replace(base, **dict(zip(names, values)))
+            for values in itertools.product(*(list(grid[name]) for name in names))]
+
+
+def run_config(dataset: SweepDataset, config: bt.TradingConfig,
+               start: Optional[datetime] = None, end: Optional[datetime] = None) -> Dict:
+    """단일 설정 실행 후 결과 행 반환 (start/end 를 주면 해당 구간만 실행)"""
+    back_tester = dataset.back_tester(config)
+    frame = dataset.frame(config.SMA_WINDOW)
+    start = dataset.start if start is None else start
+    end = dataset.end if end is None else end
+    if start != dataset.start or end != dataset.end:
+        frame = ds.slice_range(frame, start, end)
+    result = back_tester.run_prepared(frame, dataset.ticker, dataset.interval, start, end)
+    row = asdict(config)
+    row.update({
+        'trading_profit': result.trading_profit,
+        'coin_change_rate': result.coin_change_rate,
+        'trade_count': back_tester.state.trade_count,
+        'total_fee': back_tester.ledger.to_float(back_tester.state.total_fee)
+    })
+    return row
+
+
+# 작업 프로세스별 데이터셋 (초기화 시 한 번만 전달)
+_worker_dataset: Optional[SweepDataset] = None
+
+
+def _init_worker(dataset: SweepDataset) -> None:
+    global _worker_dataset
+    _worker_dataset = dataset
+
+
+def _run_worker_config(config: bt.TradingConfig) -> Dict:
+    return run_config(_worker_dataset, config)
+
+
+def run_sweep(dataset: SweepDataset, configs: Iterable[bt.TradingConfig],
+              max_workers: Optional[int] = 1, rank_by: str = 'trading_profit') -> pd.DataFrame:
+    """여러 TradingConfig 를 같은 데이터셋으로 실행하고 순위표 반환
+
+    max_workers 가 1 이 아니면 프로세스 풀을 사용하며,
+    데이터셋은 작업 프로세스마다 한 번만 전달된다.
+    """
+    configs = list(configs)
+    start_time = datetime.now()
+    dataset.preload_sub_bars(configs)
+
+    if max_workers == 1:
+        rows = [run_config(dataset, config) for config in configs]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                 initargs=(dataset,)) as executor:
+            chunksize = max(1, len(configs) // ((max_workers or os.cpu_count() or 1) * 8))
+            rows = list(executor.map(_run_worker_config, configs, chunksize=chunksize))
+
+    logging.info(f"스윕 완료: {len(configs)}개 설정 (소요시간: {datetime.now() - start_time})")
+
+    table = pd.DataFrame(rows)
+    if table.empty:
+        return table
+    table = table.sort_values(rank_by, ascending=False, kind='stable').reset_index(drop=True)
+    table.index.name = 'rank'
+    return table
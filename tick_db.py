@@ -1,22 +1,38 @@
-import pyupbit as up
 import rsi_sample as rsi
 import numpy as np
+import data_source as ds
+import indicator_cache as ic
 
-def make_tick_db(start, end, ticker, time):
-	minute = 'minute'
-	range = minute+str(time)
-	data = up.get_ohlcv_from(ticker,range,start,end)
-
+def add_sma_signal(data, window=14, ticker='', interval='', cache=None):
 	# data.index.name = "date"
-	# 단순 이동평균을 사용하여 추세 파악
-	window = 14
-	data['sma'] = data['open'].rolling(window=window).mean()
-	data['signal'] = np.where(data['open'] > data['sma'], 1, -1)
+	# 단순 이동평균을 사용하여 추세 파악 (같은 시가 데이터는 지표 캐시에서 재사용)
+	cache = cache or ic.get_default_cache()
+	values = cache.get_or_compute('sma_signal', {'window': window}, data, ['open'],
+		lambda: _compute_sma_signal(data, window), ticker, interval)
+	data['sma'] = values['sma']
+	data['signal'] = values['signal']
+	return data
+
+def _compute_sma_signal(data, window):
+	sma = data['open'].rolling(window=window).mean()
+	return {'sma': sma, 'signal': np.where(data['open'] > sma, 1, -1)}
 
-	k, d = rsi.get_stoch_rsi(data)
+def add_stoch_rsi(data, ticker='', interval='', cache=None):
+	k, d = rsi.get_cached_stoch_rsi(data, ticker, interval, cache)
 	data.loc[:,'rsi_k'] = k
 	data.loc[:,'rsi_d'] = d
 	return data
 
+def add_indicators(data, window=14, ticker='', interval='', cache=None):
+	add_sma_signal(data, window, ticker, interval, cache)
+	add_stoch_rsi(data, ticker, interval, cache)
+	return data
+
+def make_tick_db(start, end, ticker, time, source=None, window=14):
+	# 기본 제공자는 로컬 캐시를 거쳐 pyupbit 로 조회
+	source = source or ds.UpbitDataSource()
+	data = source.get_ohlcv(ticker,str(time),start,end)
+	return add_indicators(data, window, ticker, str(time))
+
 if __name__ == '__main__':
 	make_tick_db('2022-08-01 14:00:00', '2022-08-02 16:00:00','KRW-BTC',15)
@@ -0,0 +1,193 @@
+# Standard library imports
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+# Third-party imports
+import pandas as pd
+
+# Local imports
+import main as bt
+import sweep as sw
+import data_source as ds
+
+# === Constants ===
+# Walk-Forward Configuration
+WALK_FORWARD_CONFIG = {
+    'TRAIN_PERIODS': 3,  # 학습 구간 기간 수 (get_selected_periods 단위, 기본 월)
+    'TEST_PERIODS': 1,  # 검증 구간 기간 수
+    'RANK_BY': 'trading_profit'
+}
+
+
+@dataclass
+class WalkForwardFold:
+    """학습 구간과 그 다음 검증 구간"""
+    index: int
+    train_periods: List[bt.TradingPeriod]
+    test_periods: List[bt.TradingPeriod]
+
+    @property
+    def train_start(self) -> datetime:
+        return self.train_periods[0].start
+
+    @property
+    def train_end(self) -> datetime:
+        return self.train_periods[-1].end
+
+
+@dataclass
+class FoldResult:
+    """구간별 선택된 설정과 검증 결과"""
+    fold: WalkForwardFold
+    config: bt.TradingConfig
+    train_score: float
+    test_results: List[bt.PeriodResult]
+
+
+@dataclass
+class WalkForwardResult:
+    """전체 워크포워드 결과"""
+    folds: List[FoldResult]
+
+    @property
+    def out_of_sample(self) -> List[Tuple[bt.TradingPeriod, bt.PeriodResult]]:
+        """검증 구간 결과를 시간 순서로 이어 붙인 목록"""
+        return [(period, result)
+                for fold in self.folds
+                for period, result in zip(fold.fold.test_periods, fold.test_results)]
+
+    def results_frame(self) -> pd.DataFrame:
+        """검증 구간별 결과 DataFrame"""
+        return pd.DataFrame([{
+            'fold': fold.fold.index,
+            'start': period.start,
+            'end': period.end,
+            'trading_profit': result.trading_profit,
+            'coin_change_rate': result.coin_change_rate,
+            'start_price': result.start_price,
+            'end_price': result.end_price
+        } for fold in self.folds for period, result in zip(fold.fold.test_periods, fold.test_results)])
+
+    def parameters_frame(self) -> pd.DataFrame:
+        """구간별 선택된 설정 DataFrame"""
+        return pd.DataFrame([{
+            'fold': fold.fold.index,
+            'train_start': fold.fold.train_start,
+            'train_end': fold.fold.train_end,
+            'train_score': fold.train_score,
+            **asdict(fold.config)
+        } for fold in self.folds]).set_index('fold')
+
+
+def make_folds(periods: List[bt.TradingPeriod],
+               train_periods: int = WALK_FORWARD_CONFIG['TRAIN_PERIODS'],
+               test_periods: int = WALK_FORWARD_CONFIG['TEST_PERIODS'],
+               step: Optional[int] = None) -> List[WalkForwardFold]:
+    """기간 목록을 학습/검증 구간으로 나눔 (step 만큼 이동, 기본은 검증 구간 길이)"""
+    periods = sorted(periods, key=lambda period: period.start)
+    step = step or test_periods
+    folds = []
+    for offset in range(0, len(periods) - train_periods - test_periods + 1, step):
+        folds.append(WalkForwardFold(
+            index=len(folds),
+            train_periods=periods[offset:offset + train_periods],
+            test_periods=periods[offset + train_periods:offset + train_periods + test_periods]
+        ))
+    return folds
+
+
+def run_fold(dataset: sw.SweepDataset, fold: WalkForwardFold,
+             configs: List[bt.TradingConfig],
+             rank_by: str = WALK_FORWARD_CONFIG['RANK_BY']) -> FoldResult:
+    """학습 구간에서 가장 좋은 설정을 고르고 검증 구간에 적용"""
+    best_config, best_score = None, None
+    for config in configs:
+        score = sw.run_config(dataset, config, fold.train_start, fold.train_end)[rank_by]
+        # 같은 점수면 먼저 나온 설정 유지 (run_sweep 의 안정 정렬과 같음)
+        if best_score is None or score > best_score:
+            best_config, best_score = config, score
+
+    test_results = []
+    for period in fold.test_periods:
+        back_tester = dataset.back_tester(best_config)
+        segment = ds.slice_range(dataset.frame(best_config.SMA_WINDOW), period.start, period.end)
+        test_results.append(back_tester.run_prepared(segment, dataset.ticker, dataset.interval,
+                                                     period.start, period.end))
+    return FoldResult(fold, best_config, best_score, test_results)
+
+
+# 작업 프로세스별 데이터셋과 설정 후보 (초기화 시 한 번만 전달)
+_worker_dataset: Optional[sw.SweepDataset] = None
+_worker_configs: List[bt.TradingConfig] = []
+
+
+def _init_worker(dataset: sw.SweepDataset, configs: List[bt.TradingConfig]) -> None:
+    global _worker_dataset, _worker_configs
+    _worker_dataset, _worker_configs = dataset, configs
+
+
+def _run_worker_fold(fold: WalkForwardFold, rank_by: str) -> FoldResult:
+    return run_fold(_worker_dataset, fold, _worker_configs, rank_by)
+
+
+def load_dataset(source: ds.DataSource, ticker: str, interval: str,
+                 periods: List[bt.TradingPeriod]) -> sw.SweepDataset:
+    """전체 기간을 한 번만 조회 (첫 기간 앞 WARMUP_BARS 개 봉 포함)"""
+    start = min(period.start for period in periods)
+    end = max(period.end for period in periods)
+    warmup_start = start - ds.interval_to_timedelta(interval) * bt.WARMUP_BARS
+    return sw.SweepDataset.load(source, ticker, interval, warmup_start, end)
+
+
+def run_walk_forward(dataset: sw.SweepDataset, periods: List[bt.TradingPeriod],
+                     configs: List[bt.TradingConfig],
+                     train_periods: int = WALK_FORWARD_CONFIG['TRAIN_PERIODS'],
+                     test_periods: int = WALK_FORWARD_CONFIG['TEST_PERIODS'],
+                     step: Optional[int] = None, max_workers: Optional[int] = 1,
+                     rank_by: str = WALK_FORWARD_CONFIG['RANK_BY']) -> WalkForwardResult:
+    """학습 구간 최적화 -> 다음 검증 구간 평가를 반복하는 워크포워드 실행
+
+    데이터와 지표는 dataset 에서 한 번만 계산해 모든 구간이 공유한다.
+    max_workers 가 1 이 아니면 구간(fold)을 프로세스 풀에서 동시에 실행한다.
+    """
+    folds = make_folds(periods, train_periods, test_periods, step)
+    configs = list(configs)
+    start_time = datetime.now()
+
+    dataset.preload_sub_bars(configs)
+
+    if max_workers == 1 or len(folds) <= 1:
+        fold_results = [run_fold(dataset, fold, configs, rank_by) for fold in folds]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                 initargs=(dataset, configs)) as executor:
+            fold_results = list(executor.map(_run_worker_fold, folds, [rank_by] * len(folds)))
+
+    logging.info(f"워크포워드 완료: {len(folds)}개 구간 x {len(configs)}개 설정 "
+                 f"(소요시간: {datetime.now() - start_time})")
+    return WalkForwardResult(fold_results)
+
+
+def main():
+    """TRADING_CONFIG 기간으로 워크포워드 실행 예시"""
+    bt.setup_logging()
+    periods = bt.get_selected_periods(bt.TRADING_CONFIG)
+    ticker = bt.TRADING_CONFIG['tickers'][0]
+    interval = bt.TRADING_CONFIG['time_intervals'][0]
+
+    dataset = load_dataset(ds.UpbitDataSource(), ticker, interval, periods)
+    configs = sw.make_config_grid(RSI_OVERSOLD=[20, 25, 30], RSI_OVERBOUGHT=[70, 75, 80],
+                                  SMA_WINDOW=[10, 14, 20])
+    result = run_walk_forward(dataset, periods, configs,
+                              max_workers=bt.TRADING_CONFIG['max_workers'])
+
+    logging.info(result.parameters_frame()[['train_start', 'train_end', 'train_score',
+                                            'RSI_OVERSOLD', 'RSI_OVERBOUGHT', 'SMA_WINDOW']].to_string())
+    logging.info(result.results_frame().to_string())
+
+
+if __name__ == '__main__':
+    main()